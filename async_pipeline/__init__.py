@@ -0,0 +1,27 @@
+"""Asyncio version of the run pipeline built on ``playwright.async_api``."""
+
+from .login import perform_login
+from .popups import process_popups_once
+from .navigation import navigate_sales_ratio
+from .extraction import run_category_pipeline
+from .runner import main, run, run_sales_analysis, run_store
+from .session import start_session
+from .orchestrator import load_stores, run_stores
+from .daemon import BrowserDaemon, run_daemon, submit
+
+__all__ = [
+    "perform_login",
+    "process_popups_once",
+    "navigate_sales_ratio",
+    "run_category_pipeline",
+    "main",
+    "run",
+    "run_sales_analysis",
+    "run_store",
+    "start_session",
+    "load_stores",
+    "run_stores",
+    "BrowserDaemon",
+    "run_daemon",
+    "submit",
+]
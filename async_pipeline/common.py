@@ -0,0 +1,67 @@
+"""Async counterparts of the page helpers in :mod:`utils.common`."""
+
+import asyncio
+import datetime
+import os
+
+from playwright.async_api import Page
+from utils import DEFAULT_WAIT_MS, log, popups_handled
+from utils.wait_engine import settle_async
+
+LOGOUT_KEYWORDS = ["종료 하시겠습니까", "로그아웃", "세션 종료"]
+
+
+async def wait(page: Page, ms: int = DEFAULT_WAIT_MS, step: str | None = None) -> None:
+    """Async :func:`utils.common.wait`."""
+    await settle_async(page, ms, step)
+
+
+def page_popups_handled(page: Page) -> bool:
+    """Return the popup state recorded on ``page``, else the global one.
+
+    The async pipeline records the result per page so that several stores
+    can run in one process without sharing the ``utils.common`` flag.
+    """
+    handled = getattr(page, "_popups_handled", None)
+    return popups_handled() if handled is None else handled
+
+
+def setup_dialog_handler(page: Page, auto_accept: bool = True) -> None:
+    """Register a dialog handler once; dialogs are handled without blocking."""
+    if getattr(page, "_dialog_handler_registered", False):
+        return
+
+    async def _handle(dialog) -> None:
+        try:
+            msg = dialog.message
+            if any(kw in msg for kw in LOGOUT_KEYWORDS):
+                await dialog.dismiss()
+                log(f"⚠️ 로그아웃 관련 다이얼로그 무시: {msg}")
+                return
+            if "차단되었습니다" in msg:
+                await dialog.dismiss()
+                log("❌ '추가 대화 차단' 다이얼로그 감지")
+                return
+            if auto_accept:
+                await dialog.accept()
+            else:
+                await dialog.dismiss()
+            log(f"자동 다이얼로그 처리: {msg}")
+        except Exception as e:
+            log(f"다이얼로그 처리 오류: {e}")
+
+    page.on("dialog", _handle)
+    setattr(page, "_dialog_handler_registered", True)
+
+
+async def handle_exception(page: Page, context: str, e: Exception) -> None:
+    """Log error reason and save screenshot for debugging."""
+    log(f"❌ 예외 발생 - {context}: {str(e)}")
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    await asyncio.to_thread(os.makedirs, "screenshots", exist_ok=True)
+    path = f"screenshots/error_{context}_{timestamp}.png"
+    try:
+        await page.screenshot(path=path)
+        log(f"🖼️ 스크린샷 저장됨: {path}")
+    except Exception as se:
+        log(f"스크린샷 저장 실패: {se}")
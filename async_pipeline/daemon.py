@@ -0,0 +1,350 @@
+"""Long-lived browser that keeps a logged-in, popup-cleared page warm.
+
+The daemon launches Chromium once with a persistent profile and a
+``--remote-debugging-port``, logs in (restoring the session cache when
+possible) and then waits for jobs. Jobs arrive as one JSON line per TCP
+connection on a local port (:func:`submit`) and run on the warm page, so
+they skip browser launch, login and popups. Other processes can also
+attach to the same context with ``connect_over_cdp`` (:func:`attached_page`).
+
+A health check runs every ``health_interval`` seconds while idle. It reloads
+the portal and logs in again when the session has expired, and relaunches
+the browser if it died.
+"""
+
+import asyncio
+import json
+import socket
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+from playwright.async_api import BrowserContext, Page, async_playwright
+from utils import RequestPolicy, SessionCache, log, reset_waits, wait_report
+from utils.popup_watch import watch_popups_async
+from utils.transaction_watch import watch_transactions_async
+from sales_analysis.category_pipeline import OUTPUT_DIR
+from sales_analysis.middle_category_product_extractor import ProductJsonSink
+from .common import setup_dialog_handler
+from .extraction import run_category_pipeline
+from .login import LOGIN_URL
+from .navigation import navigate_sales_ratio
+from .popups import process_popups_once
+from .runner import run_sales_analysis
+from .session import ensure_session, probe_session, session_expired_popup
+
+PROFILE_DIR = Path(__file__).resolve().parent.parent / "browser_profile"
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8790
+# launch_chrome_fullscreen 의 크롬이 9222 를 쓰므로 겹치지 않게 한다
+CDP_PORT = 9223
+HEALTH_INTERVAL = 60.0
+
+
+def daemon_options(cfg: dict) -> dict:
+    """Read ``runtime_config["daemon"]`` with the module defaults filled in."""
+    options = cfg.get("daemon", {})
+    return {
+        "host": options.get("host", DAEMON_HOST),
+        "port": options.get("port", DAEMON_PORT),
+        "cdp_port": options.get("cdp_port", CDP_PORT),
+        "health_interval": options.get("health_interval", HEALTH_INTERVAL),
+    }
+
+
+class BrowserDaemon:
+    """Warm browser context plus the job handlers that run on it.
+
+    Parameters
+    ----------
+    user_id, user_pw : str | None, optional
+        Portal account, defaulting to ``.env``.
+    url : str, optional
+        Portal login page.
+    cache : SessionCache | None, optional
+        Session cache used for (re)login.
+    headless : bool, optional
+        Run Chromium without a window.
+    cdp_port : int, optional
+        Remote debugging port for ``connect_over_cdp``.
+    health_interval : float, optional
+        Seconds between idle health checks.
+    profile_dir : Path, optional
+        Persistent Chromium profile (cookies and HTTP cache survive restarts).
+    policy : RequestPolicy | None, optional
+        Request blocking for the warm context, reported per job.
+    """
+
+    def __init__(
+        self,
+        user_id: str | None = None,
+        user_pw: str | None = None,
+        *,
+        url: str = LOGIN_URL,
+        cache: SessionCache | None = None,
+        headless: bool = True,
+        cdp_port: int = CDP_PORT,
+        health_interval: float = HEALTH_INTERVAL,
+        profile_dir: Path = PROFILE_DIR,
+        policy: RequestPolicy | None = None,
+    ):
+        self.user_id = user_id
+        self.user_pw = user_pw
+        self.url = url
+        self.cache = cache
+        self.headless = headless
+        self.cdp_port = cdp_port
+        self.health_interval = health_interval
+        self.profile_dir = profile_dir
+        self.policy = policy
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+        # 작업과 상태 점검이 같은 페이지를 동시에 건드리지 않게 한다
+        self.lock = asyncio.Lock()
+        self.stats = {"started": time.time(), "jobs": 0, "failed_jobs": 0, "relogins": 0, "relaunches": 0}
+        self._playwright = None
+        self._health_task: asyncio.Task | None = None
+
+    @property
+    def cdp_url(self) -> str:
+        return f"http://127.0.0.1:{self.cdp_port}"
+
+    async def start(self, playwright) -> None:
+        """Launch the browser and log in; raises if the first login fails."""
+        self._playwright = playwright
+        async with self.lock:
+            await self._launch()
+            if not await self._login():
+                raise RuntimeError("데몬 초기 로그인 실패")
+        log(f"🔥 브라우저 데몬 준비 완료 (CDP {self.cdp_url})")
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self.context is not None:
+            await self.context.close()
+            self.context = None
+
+    async def _launch(self) -> None:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self.context = await self._playwright.chromium.launch_persistent_context(
+            str(self.profile_dir),
+            headless=self.headless,
+            args=[f"--remote-debugging-port={self.cdp_port}"],
+        )
+        self.context.on("close", self._on_close)
+        if self.policy is not None:
+            await self.policy.install_async(self.context)
+        await watch_popups_async(self.context)
+        await watch_transactions_async(self.context)
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        setup_dialog_handler(self.page)
+
+    def _on_close(self, context: BrowserContext) -> None:
+        if context is self.context:
+            log("⚠️ 데몬 브라우저가 종료되었습니다")
+            self.context = None
+            self.page = None
+
+    async def _login(self) -> bool:
+        return await ensure_session(self.page, self.user_id, self.user_pw, url=self.url, cache=self.cache)
+
+    async def _alive(self) -> bool:
+        try:
+            return await self.page.locator("#topMenu").is_visible() and not await session_expired_popup(self.page)
+        except Exception:
+            return False
+
+    async def ensure_ready(self, *, full: bool = False) -> Page:
+        """Return the warm page, relaunching or logging in again if needed.
+
+        The quick check only looks at the current DOM; ``full`` reloads the
+        portal so that a session expired on the server side is noticed too.
+        Call with :attr:`lock` held.
+        """
+        if self.context is None:
+            self.stats["relaunches"] += 1
+            await self._launch()
+            full = True
+        elif self.page is None or self.page.is_closed():
+            self.page = await self.context.new_page()
+            setup_dialog_handler(self.page)
+            full = True
+        ok = await probe_session(self.page, self.url) if full else await self._alive()
+        if not ok:
+            self.stats["relogins"] += 1
+            log("🔁 세션이 유효하지 않아 다시 로그인합니다")
+            if not await self._login():
+                raise RuntimeError("재로그인 실패")
+        return self.page
+
+    async def health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            if self.lock.locked():
+                continue
+            async with self.lock:
+                try:
+                    await self.ensure_ready(full=True)
+                except Exception as e:
+                    log(f"❌ 데몬 상태 점검 실패: {e}")
+
+    def health(self) -> dict:
+        return {
+            "ready": self.page is not None and not self.page.is_closed(),
+            "busy": self.lock.locked(),
+            "cdp_url": self.cdp_url,
+            "uptime": round(time.time() - self.stats["started"], 1),
+            **{k: v for k, v in self.stats.items() if k != "started"},
+        }
+
+    async def _job_sales_ratio(self, page: Page, params: dict):
+        await run_sales_analysis(
+            page,
+            params.get("store") or self.user_id,
+            force=params.get("force", False),
+            relogin=self._login,
+        )
+        return None
+
+    async def _job_products(self, page: Page, params: dict):
+        await navigate_sales_ratio(page)
+        output_dir = Path(params.get("output_dir", OUTPUT_DIR))
+        sink = ProductJsonSink(output_dir)
+        path = (await run_category_pipeline(page, [sink], capture=params.get("capture", False)))[0]
+        return str(path)
+
+    async def _job_relogin(self, page: Page, params: dict):
+        self.stats["relogins"] += 1
+        if not await self._login():
+            raise RuntimeError("재로그인 실패")
+        return None
+
+    async def run_job(self, name: str, params: dict) -> dict:
+        """Run job ``name`` on the warm page and report its timings.
+
+        Jobs: ``sales_ratio`` (매출 구성비 추출), ``products`` (중분류 상품 목록),
+        ``relogin`` and ``health``. ``wait_seconds`` is the time spent
+        queued behind other jobs, ``ready_seconds`` the health check before
+        the job started.
+        """
+        if name == "health":
+            return {"ok": True, "result": self.health()}
+        handler = getattr(self, f"_job_{name}", None)
+        if handler is None:
+            return {"ok": False, "error": f"알 수 없는 작업: {name}"}
+
+        queued = time.perf_counter()
+        async with self.lock:
+            started = time.perf_counter()
+            reset_waits()
+            response = {"ok": False, "wait_seconds": round(started - queued, 3)}
+            try:
+                page = await self.ensure_ready()
+                ready = time.perf_counter()
+                response["ready_seconds"] = round(ready - started, 3)
+                response["result"] = await handler(page, params)
+                response["ok"] = True
+            except Exception as e:
+                self.stats["failed_jobs"] += 1
+                response["error"] = str(e)
+                log(f"❌ 데몬 작업 실패 - {name}: {e}")
+            self.stats["jobs"] += 1
+            response["seconds"] = round(time.perf_counter() - started, 3)
+            if self.policy is not None:
+                response["requests"] = self.policy.report(reset=True)
+            response["waits"] = wait_report()
+        log(f"{'✅' if response['ok'] else '❌'} 데몬 작업 {name} ({response['seconds']}s)")
+        return response
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            response = await self.run_job(request.pop("job", ""), request)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+        writer.close()
+
+    async def serve(self, host: str = DAEMON_HOST, port: int = DAEMON_PORT) -> asyncio.Server:
+        """Start the job socket and the health loop; returns the server."""
+        server = await asyncio.start_server(self._serve_client, host, port)
+        self._health_task = asyncio.create_task(self.health_loop())
+        log(f"📡 데몬 작업 소켓 대기 중 ({host}:{port})")
+        return server
+
+
+async def run_daemon(
+    user_id: str | None = None,
+    user_pw: str | None = None,
+    *,
+    url: str = LOGIN_URL,
+    cache: SessionCache | None = None,
+    headless: bool = True,
+    host: str = DAEMON_HOST,
+    port: int = DAEMON_PORT,
+    cdp_port: int = CDP_PORT,
+    health_interval: float = HEALTH_INTERVAL,
+    policy: RequestPolicy | None = None,
+) -> None:
+    """Run a :class:`BrowserDaemon` until cancelled."""
+    async with async_playwright() as p:
+        daemon = BrowserDaemon(
+            user_id,
+            user_pw,
+            url=url,
+            cache=cache,
+            headless=headless,
+            cdp_port=cdp_port,
+            health_interval=health_interval,
+            policy=policy,
+        )
+        await daemon.start(p)
+        server = await daemon.serve(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await daemon.close()
+
+
+def submit(job: str, *, host: str = DAEMON_HOST, port: int = DAEMON_PORT, timeout: float | None = None, **params) -> dict:
+    """Send ``job`` to a running daemon and return its JSON response."""
+    with socket.create_connection((host, port), timeout=timeout) as conn:
+        conn.sendall(json.dumps({"job": job, **params}, ensure_ascii=False).encode("utf-8") + b"\n")
+        with conn.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+@asynccontextmanager
+async def attached_page(
+    cdp_url: str = f"http://127.0.0.1:{CDP_PORT}",
+    url: str | None = None,
+    policy: RequestPolicy | None = None,
+) -> AsyncIterator[Page]:
+    """Open a page in the daemon's warm context over CDP.
+
+    The page shares the daemon's cookies, so it starts logged in. It opens
+    ``url`` (default: the daemon page's current URL) and is closed on exit;
+    the daemon's browser keeps running. Routes belong to the connection
+    that installed them, so ``policy`` is installed on this page itself.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.connect_over_cdp(cdp_url)
+        context = browser.contexts[0]
+        page = await context.new_page()
+        setup_dialog_handler(page)
+        if policy is not None:
+            await policy.install_async(page)
+        try:
+            target = url or next((pg.url for pg in context.pages if pg is not page), None)
+            if target:
+                await page.goto(target)
+                await process_popups_once(page)
+            yield page
+        finally:
+            await page.close()
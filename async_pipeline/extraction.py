@@ -0,0 +1,334 @@
+"""Async single pass over the middle category grid feeding several sinks.
+
+Mirrors :func:`sales_analysis.category_pipeline.run_category_pipeline`.
+Sink calls run on one dedicated I/O thread, so writing a category's rows
+overlaps with reading the next one. With ``concurrency`` above 1, extra
+pages of the same ``BrowserContext`` extract shards of the category list.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+from playwright.async_api import BrowserContext, Page, expect
+from utils import DEFAULT_WAIT_MS, log
+from utils.form_driver import call_form_search_async, nexacro_date, set_component_values_async
+from utils.transaction_watch import transaction_mark_async, wait_for_transactions_async
+from sales_analysis.category_pipeline import (
+    DATE_FIELDS,
+    SEARCH_BUTTON_SELECTOR,
+    CategorySink,
+    Window,
+    fail_sinks,
+    month_window,
+)
+from sales_analysis.dataset_parser import format_value
+from sales_analysis.grid_harvester import (
+    CATEGORY_ROW_SELECTOR,
+    CELL_SELECTOR,
+    DETAIL_ROW_SELECTOR,
+    _SCROLL_TO_ROW_JS,
+    _VIRTUAL_READ_JS,
+    row_text,
+)
+from sales_analysis.transaction_capture import (
+    is_transaction_response,
+    parse_transaction_payload,
+    pick_dataset,
+)
+from .common import page_popups_handled, wait
+from .navigation import navigate_sales_ratio
+from .popups import process_popups_once
+
+
+def _grid_args(
+    row_selector: str,
+    *,
+    key_index: int = 0,
+    cell_selector: str = CELL_SELECTOR,
+    mutation_timeout: int = 1000,
+    max_idle: int = 2,
+    max_steps: int = 10000,
+    **extra,
+) -> dict:
+    return {
+        "rowSelector": row_selector,
+        "cellSelector": cell_selector,
+        "keyIndex": key_index,
+        "mutationTimeout": mutation_timeout,
+        "maxIdle": max_idle,
+        "maxSteps": max_steps,
+        **extra,
+    }
+
+
+async def read_virtual_grid(page: Page, row_selector: str = DETAIL_ROW_SELECTOR, **options) -> list[dict]:
+    """Async :func:`sales_analysis.grid_harvester.read_virtual_grid`."""
+    start = time.perf_counter()
+    result = await page.evaluate(_VIRTUAL_READ_JS, _grid_args(row_selector, **options))
+    elapsed = time.perf_counter() - start
+    rows = result["rows"]
+    if result["scrolls"]:
+        rate = len(rows) / elapsed if elapsed > 0 else float("inf")
+        log(f"📜 가상 스크롤 {result['scrolls']}회, {len(rows)}행 ({rate:.0f} rows/s)")
+    return rows
+
+
+async def click_grid_row(page: Page, row_selector: str, key: str, **options) -> None:
+    """Async :func:`sales_analysis.grid_harvester.click_grid_row`."""
+    index = await page.evaluate(_SCROLL_TO_ROW_JS, _grid_args(row_selector, key=key, **options))
+    if index < 0:
+        raise RuntimeError(f"그리드에서 행을 찾을 수 없습니다: {key}")
+    await page.locator(row_selector).nth(index).click()
+
+
+async def set_date_range(
+    page: Page,
+    start_str: str,
+    end_str: str,
+    pause_ms: int = DEFAULT_WAIT_MS,
+) -> tuple[str, str]:
+    """Set the from/to date fields to ``YYYY-MM-DD`` strings.
+
+    Uses the form driver and types only the fields it could not set.
+    """
+    values = dict(zip(DATE_FIELDS, (start_str, end_str)))
+    missing = await set_component_values_async(page, {name: nexacro_date(v) for name, v in values.items()})
+    for name in missing:
+        field = page.locator(DATE_FIELDS[name])
+        if await field.count() > 0:
+            await field.click()
+            await field.fill(values[name])
+            await field.press("Enter")
+            await wait(page, pause_ms, step="date_input")
+    return start_str, end_str
+
+
+async def search(page: Page, pause_ms: int = DEFAULT_WAIT_MS) -> None:
+    mark = await transaction_mark_async(page)
+    if not await call_form_search_async(page, anchor="calFromDay"):
+        search_btn = page.locator(SEARCH_BUTTON_SELECTOR)
+        if await search_btn.count() == 0:
+            log("⚠️ 조회 버튼을 찾을 수 없습니다")
+            return
+        await search_btn.first.click()
+    await wait_for_transactions_async(page, mark, step="search")
+    await wait(page, pause_ms, step="search")
+
+
+async def extract_category(page: Page, code: str, pause_ms: int = DEFAULT_WAIT_MS) -> list[dict]:
+    """Click category ``code`` and read its detail rows from the grid."""
+    mark = await transaction_mark_async(page)
+    await click_grid_row(page, CATEGORY_ROW_SELECTOR, code)
+    await wait_for_transactions_async(page, mark, step="category")
+    await wait(page, pause_ms, step="category")
+    await expect(page.locator(DETAIL_ROW_SELECTOR).first).to_be_visible(timeout=3000)
+    return [
+        {"cells": d_row["cells"], "text": row_text(d_row), "values": None}
+        for d_row in await read_virtual_grid(page, DETAIL_ROW_SELECTOR)
+    ]
+
+
+async def _category_codes(page: Page, accept: Callable[[str], bool] | None) -> list[str]:
+    categories = await read_virtual_grid(page, CATEGORY_ROW_SELECTOR)
+    log(f"🟡 중분류 {len(categories)}건 확인")
+    codes = [c["cells"][0] if c["cells"] else "" for c in categories]
+    return [code for code in codes if accept is None or accept(code)]
+
+
+async def iter_dom_categories(
+    page: Page,
+    accept: Callable[[str], bool] | None,
+    pause_ms: int = DEFAULT_WAIT_MS,
+) -> AsyncIterator[tuple[str, list[dict]]]:
+    await search(page, pause_ms)
+    for code in await _category_codes(page, accept):
+        yield code, await extract_category(page, code, pause_ms)
+
+
+async def _capture(page: Page, action, timeout: int = 10000) -> dict[str, list[dict]]:
+    async with page.expect_response(is_transaction_response, timeout=timeout) as info:
+        await action()
+    response = await info.value
+    return parse_transaction_payload(await response.body())
+
+
+async def iter_captured_categories(
+    page: Page,
+    accept: Callable[[str], bool] | None,
+) -> AsyncIterator[tuple[str, list[dict]]]:
+    """Async counterpart of the capture mode: rows come from transaction payloads."""
+    search_btn = page.locator(SEARCH_BUTTON_SELECTOR)
+    if await search_btn.count() == 0:
+        raise RuntimeError("조회 버튼을 찾을 수 없습니다")
+    log("📡 트랜잭션 응답 캡처 모드로 추출")
+    categories = pick_dataset(await _capture(page, search_btn.first.click))
+    log(f"📡 중분류 데이터셋 {len(categories)}건 수신")
+    for category in categories:
+        code = format_value(next(iter(category.values()), None)).strip()
+        if accept is not None and not accept(code):
+            continue
+        payload = await _capture(page, lambda: click_grid_row(page, CATEGORY_ROW_SELECTOR, code))
+        rows = []
+        for values in pick_dataset(payload):
+            cells = [format_value(v).strip() for v in values.values()]
+            rows.append({"cells": cells, "text": "\t".join(cells).strip(), "values": values})
+        yield code, rows
+
+
+def shard(codes: list[str], count: int) -> list[list[str]]:
+    """Split ``codes`` round-robin into at most ``count`` non-empty shards."""
+    count = max(1, min(count, len(codes)))
+    return [codes[i::count] for i in range(count)]
+
+
+async def extract_shard(
+    context: BrowserContext,
+    url: str,
+    codes: list[str],
+    start_str: str,
+    end_str: str,
+    *,
+    navigate: bool = True,
+    pause_ms: int = DEFAULT_WAIT_MS,
+) -> dict[str, list[dict]]:
+    """Open a page in ``context`` and extract the detail rows of ``codes``."""
+    page = await context.new_page()
+    try:
+        await page.goto(url)
+        if navigate:
+            await process_popups_once(page)
+            await navigate_sales_ratio(page)
+        await set_date_range(page, start_str, end_str, pause_ms)
+        await search(page, pause_ms)
+        await expect(page.locator(CATEGORY_ROW_SELECTOR).first).to_be_visible(timeout=5000)
+        return {code: await extract_category(page, code, pause_ms) for code in codes}
+    finally:
+        await page.close()
+
+
+async def extract_shards(
+    context: BrowserContext,
+    url: str,
+    codes: list[str],
+    start_str: str,
+    end_str: str,
+    *,
+    concurrency: int,
+    navigate: bool = True,
+    pause_ms: int = DEFAULT_WAIT_MS,
+) -> list[tuple[str, list[dict]]]:
+    """Extract ``codes`` on ``concurrency`` pages of ``context`` at once.
+
+    Returns ``(code, rows)`` pairs in the order of ``codes``.
+    """
+    if not codes:
+        return []
+    shards = shard(codes, concurrency)
+    log(f"🟡 페이지 {len(shards)}개로 중분류 {len(codes)}건 병렬 추출")
+    results = await asyncio.gather(
+        *(
+            extract_shard(context, url, part, start_str, end_str, navigate=navigate, pause_ms=pause_ms)
+            for part in shards
+        )
+    )
+    merged: dict[str, list[dict]] = {}
+    for result in results:
+        merged.update(result)
+    return [(code, merged[code]) for code in codes]
+
+
+async def _iter_parallel_categories(
+    page: Page,
+    accept: Callable[[str], bool] | None,
+    start_str: str,
+    end_str: str,
+    concurrency: int,
+    pause_ms: int,
+) -> AsyncIterator[tuple[str, list[dict]]]:
+    await search(page, pause_ms)
+    codes = await _category_codes(page, accept)
+    for item in await extract_shards(
+        page.context, page.url, codes, start_str, end_str, concurrency=concurrency, pause_ms=pause_ms
+    ):
+        yield item
+
+
+def _open_sinks(sinks: list[CategorySink], context: dict) -> None:
+    for sink in sinks:
+        sink.open(context)
+
+
+def _begin_window(sinks: list[CategorySink], start_str: str, end_str: str) -> None:
+    for sink in sinks:
+        sink.begin_window(start_str, end_str)
+
+
+def _write(sinks: list[CategorySink], code: str, rows: list[dict]) -> None:
+    for sink in sinks:
+        sink.write(code, rows)
+
+
+def _close_sinks(sinks: list[CategorySink]) -> list[Path | None]:
+    return [sink.close() for sink in sinks]
+
+
+async def run_category_pipeline(
+    page: Page,
+    sinks: list[CategorySink],
+    *,
+    capture: bool = False,
+    windows: list[Window] | None = None,
+    concurrency: int = 1,
+    pause_ms: int = DEFAULT_WAIT_MS,
+) -> list[Path | None]:
+    """Visit each middle category once and send its rows to every sink.
+
+    Same contract as the sync pipeline. All sink calls happen in order on a
+    single worker thread (SQLite connections stay on the thread that opened
+    them). At most one category write is in flight while the next category
+    is being read.
+    """
+    if not page_popups_handled(page):
+        raise RuntimeError("팝업 처리가 완료되지 않아 데이터 추출을 중단합니다")
+
+    if windows is None:
+        windows = [month_window()]
+    context = {
+        "start": min((w[0] for w in windows), default=None),
+        "end": max((w[1] for w in windows), default=None),
+    }
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sink-io") as io:
+        await loop.run_in_executor(io, _open_sinks, sinks, context)
+        pending = None
+        try:
+            for start_str, end_str, accept in windows:
+                log(f"🟡 날짜 설정 시작 ({start_str} ~ {end_str})")
+                await set_date_range(page, start_str, end_str, pause_ms)
+                await loop.run_in_executor(io, _begin_window, sinks, start_str, end_str)
+
+                log("🟡 중분류별 매출 상세 추출 시작")
+                if capture:
+                    categories = iter_captured_categories(page, accept)
+                elif concurrency > 1:
+                    categories = _iter_parallel_categories(page, accept, start_str, end_str, concurrency, pause_ms)
+                else:
+                    categories = iter_dom_categories(page, accept, pause_ms)
+                async for code, rows in categories:
+                    if not rows:
+                        log(f"❌ 상세 테이블 항목 없음: {code}")
+                    if pending is not None:
+                        await pending
+                    pending = loop.run_in_executor(io, _write, sinks, code, rows)
+            if pending is not None:
+                await pending
+        except BaseException as e:
+            fail_sinks(sinks, e)
+            raise
+        finally:
+            results = await loop.run_in_executor(io, _close_sinks, sinks)
+    return results
@@ -0,0 +1,82 @@
+"""Async login flow, mirroring :mod:`login.login_handler`."""
+
+import os
+
+from dotenv import load_dotenv
+from playwright.async_api import Page
+from utils import log
+from utils.transaction_watch import transaction_mark_async, wait_for_transactions_async
+from .common import wait
+
+load_dotenv()
+
+LOGIN_URL = "https://store.bgfretail.com/websrc/deploy/index.html"
+ID_INPUT_SELECTOR = "#mainframe\\.HFrameSet00\\.LoginFrame\\.form\\.div_login\\.form\\.edt_id\\:input"
+PW_INPUT_SELECTOR = "#mainframe\\.HFrameSet00\\.LoginFrame\\.form\\.div_login\\.form\\.edt_pw\\:input"
+
+
+async def is_logged_in(page: Page) -> bool:
+    """Return ``True`` if the main menu after login is visible.
+
+    Same rules as :func:`browser.popup_handler.is_logged_in`: ``#topMenu``
+    on the page or in a frame means success, a visible ``#loginForm`` means
+    failure, anything else is treated as success with a warning.
+    """
+    try:
+        await page.wait_for_selector("#topMenu", timeout=10000)
+        return True
+    except Exception:
+        log("#topMenu 직접 탐색 실패, 프레임 탐색 시도")
+        for frame in page.frames:
+            try:
+                if await frame.locator("#topMenu").is_visible():
+                    log("✅ topMenu 프레임 내에서 감지됨")
+                    return True
+            except Exception:
+                continue
+        try:
+            if await page.locator("#loginForm").is_visible():
+                return False
+        except Exception:
+            pass
+        log("⚠️ 메뉴 로딩 실패 - 로그인은 성공으로 간주")
+        return True
+
+
+async def perform_login(
+    page: Page,
+    user_id: str | None = None,
+    user_pw: str | None = None,
+    *,
+    url: str = LOGIN_URL,
+) -> bool:
+    """Login with the given credentials, defaulting to ``.env``.
+
+    Returns
+    -------
+    bool
+        ``True`` on successful login, ``False`` otherwise.
+    """
+    user_id = user_id or os.getenv("LOGIN_ID")
+    user_pw = user_pw or os.getenv("LOGIN_PW")
+    if not user_id or not user_pw:
+        log("❗ LOGIN_ID 또는 LOGIN_PW가 설정되지 않았습니다", stage="로그인")
+        return False
+
+    await page.goto(url)
+    await page.wait_for_selector(ID_INPUT_SELECTOR, timeout=10000)
+    await page.fill(ID_INPUT_SELECTOR, user_id)
+    await wait(page, step="login_input")
+    await page.fill(PW_INPUT_SELECTOR, user_pw)
+    await wait(page, step="login_input")
+
+    mark = await transaction_mark_async(page)
+    await page.keyboard.press("Enter")
+    await wait_for_transactions_async(page, mark, step="login")
+    await wait(page, 2000, step="login_submit")
+
+    if await is_logged_in(page):
+        log("✅ 로그인 성공")
+        return True
+    log("❌ 로그인 실패")
+    return False
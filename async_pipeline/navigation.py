@@ -0,0 +1,51 @@
+"""Async navigation to the '중분류별 매출 구성비' screen."""
+
+from playwright.async_api import Page, expect
+from utils import log
+from utils.form_driver import open_menu_by_id_async
+from utils.transaction_watch import transaction_mark_async, wait_for_transactions_async
+from sales_analysis.navigate_sales_ratio import SALES_RATIO_MENU
+from .common import page_popups_handled, wait
+
+SALES_TAB_SELECTOR = "div.nexatextitem:has-text('매출분석')"
+
+
+async def click_sales_analysis_tab(page: Page) -> bool:
+    """Click the '매출분석' tab in the top menu."""
+    try:
+        element = await page.wait_for_selector(SALES_TAB_SELECTOR, timeout=5000)
+        await element.click()
+        await wait(page, step="menu")
+        log("'매출분석' 탭 클릭 성공")
+        return True
+    except Exception as e:
+        log(f"'매출분석' 탭 클릭 실패: {e}")
+        return False
+
+
+async def find_and_click(page: Page, text: str) -> bool:
+    """Search all frames for the given text and click the first match."""
+    for frame in page.frames:
+        locator = frame.locator(f"text={text}")
+        if await locator.count() > 0:
+            await locator.first.click()
+            await wait(page, step="menu")
+            return True
+    return False
+
+
+async def navigate_sales_ratio(page: Page) -> None:
+    if not page_popups_handled(page):
+        raise RuntimeError("팝업 처리가 완료되지 않아 메뉴 이동을 중단합니다")
+    mark = await transaction_mark_async(page)
+    if await open_menu_by_id_async(page, SALES_RATIO_MENU):
+        log(f"'{SALES_RATIO_MENU}' 메뉴 id 로 열기")
+    else:
+        if not await click_sales_analysis_tab(page):
+            raise RuntimeError("Cannot find '매출분석' menu")
+        await expect(page.locator(f"text={SALES_RATIO_MENU}").first).to_be_visible(timeout=5000)
+        mark = await transaction_mark_async(page)
+        if not await find_and_click(page, SALES_RATIO_MENU):
+            raise RuntimeError("Cannot find '중분류별 매출 구성비' submenu")
+    await wait_for_transactions_async(page, mark, step="menu")
+    await wait(page, step="menu")
@@ -0,0 +1,146 @@
+"""Run the pipeline for several store accounts on one browser.
+
+Each store gets its own ``BrowserContext`` (cookies and popups never leak
+between accounts, see :func:`run_store`) and its own output directory. A semaphore caps how many
+stores run at once, and a failing store is recorded without stopping the
+others.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from playwright.async_api import Browser, async_playwright
+from utils import RequestPolicy, SessionCache, log, wait_report
+from sales_analysis.category_pipeline import OUTPUT_DIR
+from sales_analysis.warehouse import WAREHOUSE_PATH
+from .login import LOGIN_URL
+from .runner import run_store
+
+STORES_PATH = Path(__file__).resolve().parent.parent / "config" / "stores.json"
+STORE_OUTPUT_DIR = OUTPUT_DIR / "stores"
+
+
+def load_stores(path: Path = STORES_PATH) -> list[dict]:
+    """Read ``[{"store": ..., "login_id": ..., "login_pw": ...}, ...]``.
+
+    ``store`` defaults to ``login_id``.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stores = json.load(f)
+    for entry in stores:
+        entry.setdefault("store", entry["login_id"])
+    return stores
+
+
+async def _run_one(
+    browser: Browser,
+    semaphore: asyncio.Semaphore,
+    entry: dict,
+    *,
+    url: str,
+    output_root: Path,
+    warehouse_path: Path,
+    cache: SessionCache | None,
+    policy: RequestPolicy | None,
+    force: bool,
+) -> dict:
+    store = entry["store"]
+    async with semaphore:
+        start = time.perf_counter()
+        result = {"store": store, "status": "failed", "error": None}
+        try:
+            ok = await run_store(
+                browser,
+                entry["login_id"],
+                entry["login_pw"],
+                url=url,
+                store=store,
+                cache=cache,
+                policy=policy,
+                force=force,
+                output_dir=output_root / store,
+                warehouse_path=warehouse_path,
+            )
+            result["status"] = "ok" if ok else "failed"
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
+            log(f"❌ [{store}] 처리 실패: {e}")
+        result["seconds"] = round(time.perf_counter() - start, 2)
+        log(f"{'✅' if result['status'] == 'ok' else '❌'} [{store}] {result['status']} ({result['seconds']}s)")
+        return result
+
+
+async def run_stores(
+    stores: list[dict],
+    *,
+    concurrency: int = 2,
+    headless: bool = True,
+    url: str = LOGIN_URL,
+    output_root: Path = STORE_OUTPUT_DIR,
+    warehouse_path: Path = WAREHOUSE_PATH,
+    cache: SessionCache | None = None,
+    policy: RequestPolicy | None = None,
+    force: bool = False,
+) -> dict:
+    """Run login, popups, navigation and extraction for every store.
+
+    Parameters
+    ----------
+    stores : list[dict]
+        Entries as returned by :func:`load_stores`.
+    concurrency : int, optional
+        Maximum number of stores processed at the same time.
+    url : str, optional
+        Portal login page.
+    output_root : Path, optional
+        Per-store outputs go to ``output_root / store``.
+    warehouse_path : Path, optional
+        SQLite warehouse shared by all stores.
+    cache : SessionCache | None, optional
+        Reuse saved login sessions per account.
+    policy : RequestPolicy | None, optional
+        Request blocking installed on every store's context.
+    force : bool, optional
+        Run the sales analysis on any weekday, not only Mondays.
+
+    Returns
+    -------
+    dict
+        ``{"stores": [per-store results], "seconds": ..., "stores_per_hour": ...}``
+        plus ``"requests"`` (see :meth:`RequestPolicy.report`) with a policy.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    start = time.perf_counter()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            results = await asyncio.gather(
+                *(
+                    _run_one(
+                        browser,
+                        semaphore,
+                        entry,
+                        url=url,
+                        output_root=output_root,
+                        warehouse_path=warehouse_path,
+                        cache=cache,
+                        policy=policy,
+                        force=force,
+                    )
+                    for entry in stores
+                )
+            )
+        finally:
+            await browser.close()
+    elapsed = time.perf_counter() - start
+    done = sum(1 for r in results if r["status"] == "ok")
+    rate = done / elapsed * 3600 if elapsed > 0 else 0.0
+    log(f"🏁 점포 {len(stores)}곳 중 {done}곳 성공, {elapsed:.1f}s ({rate:.1f} stores/hour)")
+    report = {"stores": results, "seconds": round(elapsed, 2), "stores_per_hour": round(rate, 1)}
+    if policy is not None:
+        report["requests"] = policy.report()
+    report["waits"] = wait_report()
+    return report
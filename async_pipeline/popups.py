@@ -0,0 +1,145 @@
+"""Async popup handling, mirroring ``utils.common.process_popups_once``.
+
+The result is recorded on the page only (see :func:`page_popups_handled`):
+several stores run in one process, so the ``utils.common`` flag read by the
+sync code is left alone.
+"""
+
+import time
+
+from playwright.async_api import Page
+from utils import common, log
+from utils.popup_scan import candidate_selector, scan_popups_async
+from utils.popup_watch import wait_for_popups_settled_async, watching
+
+STZZ120_CLOSE_SELECTOR = (
+    "#mainframe\\.HFrameSet00\\.VFrameSet00\\.FrameSet\\.WorkFrame"
+    "\\.STZZ120_P0\\.form\\.btn_close\\:icontext"
+)
+
+
+async def fallback_close_popups(page: Page) -> None:
+    """Alternative popup closing strategy using ESC key and element removal."""
+    log("⬇️ 팝업 강제 종료 전략 실행")
+    try:
+        try:
+            await page.hover("body")
+            await page.keyboard.press("Escape")
+            await page.wait_for_timeout(300)
+        except Exception as e:
+            log(f"ESC 키 전송 실패: {e}")
+        await page.evaluate(
+            """() => document.querySelectorAll("div[style*='z-index']").forEach((d) => {
+                if (d.offsetParent !== null) d.remove();
+            })"""
+        )
+    except Exception as e:  # pragma: no cover - logging only
+        log(f"강제 팝업 종료 실패: {e}")
+    finally:
+        log("⬆️ 팝업 강제 종료 전략 완료")
+
+
+async def close_popups(
+    page: Page,
+    repeat: int = 3,
+    interval: int = 1000,
+    final_wait: int = 3000,
+    max_wait: int | None = None,
+) -> tuple[int, int]:
+    """Close the candidates of :func:`scan_popups_async`; returns ``(closed, detected)``."""
+    closed = 0
+    detected = 0
+    loops = min(max(2, repeat), 10)
+    start = time.time() * 1000
+    for _ in range(loops):
+        loop_closed = 0
+        candidates = (await scan_popups_async(page))["candidates"]
+        detected += len(candidates)
+        for candidate in candidates:
+            frame = candidate["frame"]
+            btn = frame.locator(candidate_selector(candidate))
+            try:
+                if not await btn.is_visible():
+                    detected -= 1
+                    continue
+                await btn.click(timeout=1000)
+                try:
+                    await btn.wait_for(state="hidden", timeout=interval)
+                except Exception:
+                    pass
+                closed += 1
+                loop_closed += 1
+            except Exception as e:  # pragma: no cover - logging only
+                log(f"팝업 닫기 실패({candidate['rule']}): {e}")
+        if loop_closed == 0:
+            break
+        if max_wait is not None and (time.time() * 1000 - start) >= max_wait:
+            log("max_wait 초과로 팝업 탐색 중단")
+            break
+
+    common._closed_popups += closed
+    if detected - closed > 0:
+        common._popup_failure_count += 1
+    else:
+        common._popup_failure_count = 0
+    if common._popup_failure_count >= 3:
+        await fallback_close_popups(page)
+        common._popup_failure_count = 0
+
+    log(f"총 {closed}개 팝업 닫기, 감지된 버튼 {detected}개")
+    if closed and await wait_for_popups_settled_async(page, timeout=final_wait) is None:
+        await page.wait_for_timeout(final_wait)
+    return closed, detected
+
+
+async def close_stzz120_popup(page: Page) -> bool:
+    """Close the STZZ120_P0 popup by coordinate click if visible."""
+    btn = page.locator(STZZ120_CLOSE_SELECTOR)
+    if await btn.count() == 0 or not await btn.is_visible():
+        log("ℹ️ STZZ120 팝업 안 보임")
+        return False
+    await page.evaluate("document.getElementById('nexacontainer').style.pointerEvents = 'none'")
+    box = await btn.bounding_box()
+    if box:
+        await page.mouse.click(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+        log("✅ 강제 좌표 클릭으로 STZZ120 팝업 닫기 성공")
+    else:
+        log("⚠️ boundingBox 없음: 강제 클릭 실패")
+    await page.evaluate("document.getElementById('nexacontainer').style.pointerEvents = ''")
+    return True
+
+
+async def remaining_popup_button_ids(page: Page) -> list[str]:
+    """Return IDs of still visible popup close buttons."""
+    return [c["id"] for c in (await scan_popups_async(page))["candidates"] if c["id"]]
+
+
+async def handle_popup(page: Page) -> bool:
+    """Close all popups once and record the result on ``page``."""
+    try:
+        # 감시는 Nexacro 닫기 버튼만 보므로 모든 프레임 탐색에서도 후보가 없어야 끝낸다
+        if (
+            watching(page)
+            and await wait_for_popups_settled_async(page) == []
+            and not (await scan_popups_async(page))["candidates"]
+        ):
+            setattr(page, "_popups_handled", True)
+            return True
+        await close_popups(page, repeat=4, interval=1000)
+        await close_stzz120_popup(page)
+        await close_popups(page, repeat=2, interval=1000)
+        handled = not await remaining_popup_button_ids(page)
+    except Exception as e:  # pragma: no cover - logging only
+        log(f"팝업 처리 오류: {e}")
+        handled = False
+    setattr(page, "_popups_handled", handled)
+    return handled
+
+
+async def process_popups_once(page: Page, *, force: bool = False) -> bool:
+    """Run popup handling once per page unless ``force`` is set."""
+    handled = getattr(page, "_popups_handled", None)
+    if handled is not None and not force:
+        log("✅ 팝업 탐색 이미 완료됨")
+        return handled
+    return await handle_popup(page)
@@ -0,0 +1,170 @@
+"""Async run pipeline: login, popups, navigation and extraction on one loop."""
+
+import asyncio
+import datetime
+import os
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright.async_api import Browser, Page, async_playwright
+from utils import (
+    RequestPolicy,
+    SessionCache,
+    SessionExpired,
+    configure_form_driver,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_transaction_watch,
+    configure_waits,
+    log,
+    request_policy_from_config,
+    wait_report,
+)
+from order import prepare_sales_run
+from sales_analysis.direct_client import direct_client_from_context_async, direct_options, run_direct_pipeline
+from sales_analysis.warehouse import WAREHOUSE_PATH
+from sales_analysis.navigate_sales_ratio import load_config
+from .common import handle_exception
+from .extraction import run_category_pipeline
+from .login import LOGIN_URL
+from .navigation import navigate_sales_ratio
+from .session import ensure_session, session_cache_from_config, start_session
+
+
+async def _extract_direct(page: Page, cfg: dict, run: dict) -> None:
+    client = await direct_client_from_context_async(page.context, page.url, cfg)
+    try:
+        await asyncio.to_thread(run_direct_pipeline, client, run["sinks"], windows=run["windows"])
+    finally:
+        client.pool.close()
+
+
+async def run_sales_analysis(
+    page: Page,
+    store: str | None = None,
+    *,
+    force: bool = False,
+    output_dir: Path | None = None,
+    warehouse_path: Path = WAREHOUSE_PATH,
+    relogin: Callable[[], Awaitable[bool]] | None = None,
+) -> None:
+    """Async :func:`order.run_sales_analysis`; runs on Mondays unless ``force``.
+
+    ``output_dir`` and ``warehouse_path`` are passed to
+    :func:`order.prepare_sales_run`. With ``direct_client.enabled`` the
+    transactions are sent over HTTP with the page's cookies and the menu is
+    never opened. When the portal rejects those cookies
+    (:class:`~utils.http_pool.SessionExpired`), ``relogin`` (by default
+    :func:`~async_pipeline.session.ensure_session` with the ``LOGIN_ID``
+    account) restores the session on ``page`` and the run is resumed once
+    from the journal with a client built from the new cookies.
+    """
+    if not force and datetime.datetime.today().weekday() != 0:
+        log("오늘은 월요일이 아니므로 매출 분석을 건너뜁니다")
+        return
+
+    cfg = await asyncio.to_thread(load_config)
+    direct = direct_options(cfg)["enabled"]
+    if not direct:
+        log("➡️ 매출분석 메뉴 진입 시도")
+        await navigate_sales_ratio(page)
+        log("✅ 메뉴 진입 성공")
+
+    store = store or os.getenv("LOGIN_ID") or "default"
+    run = await asyncio.to_thread(
+        prepare_sales_run, cfg, store, output_dir=output_dir, warehouse_path=warehouse_path
+    )
+    journal, task = run["journal"], run["task"]
+
+    log("🟡 매출 상세 데이터 추출 시작")
+    journal.set_stage("데이터 추출")
+    try:
+        if direct:
+            try:
+                await _extract_direct(page, cfg, run)
+            except SessionExpired as e:
+                log(f"⌛ 직접 요청 중 세션 만료, 다시 로그인 후 한 번 재시도합니다: {e}")
+                journal.fail(task, str(e))
+                if not await (relogin() if relogin is not None else ensure_session(page)):
+                    raise
+                # 실패로 기록된 작업을 재개하므로 완료된 중분류는 건너뛰고 같은 출력에 이어 쓴다
+                run = await asyncio.to_thread(
+                    prepare_sales_run, cfg, store, output_dir=output_dir, warehouse_path=warehouse_path
+                )
+                journal, task = run["journal"], run["task"]
+                await _extract_direct(page, cfg, run)
+        else:
+            await run_category_pipeline(
+                page,
+                run["sinks"],
+                capture=cfg.get("transaction_capture", False),
+                windows=run["windows"],
+                concurrency=cfg.get("concurrency", 1),
+            )
+    except Exception as e:
+        journal.fail(task, str(e))
+        log(f"❌ 매출 상세 데이터 추출 실패, 다음 실행에서 이어서 진행합니다: {e}")
+        raise
+    journal.finish(task)
+    journal.set_stage("종료")
+    log("✅ 매출 상세 데이터 추출 완료")
+
+
+async def run_store(
+    browser: Browser,
+    user_id: str | None = None,
+    user_pw: str | None = None,
+    *,
+    url: str = LOGIN_URL,
+    store: str | None = None,
+    cache: SessionCache | None = None,
+    policy: RequestPolicy | None = None,
+    **options,
+) -> bool:
+    """Start a session for one store in its own context and extract its sales.
+
+    ``store`` defaults to ``user_id``; ``cache`` and ``policy`` go to
+    :func:`start_session` and ``options`` to :func:`run_sales_analysis`.
+    Returns ``False`` if login or popup handling fails.
+    """
+    page = await start_session(browser, user_id, user_pw, url=url, cache=cache, policy=policy)
+    if page is None:
+        return False
+    try:
+        await run_sales_analysis(
+            page,
+            store or user_id or os.getenv("LOGIN_ID"),
+            relogin=lambda: ensure_session(page, user_id, user_pw, url=url, cache=cache),
+            **options,
+        )
+    except Exception as e:
+        await handle_exception(page, "매출분석", e)
+        raise
+    finally:
+        await page.context.close()
+    return True
+
+
+async def main(headless: bool = False) -> bool:
+    """Async counterpart of ``run/main.py``'s ``main``."""
+    cfg = await asyncio.to_thread(load_config)
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
+    policy = request_policy_from_config(cfg)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            return await run_store(browser, cache=session_cache_from_config(cfg), policy=policy)
+        finally:
+            await browser.close()
+            if policy is not None:
+                policy.report()
+            wait_report()
+
+
+def run(headless: bool = False) -> bool:
+    """Sync entry point running :func:`main` on a fresh event loop."""
+    return asyncio.run(main(headless))
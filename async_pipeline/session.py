@@ -0,0 +1,160 @@
+"""Start a logged-in page, restoring a cached session when it is still valid."""
+
+import os
+import time
+
+from playwright.async_api import Browser, BrowserContext, Page
+from utils import RequestPolicy, SessionCache, log
+from utils.popup_rules import popup_rule_engine
+from utils.popup_watch import watch_popups_async
+from utils.transaction_watch import watch_transactions_async
+from .common import setup_dialog_handler
+from .login import ID_INPUT_SELECTOR, LOGIN_URL, perform_login
+from .popups import process_popups_once, remaining_popup_button_ids
+
+POPUP_TITLE_SELECTOR = "div[id$='Static00:text']"
+
+
+def session_cache_from_config(cfg: dict) -> SessionCache | None:
+    """Build the cache from ``runtime_config["session_cache"]`` or return ``None``."""
+    options = cfg.get("session_cache", {})
+    if not options.get("enabled", True):
+        return None
+    return SessionCache(max_age_hours=options.get("max_age_hours", 8))
+
+
+async def probe_session(page: Page, url: str = LOGIN_URL, timeout: int = 5000) -> bool:
+    """Load ``url`` and tell whether the restored session is still logged in.
+
+    Waits only until either ``#topMenu`` or the login input shows up, and
+    treats a popup matching a ``session_expired`` rule of
+    ``config/popup_rules.json`` as expired.
+    """
+    await page.goto(url)
+    try:
+        await page.locator(f"#topMenu, {ID_INPUT_SELECTOR}").first.wait_for(state="visible", timeout=timeout)
+    except Exception:
+        return False
+    if await session_expired_popup(page):
+        return False
+    return await page.locator("#topMenu").is_visible()
+
+
+async def session_expired_popup(page: Page) -> bool:
+    """Whether a 세션 만료 popup is open in any frame."""
+    keywords = popup_rule_engine().session_expired_texts()
+    for frame in page.frames:
+        titles = frame.locator(POPUP_TITLE_SELECTOR)
+        for i in range(await titles.count()):
+            text = await titles.nth(i).inner_text()
+            if any(keyword in text for keyword in keywords):
+                log(f"⌛ 세션 만료 팝업 감지: '{text}'")
+                return True
+    return False
+
+
+async def _clear_remaining_popups(page: Page) -> bool:
+    # 세션이 살아 있으면 로그인 직후 팝업이 다시 뜨지 않으므로 남은 버튼만 확인
+    if await remaining_popup_button_ids(page):
+        return await process_popups_once(page, force=True)
+    setattr(page, "_popups_handled", True)
+    return True
+
+
+async def new_context(browser: Browser, policy: RequestPolicy | None = None, **kwargs) -> BrowserContext:
+    """``browser.new_context`` with ``policy`` routing, the popup watcher and the transaction counter."""
+    context = await browser.new_context(**kwargs)
+    if policy is not None:
+        await policy.install_async(context)
+    await watch_popups_async(context)
+    await watch_transactions_async(context)
+    return context
+
+
+async def _restore(browser: Browser, state: dict, url: str, policy: RequestPolicy | None) -> Page | None:
+    start = time.perf_counter()
+    context = await new_context(browser, policy, storage_state=state)
+    page = await context.new_page()
+    setup_dialog_handler(page)
+    if not await probe_session(page, url):
+        await context.close()
+        return None
+    if not await _clear_remaining_popups(page):
+        await context.close()
+        return None
+    log(f"♻️ 저장된 세션 복원 ({time.perf_counter() - start:.1f}s)")
+    return page
+
+
+async def start_session(
+    browser: Browser,
+    user_id: str | None = None,
+    user_pw: str | None = None,
+    *,
+    url: str = LOGIN_URL,
+    cache: SessionCache | None = None,
+    policy: RequestPolicy | None = None,
+) -> Page | None:
+    """Return a logged-in, popup-cleared page in a new context of ``browser``.
+
+    With ``cache``, a saved ``storage_state`` for ``user_id`` is tried first
+    and a full login only runs when the probe finds the session expired.
+    After a full login the new state is saved. ``policy`` is installed on
+    the new context before the first request. Returns ``None`` if login or
+    popup handling fails.
+    """
+    user_id = user_id or os.getenv("LOGIN_ID")
+    if cache is not None and user_id:
+        state = cache.load(user_id)
+        if state is not None:
+            page = await _restore(browser, state, url, policy)
+            if page is not None:
+                return page
+            log("⚠️ 저장된 세션이 만료되어 다시 로그인합니다")
+            cache.clear(user_id)
+
+    context = await new_context(browser, policy)
+    page = await context.new_page()
+    setup_dialog_handler(page)
+    if not await perform_login(page, user_id, user_pw, url=url) or not await process_popups_once(page):
+        await context.close()
+        return None
+    if cache is not None and user_id:
+        cache.save(user_id, await context.storage_state())
+    return page
+
+
+async def ensure_session(
+    page: Page,
+    user_id: str | None = None,
+    user_pw: str | None = None,
+    *,
+    url: str = LOGIN_URL,
+    cache: SessionCache | None = None,
+) -> bool:
+    """Bring an existing ``page`` back to a logged-in, popup-cleared state.
+
+    Used where the context must survive (the warm browser daemon): the
+    context's own cookies are probed first, then the cached session's
+    cookies, and only then a full login runs on ``page``.
+    """
+    user_id = user_id or os.getenv("LOGIN_ID")
+    setup_dialog_handler(page)
+    if await probe_session(page, url):
+        return await _clear_remaining_popups(page)
+    if cache is not None and user_id:
+        state = cache.load(user_id)
+        if state is not None:
+            await page.context.add_cookies(state["cookies"])
+            if await probe_session(page, url):
+                log("♻️ 저장된 세션 쿠키로 복원")
+                return await _clear_remaining_popups(page)
+            cache.clear(user_id)
+
+    if not await perform_login(page, user_id, user_pw, url=url):
+        return False
+    if not await process_popups_once(page, force=True):
+        return False
+    if cache is not None and user_id:
+        cache.save(user_id, await page.context.storage_state())
+    return True
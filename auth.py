@@ -18,9 +18,9 @@ def perform_login(page: Page, structure: dict) -> bool:
 
     try:
         log("[로그인] 페이지 이동")
-        wait(page)
+        wait(page, step="login")
         page.goto(URL)
-        wait(page)
+        wait(page, step="login")
 
         # Wait for both input fields to be ready
         page.wait_for_selector(structure["id"])
@@ -30,27 +30,27 @@ def perform_login(page: Page, structure: dict) -> bool:
         pw_input = page.locator(structure["password"])
 
         log("[로그인] 아이디 입력")
-        wait(page)
+        wait(page, step="login")
         id_input.click()
-        wait(page)
+        wait(page, step="login")
         id_input.fill(user_id)
-        wait(page)
+        wait(page, step="login")
 
         log("[로그인] 비밀번호 입력")
-        wait(page)
+        wait(page, step="login")
         pw_input.click()
-        wait(page)
+        wait(page, step="login")
         pw_input.fill(user_pw)
-        wait(page)
+        wait(page, step="login")
 
         # Small delay before clicking the login button
-        wait(page)
+        wait(page, step="login")
 
         login_btn = page.locator(structure["login_button"])
         log("[로그인] 로그인 버튼 클릭")
-        wait(page)
+        wait(page, step="login")
         login_btn.click()
-        page.wait_for_timeout(3000)
+        wait(page, 3000, step="login_submit")
 
         log("[로그인] 로그인 결과 확인")
         try:
@@ -0,0 +1 @@
+"""Local benchmarks and synthetic fixtures for the extraction flows."""
@@ -0,0 +1,130 @@
+"""Cold vs. warm page load of a Nexacro-like static bundle.
+
+A local server simulates the deploy: ``--files`` scripts of ``--size-kb``
+KB each, answered after ``--latency`` seconds and supporting ETag and
+Last-Modified revalidation. Every load uses a fresh browser context, as
+the run paths do. Compared:
+
+- no cache (plain network)
+- cold cache (empty directory, files are downloaded and stored)
+- warm cache (files served from disk without revalidation)
+- warm cache with revalidation (``fresh_seconds=0``, answered by 304)
+
+Usage::
+
+    python -m benchmarks.bench_asset_cache --files 120 --size-kb 40 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from benchmarks.fixtures import write_static_bundle
+from utils import AssetCache
+
+
+class BundleHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+    requests = 0
+    not_modified = 0
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def send_head(self):
+        type(self).requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        path = Path(self.translate_path(self.path))
+        if path.is_file():
+            etag = '"' + hashlib.md5(path.read_bytes()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                type(self).not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+            self._etag = etag
+        return super().send_head()
+
+    def end_headers(self) -> None:
+        etag = getattr(self, "_etag", None)
+        if etag:
+            self.send_header("ETag", etag)
+            self._etag = None
+        super().end_headers()
+
+
+async def load(browser, url: str, cache: AssetCache | None) -> float:
+    context = await browser.new_context()
+    if cache is not None:
+        await cache.install_async(context)
+    page = await context.new_page()
+    start = time.perf_counter()
+    await page.goto(url, wait_until="load")
+    elapsed = time.perf_counter() - start
+    await context.close()
+    return elapsed
+
+
+async def run(files: int, size_kb: int, latency: float, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        page_path = write_static_bundle(tmp / "www", files, size_kb)
+        handler = type("Handler", (BundleHandler,), {"latency": latency})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(tmp / "www")))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}{page_path}"
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch()
+                cases = [
+                    ("no cache", lambda: None),
+                    ("cold cache", lambda: AssetCache(tmp / f"cold{time.time_ns()}")),
+                    ("warm cache", lambda: AssetCache(tmp / "warm")),
+                    ("warm + revalidate (304)", lambda: AssetCache(tmp / "warm", fresh_seconds=0)),
+                ]
+                # 디스크 캐시를 미리 채워 둔다
+                primer = AssetCache(tmp / "warm")
+                await load(browser, url, primer)
+                primer.save()
+                for label, make in cases:
+                    handler.requests = handler.not_modified = 0
+                    times = []
+                    for _ in range(repeat):
+                        cache = make()
+                        times.append(await load(browser, url, cache))
+                        if cache is not None:
+                            cache.save()
+                    print(
+                        f"{label:<26} {sum(times) / len(times) * 1000:8.1f} ms/load"
+                        f"  server requests {handler.requests / repeat:6.1f}/load"
+                        f"  (304: {handler.not_modified / repeat:.1f})"
+                    )
+                await browser.close()
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=120)
+    parser.add_argument("--size-kb", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.files, args.size_kb, args.latency, args.repeat))
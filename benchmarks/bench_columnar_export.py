@@ -0,0 +1,92 @@
+"""Benchmark for :mod:`sales_analysis.columnar_export`.
+
+Fills a temporary warehouse with a synthetic year of daily sales (same
+products, quantities and amounts drawn per day), converts
+it to Parquet and Arrow IPC, and compares conversion time, on-disk size and
+a memory-mapped single-column read against the text report format.
+
+Usage::
+
+    python -m benchmarks.bench_columnar_export --days 365 --products 300
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.fixtures import make_detail_rows
+from sales_analysis.columnar_export import FORMATS, ds, export_warehouse, read_sales
+from sales_analysis.warehouse import SalesWarehouse
+
+CATEGORIES = ("001", "002", "003", "004", "005")
+
+
+def directory_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def fill_warehouse(warehouse: SalesWarehouse, store: str, days: int, products: int, text_path: Path) -> int:
+    per_category = max(products // len(CATEGORIES), 1)
+    start = datetime.date.today() - datetime.timedelta(days=days)
+    total = 0
+    with text_path.open("w", encoding="utf-8") as text:
+        for offset in range(days):
+            day = (start + datetime.timedelta(days=offset)).isoformat()
+            # 같은 상품 목록에 날마다 다른 수량/금액
+            base = make_detail_rows(per_category * len(CATEGORIES), seed=offset)
+            text.write(f"[기간: {day} ~ {day}]\n")
+            for i, category in enumerate(CATEGORIES):
+                rows = [
+                    [code, name, qty, f"{int(amt):,}"]
+                    for code, name, qty, amt, _ in base[i * per_category:(i + 1) * per_category]
+                ]
+                warehouse.insert_sales(store, day, day, category, rows)
+                text.write(f"[중분류: {category}]\n")
+                text.writelines("\t".join(row) + "\n" for row in rows)
+                text.write("\n")
+                total += len(rows)
+    return total
+
+
+def run(days: int, products: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        warehouse = SalesWarehouse(tmp / "warehouse.db")
+        text_path = tmp / "history.txt"
+        start = time.perf_counter()
+        rows = fill_warehouse(warehouse, "bench", days, products, text_path)
+        print(f"warehouse fill          {rows:>9} rows  {time.perf_counter() - start:7.2f}s")
+        print(f"text report             {text_path.stat().st_size / 1e6:9.2f} MB")
+
+        for fmt in FORMATS:
+            root = tmp / fmt
+            start = time.perf_counter()
+            export_warehouse(warehouse, root, fmt=fmt)
+            elapsed = time.perf_counter() - start
+            # 두 번째 내보내기는 기존 파티션을 덮어써야 한다 (행 수 유지)
+            export_warehouse(warehouse, root, fmt=fmt)
+            size = directory_size(root)
+            start = time.perf_counter()
+            table = read_sales(root, columns=["sale_amt"], filter=ds.field("store") == "bench", fmt=fmt)
+            read_elapsed = time.perf_counter() - start
+            print(
+                f"{fmt:<8} export {elapsed:7.2f}s  {size / 1e6:7.2f} MB  "
+                f"read sale_amt {table.num_rows} rows {read_elapsed * 1000:7.1f} ms"
+            )
+        warehouse.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--products", type=int, default=300)
+    args = parser.parse_args()
+    run(args.days, args.products)
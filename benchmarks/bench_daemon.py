@@ -0,0 +1,103 @@
+"""Per-job latency: fresh browser per job vs the warm browser daemon.
+
+Runs the ``products`` job against the mock portal. The cold path launches
+Chromium, logs in and clears popups for every job, like ``run/main.py``.
+The warm path submits the job over the daemon's socket to an already
+logged-in page; the first warm job is reported separately because the
+daemon's own start is paid once.
+
+Usage::
+
+    python -m benchmarks.bench_daemon --jobs 3 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from async_pipeline.daemon import BrowserDaemon, submit
+from async_pipeline.extraction import run_category_pipeline
+from async_pipeline.navigation import navigate_sales_ratio
+from async_pipeline.session import start_session
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import MockPortalHandler, start_server
+from sales_analysis.middle_category_product_extractor import ProductJsonSink
+
+ACCOUNT = ("store01", "pw01")
+
+
+async def cold_job(p, url: str, output_dir: Path) -> float:
+    start = time.perf_counter()
+    browser = await p.chromium.launch()
+    try:
+        page = await start_session(browser, *ACCOUNT, url=url)
+        if page is None:
+            raise RuntimeError("로그인 실패")
+        await navigate_sales_ratio(page)
+        await run_category_pipeline(page, [ProductJsonSink(output_dir)], pause_ms=0)
+    finally:
+        await browser.close()
+    return time.perf_counter() - start
+
+
+async def run(jobs: int, latency: float, categories: int, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_portal_fixtures(tmp, categories, rows)
+        handler = type(
+            "BenchHandler",
+            (MockPortalHandler,),
+            {"fixture_dir": tmp, "latency": latency, "accounts": dict([ACCOUNT]), "sessions": {}},
+        )
+        server = start_server(handler=handler)
+        url = f"{server.url}/index.html"
+        try:
+            async with async_playwright() as p:
+                cold = [await cold_job(p, url, tmp) for _ in range(jobs)]
+
+                start = time.perf_counter()
+                daemon = BrowserDaemon(*ACCOUNT, url=url, profile_dir=tmp / "profile", health_interval=3600)
+                await daemon.start(p)
+                jobs_server = await daemon.serve("127.0.0.1", 0)
+                port = jobs_server.sockets[0].getsockname()[1]
+                startup = time.perf_counter() - start
+                warm = []
+                try:
+                    for _ in range(jobs):
+                        start = time.perf_counter()
+                        response = await asyncio.to_thread(
+                            submit, "products", port=port, output_dir=str(tmp)
+                        )
+                        if not response["ok"]:
+                            raise RuntimeError(response.get("error"))
+                        warm.append((time.perf_counter() - start, response["ready_seconds"]))
+                finally:
+                    jobs_server.close()
+                    await daemon.close()
+        finally:
+            server.shutdown()
+
+    print(f"cold job (launch+login)   {sum(cold) / len(cold):6.2f}s avg over {jobs}")
+    print(f"daemon start (once)       {startup:6.2f}s")
+    print(f"warm job via daemon       {sum(t for t, _ in warm) / len(warm):6.2f}s avg over {jobs}")
+    print(f"warm readiness check      {max(r for _, r in warm) * 1000:6.1f}ms max")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--categories", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.jobs, args.latency, args.categories, args.rows))
@@ -0,0 +1,81 @@
+"""Micro-benchmark for :mod:`sales_analysis.dataset_parser`.
+
+Builds synthetic SSV and XML sales payloads, writes them to a temporary
+file and measures rows/s and peak Python memory for the streaming row
+iterator, the columnar reader and a whole-tree ``ElementTree`` baseline.
+
+Usage::
+
+    python -m benchmarks.bench_dataset_parser --rows 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.fixtures import DETAIL_COLUMNS, make_detail_rows
+from mock_portal.datasets import to_ssv, to_xml
+from sales_analysis.dataset_parser import iter_rows, np, read_columns
+
+
+def typed_rows(count: int) -> list[list]:
+    return [[code, name, int(qty), int(amt), float(ratio)] for code, name, qty, amt, ratio in make_detail_rows(count)]
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    # 메모리는 tracemalloc 오버헤드가 시간에 섞이지 않도록 별도 실행으로 측정
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {count:>8} rows  {elapsed:7.3f}s  {count / elapsed:10.0f} rows/s  peak {peak / 1e6:7.1f} MB")
+
+
+def count_rows(path: str) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for _ in iter_rows(f))
+
+
+def count_columns(path: str) -> int:
+    with open(path, "rb") as f:
+        columns = read_columns(f)
+    return len(next(iter(columns.values())))
+
+
+def count_etree(path: str) -> int:
+    root = ET.parse(path).getroot()
+    return sum(1 for el in root.iter() if el.tag.endswith("}Row"))
+
+
+def run(rows: int) -> None:
+    datasets = {"dsDetail": (DETAIL_COLUMNS, typed_rows(rows))}
+    payloads = {"ssv": to_ssv(datasets), "xml": to_xml(datasets)}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, payload in payloads.items():
+            path = os.path.join(tmp, f"payload.{fmt}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            print(f"[{fmt}] {os.path.getsize(path) / 1e6:.1f} MB")
+            measure(f"{fmt} iter_rows", lambda: count_rows(path))
+            if np is not None:
+                measure(f"{fmt} read_columns", lambda: count_columns(path))
+            if fmt == "xml":
+                measure("xml ElementTree.parse", lambda: count_etree(path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,85 @@
+"""Direct HTTP extraction against the local mock portal.
+
+Logs in once through the browser (:func:`async_pipeline.login.perform_login`),
+hands the context's cookies to a :class:`~sales_analysis.direct_client.DirectSalesClient`
+and replays the category list and every detail transaction for each
+``--concurrency`` value. The browser stays idle during extraction. Compare
+with the ``extraction`` stage of ``bench_e2e`` on the same settings.
+
+Usage::
+
+    python -m benchmarks.bench_direct --categories 50 --rows 200 --latency 0.05 --concurrency 1 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from async_pipeline.login import perform_login
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import DEPLOY_PREFIX, portal_handler, start_server
+from sales_analysis.direct_client import direct_client_from_context_async
+
+ACCOUNT = ("store01", "pw01")
+WINDOW = ("2024-05-01", "2024-05-31")
+
+
+async def login_cookies_client(url: str, max_connections: int):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            page = await browser.new_page()
+            if not await perform_login(page, *ACCOUNT, url=url):
+                raise RuntimeError("로그인 실패")
+            cfg = {"direct_client": {"max_connections": max_connections}}
+            return await direct_client_from_context_async(page.context, url, cfg)
+        finally:
+            await browser.close()
+
+
+def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        write_portal_fixtures(tmp, args.categories, args.rows)
+        handler = portal_handler(fixture_dir=Path(tmp), latency=args.latency, accounts=dict([ACCOUNT]))
+        server = start_server(handler=handler)
+        try:
+            client = asyncio.run(login_cookies_client(f"{server.url}{DEPLOY_PREFIX}/index.html", max(args.concurrency)))
+            results = []
+            for concurrency in args.concurrency:
+                start = time.perf_counter()
+                rows = sum(len(r) for _, r in client.iter_categories(*WINDOW, concurrency=concurrency))
+                seconds = time.perf_counter() - start
+                results.append({"concurrency": concurrency, "seconds": round(seconds, 3), "rows": rows})
+                print(f"concurrency {concurrency:>3}  {seconds:7.2f}s  {rows / seconds:9.1f} rows/s")
+                if rows != args.categories * args.rows:
+                    print(f"❌ {rows} rows extracted, expected {args.categories * args.rows}")
+            stats = client.pool.report()
+            client.pool.close()
+        finally:
+            server.shutdown()
+    return {"settings": {k: v for k, v in vars(args).items() if k != "json"}, "runs": results, "pool": stats}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--categories", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per transaction")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--json", metavar="PATH", help="write the timings as JSON")
+    args = parser.parse_args()
+    report = run(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
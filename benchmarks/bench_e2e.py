@@ -0,0 +1,191 @@
+"""End-to-end per-stage timings against the local mock portal.
+
+Generates ``--categories`` × ``--rows`` sales rows, serves them with the
+mock portal behind one account and runs the async pipeline on a fresh
+browser ``--runs`` times:
+
+- ``launch``: Chromium start and a new context (request policy and popup
+  watcher as configured)
+- ``login``: :func:`async_pipeline.login.perform_login`
+- ``popups``: :func:`async_pipeline.popups.process_popups_once` for the
+  popups opened after login (``--popups``, none when given empty)
+- ``navigation``: :func:`async_pipeline.navigation.navigate_sales_ratio`
+- ``extraction``: :func:`async_pipeline.extraction.run_category_pipeline`
+
+``--ui`` drives the screen by clicks instead of the form driver and
+``--wait-mode legacy`` brings back the fixed waits, for comparison. Nothing
+touches the live portal. ``--json`` writes the timings with the run
+settings.
+
+Usage::
+
+    python -m benchmarks.bench_e2e --runs 3 --categories 20 --rows 100 --latency 0.05
+    python -m benchmarks.bench_e2e --popups notice remote_work overlay --no-watch
+    python -m benchmarks.bench_e2e --ui --wait-mode legacy
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from async_pipeline.common import setup_dialog_handler
+from async_pipeline.extraction import run_category_pipeline
+from async_pipeline.login import perform_login
+from async_pipeline.navigation import navigate_sales_ratio
+from async_pipeline.popups import process_popups_once
+from async_pipeline.session import new_context
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import DEPLOY_PREFIX, POPUP_KINDS, SALES_RATIO_MENU_ID, portal_handler, start_server
+from sales_analysis.category_pipeline import CategorySink
+from sales_analysis.navigate_sales_ratio import SALES_RATIO_MENU
+from utils import (
+    RequestPolicy,
+    configure_form_driver,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_transaction_watch,
+    configure_waits,
+    reset_waits,
+    wait_report,
+)
+
+ACCOUNT = ("store01", "pw01")
+STAGES = ["launch", "login", "popups", "navigation", "extraction"]
+
+
+class CountingSink(CategorySink):
+    def __init__(self):
+        self.categories = 0
+        self.rows = 0
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        self.categories += 1
+        self.rows += len(rows)
+
+
+async def run_once(p, url: str, policy) -> dict:
+    timings = {}
+    sink = CountingSink()
+    mark = time.perf_counter()
+
+    def lap(stage: str) -> None:
+        nonlocal mark
+        now = time.perf_counter()
+        timings[stage] = now - mark
+        mark = now
+
+    reset_waits()
+    browser = await p.chromium.launch()
+    try:
+        context = await new_context(browser, policy)
+        page = await context.new_page()
+        setup_dialog_handler(page)
+        lap("launch")
+        if not await perform_login(page, *ACCOUNT, url=url):
+            raise RuntimeError("로그인 실패")
+        lap("login")
+        if not await process_popups_once(page, force=True):
+            raise RuntimeError("팝업 처리 실패")
+        lap("popups")
+        await navigate_sales_ratio(page)
+        lap("navigation")
+        await run_category_pipeline(page, [sink])
+        lap("extraction")
+    finally:
+        await browser.close()
+    waits = wait_report()
+    return {
+        "seconds": timings,
+        "categories": sink.categories,
+        "rows": sink.rows,
+        "waiting": waits["waiting"],
+        "working": waits["working"],
+    }
+
+
+async def run(args) -> dict:
+    cfg = {"popup_watch": {"enabled": not args.no_watch}}
+    cfg["waits"] = {"mode": args.wait_mode}
+    cfg["form_driver"] = {"enabled": not args.ui, "menu_ids": {SALES_RATIO_MENU: SALES_RATIO_MENU_ID}}
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
+    policy = RequestPolicy(sizes_path=None) if args.block else None
+    with tempfile.TemporaryDirectory() as tmp:
+        write_portal_fixtures(tmp, args.categories, args.rows)
+        handler = portal_handler(
+            fixture_dir=Path(tmp),
+            latency=args.latency,
+            page_latency=args.page_latency,
+            accounts=dict([ACCOUNT]),
+            popups=args.popups,
+            popup_delay=args.popup_delay,
+        )
+        server = start_server(handler=handler)
+        url = f"{server.url}{DEPLOY_PREFIX}/index.html"
+        try:
+            async with async_playwright() as p:
+                runs = [await run_once(p, url, policy) for _ in range(args.runs)]
+        finally:
+            server.shutdown()
+
+    expected = args.categories * args.rows
+    for i, r in enumerate(runs, 1):
+        if r["rows"] != expected:
+            print(f"❌ run {i}: {r['rows']} rows extracted, expected {expected}")
+    summary = {}
+    for stage in STAGES + ["total"]:
+        if stage == "total":
+            values = [sum(r["seconds"].values()) for r in runs]
+        else:
+            values = [r["seconds"][stage] for r in runs]
+        stats = {"mean": statistics.fmean(values), "min": min(values), "max": max(values)}
+        summary[stage] = {k: round(v, 3) for k, v in stats.items()}
+        print(f"{stage:<11} {stats['mean']:7.2f}s avg  (min {stats['min']:.2f}s, max {stats['max']:.2f}s)")
+    total_rows = sum(r["rows"] for r in runs)
+    extraction = sum(r["seconds"]["extraction"] for r in runs)
+    if extraction:
+        print(f"extraction  {total_rows / extraction:7.1f} rows/s")
+    waiting = sum(r["waiting"] for r in runs)
+    working = sum(r["working"] for r in runs)
+    print(f"waiting     {waiting / len(runs):7.2f}s avg, working {working / len(runs):.2f}s avg ({args.wait_mode})")
+    return {
+        "settings": {k: v for k, v in vars(args).items() if k != "json"},
+        "stages": summary,
+        "runs": runs,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per transaction")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="seconds per static file")
+    parser.add_argument("--popups", nargs="*", default=["notice", "remote_work"], choices=POPUP_KINDS)
+    parser.add_argument("--popup-delay", type=int, default=200, help="ms between popups")
+    parser.add_argument("--no-watch", action="store_true", help="disable the popup watcher")
+    parser.add_argument("--wait-mode", choices=["adaptive", "legacy"], default="adaptive")
+    parser.add_argument("--ui", action="store_true", help="click through the UI instead of the form driver")
+    parser.add_argument("--block", action="store_true", help="install the default request policy")
+    parser.add_argument("--json", metavar="PATH", help="write the timings as JSON")
+    args = parser.parse_args()
+    report = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
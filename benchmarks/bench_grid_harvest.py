@@ -0,0 +1,59 @@
+"""Compare the per-row locator loop with :func:`harvest_grid`.
+
+Usage::
+
+    python -m benchmarks.bench_grid_harvest --sizes 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.fixtures import grid_html, make_detail_rows
+from sales_analysis.grid_harvester import DETAIL_ROW_SELECTOR, harvest_grid, row_text
+
+
+def per_row_loop(page) -> list[str]:
+    """Previous implementation: one ``inner_text`` round-trip per row."""
+    details = page.locator(DETAIL_ROW_SELECTOR)
+    texts = []
+    for j in range(details.count()):
+        texts.append(details.nth(j).inner_text().replace("\n", "\t").strip())
+    return texts
+
+
+def bulk_harvest(page) -> list[str]:
+    return [row_text(r) for r in harvest_grid(page)]
+
+
+def run(sizes: list[int], headless: bool = True) -> None:
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        page = browser.new_page()
+        for size in sizes:
+            page.set_content(grid_html(make_detail_rows(size)))
+            results = {}
+            for name, func in (("per_row_loop", per_row_loop), ("harvest_grid", bulk_harvest)):
+                start = time.perf_counter()
+                texts = func(page)
+                elapsed = time.perf_counter() - start
+                results[name] = texts
+                print(f"{size:>6} rows  {name:<13} {elapsed:8.3f}s  {size / elapsed:10.0f} rows/s")
+            if results["per_row_loop"] != results["harvest_grid"]:
+                print("⚠️ 결과 불일치")
+        browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    run(args.sizes, headless=not args.headed)
@@ -0,0 +1,79 @@
+"""Multi-store orchestrator throughput against the mock portal.
+
+Serves generated fixtures behind ``--stores`` fake accounts (plus one with a
+wrong password to show failure isolation) and runs the full login, popup,
+navigation and extraction flow with several concurrency caps. Prints a
+stores/hour figure per cap.
+
+Usage::
+
+    python -m benchmarks.bench_multi_store --stores 6 --concurrency 1 3 6
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from async_pipeline.orchestrator import run_stores
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import MockPortalHandler, start_server
+
+
+def run(stores: int, categories: int, rows: int, latency: float, caps: list[int]) -> int:
+    accounts = {f"store{i:02d}": f"pw{i:02d}" for i in range(stores)}
+    entries = [{"store": user, "login_id": user, "login_pw": pw} for user, pw in accounts.items()]
+    entries.append({"store": "bad_login", "login_id": "store00", "login_pw": "wrong"})
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        fixtures = tmp / "fixtures"
+        fixtures.mkdir()
+        write_portal_fixtures(fixtures, categories, rows)
+        handler = type(
+            "BenchHandler",
+            (MockPortalHandler,),
+            {"fixture_dir": fixtures, "latency": latency, "accounts": accounts, "sessions": {}},
+        )
+        server = start_server(handler=handler)
+        try:
+            for cap in caps:
+                out = tmp / f"cap{cap}"
+                report = asyncio.run(
+                    run_stores(
+                        entries,
+                        concurrency=cap,
+                        url=f"{server.url}/index.html",
+                        output_root=out,
+                        warehouse_path=out / "warehouse.db",
+                        force=True,
+                    )
+                )
+                statuses = {r["store"]: r["status"] for r in report["stores"]}
+                ok = sum(1 for s in statuses.values() if s == "ok")
+                isolated = statuses["bad_login"] != "ok" and ok == stores
+                print(
+                    f"concurrency={cap:<3} {report['seconds']:7.1f}s  {report['stores_per_hour']:8.1f} stores/hour  "
+                    f"ok {ok}/{stores}  bad login isolated: {'yes' if isolated else 'NO'}"
+                )
+                if not isolated:
+                    return 1
+        finally:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stores", type=int, default=6)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 3, 6])
+    args = parser.parse_args()
+    sys.exit(run(args.stores, args.categories, args.rows, args.latency, args.concurrency))
@@ -0,0 +1,83 @@
+"""Wall-clock benchmark for :func:`async_pipeline.extraction.extract_shards`.
+
+Generates ``--categories`` category fixtures, serves them with a fixed
+per-transaction latency and extracts all categories with 1, 2, 4, ... worker
+pages opened in the first page's context, checking that every run returns
+the same rows in the same order.
+
+Usage::
+
+    python -m benchmarks.bench_parallel_extraction --categories 24 --latency 0.3 --pages 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from async_pipeline.extraction import extract_shards
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import MockPortalHandler, start_server
+
+
+async def run(categories: int, rows: int, latency: float, pages: list[int], pause_ms: int) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        codes = write_portal_fixtures(Path(tmp), categories, rows)
+        handler = type("BenchHandler", (MockPortalHandler,), {"fixture_dir": Path(tmp), "latency": latency})
+        server = start_server(handler=handler)
+        today = datetime.date.today().isoformat()
+        baseline = None
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch()
+                page = await browser.new_page()
+                await page.goto(f"{server.url}/sales_ratio.html")
+                for count in pages:
+                    start = time.perf_counter()
+                    result = await extract_shards(
+                        page.context,
+                        page.url,
+                        codes,
+                        today,
+                        today,
+                        concurrency=count,
+                        navigate=False,
+                        pause_ms=pause_ms,
+                    )
+                    elapsed = time.perf_counter() - start
+                    baseline = baseline or elapsed
+                    cells = [(code, [r["cells"] for r in detail]) for code, detail in result]
+                    if count == pages[0]:
+                        expected = cells
+                    status = "ok" if cells == expected else "MISMATCH"
+                    print(
+                        f"pages={count:<3} {elapsed:7.2f}s  speedup {baseline / elapsed:5.2f}x  "
+                        f"{len(codes) / elapsed:6.2f} categories/s  {status}"
+                    )
+                    if status != "ok":
+                        return 1
+                await browser.close()
+        finally:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--categories", type=int, default=24)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pause-ms", type=int, default=200)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.categories, args.rows, args.latency, args.pages, args.pause_ms)))
@@ -0,0 +1,235 @@
+"""Latency and success rate of every popup strategy on local fixtures.
+
+The fixtures in ``mock_portal/static/popups/`` reproduce the portal's popup
+shapes: stacked and sequential Nexacro popups (``btn_close:icontext``), a
+popup inside nested frames, a left-over ``nexamodaloverlay``, a close
+button guarded by a native ``confirm()``, Chrome's "dialog blocked" notice,
+plain HTML notice layers and a page without popups. Every fixture × strategy
+pair runs ``--repeat`` times on a fresh page. A run succeeds when no fixture
+popup is visible in any frame once the strategy returns.
+
+Strategies: ``close_popups``, ``close_detected_popups``,
+``close_all_popups_event``, ``close_all_popups`` and ``popup_watch`` (the
+init-script watcher followed by the settled wait).
+
+``--json`` writes the results for regression tracking; ``--baseline``
+compares against an earlier ``--json`` file and exits with 1 when a pair got
+less successful, or more than ``--tolerance`` slower at the median.
+
+Usage::
+
+    python -m benchmarks.bench_popups --repeat 5 --json popup_bench.json
+    python -m benchmarks.bench_popups --baseline popup_bench.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.sync_api import sync_playwright
+
+from browser import popup_utils
+from browser.popup_handler import close_detected_popups
+from browser.popup_handler_utility import close_all_popups, close_all_popups_event
+from mock_portal.server import start_server
+from utils import common
+from utils.popup_watch import wait_for_popups_settled, watch_popups
+
+FIXTURES = {
+    "nexacro_popups": "두 Nexacro 팝업이 겹쳐 열림",
+    "sequential_popups": "앞 팝업을 닫으면 300ms 뒤 다음 팝업",
+    "nested_frames": "iframe 두 단계 안의 팝업",
+    "modal_overlay": "팝업 뒤에 남는 nexamodaloverlay",
+    "native_dialog": "닫기 버튼이 confirm() 을 띄움",
+    "dialog_blocked": "'대화 차단' 안내와 확인 버튼",
+    "layer_notice": "일반 HTML 공지 레이어",
+    "no_popup": "팝업 없음 (오버헤드 측정)",
+}
+
+
+def _close_popups(page) -> bool:
+    closed, detected = common.close_popups(page, force=True)
+    return closed == detected
+
+
+def _popup_watch(page) -> bool:
+    return wait_for_popups_settled(page) == []
+
+
+# 이름 → (goto 전에 호출할 준비 함수, 측정할 전략)
+STRATEGIES = {
+    "close_popups": (None, _close_popups),
+    "close_detected_popups": (None, close_detected_popups),
+    "close_all_popups_event": (None, close_all_popups_event),
+    "close_all_popups": (None, close_all_popups),
+    "popup_watch": (watch_popups, _popup_watch),
+}
+
+_REMAINING_JS = "() => window.__popupFixture ? window.__popupFixture.remaining() : 0"
+
+
+def reset_state() -> None:
+    """Clear the module globals the strategies keep between calls."""
+    common._closed_popups = 0
+    common._popup_failure_count = 0
+    common.popup_handled = False
+    # 같은 문구의 다이얼로그를 무시하는 중복 방지 기록
+    popup_utils._last_dialog_message = None
+
+
+def remaining_popups(page) -> int:
+    total = 0
+    for frame in page.frames:
+        try:
+            total += frame.evaluate(_REMAINING_JS)
+        except Exception:
+            continue
+    return total
+
+
+def run_once(context, url: str, strategy: str, timeout_ms: int) -> dict:
+    prepare, run = STRATEGIES[strategy]
+    reset_state()
+    page = context.new_page()
+    page.set_default_timeout(timeout_ms)
+    try:
+        if prepare is not None:
+            prepare(page)
+        page.goto(url)
+        page.wait_for_function("() => window.__popupFixture && window.__popupFixture.ready")
+        start = time.perf_counter()
+        error = None
+        try:
+            returned = bool(run(page))
+        except Exception as e:
+            returned = False
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        remaining = remaining_popups(page)
+    finally:
+        page.close()
+    return {"ms": elapsed * 1000, "returned": returned, "remaining": remaining, "error": error}
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def summarize(fixture: str, strategy: str, runs: list[dict]) -> dict:
+    times = [r["ms"] for r in runs]
+    successes = sum(1 for r in runs if r["remaining"] == 0 and r["error"] is None)
+    return {
+        "fixture": fixture,
+        "strategy": strategy,
+        "runs": len(runs),
+        "success_rate": round(successes / len(runs), 3),
+        "returned_true": sum(r["returned"] for r in runs),
+        "latency_ms": {
+            "mean": round(statistics.fmean(times), 1),
+            "p50": round(statistics.median(times), 1),
+            "p95": round(percentile(times, 0.95), 1),
+            "max": round(max(times), 1),
+        },
+        "errors": sorted({r["error"] for r in runs if r["error"]}),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run(fixtures: list[str], strategies: list[str], repeat: int, headed: bool, timeout_ms: int, delay: int) -> dict:
+    server = start_server()
+    results = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=not headed)
+            context = browser.new_context()
+            for fixture in fixtures:
+                url = f"{server.url}/popups/{fixture}.html?delay={delay}"
+                for strategy in strategies:
+                    runs = [run_once(context, url, strategy, timeout_ms) for _ in range(repeat)]
+                    summary = summarize(fixture, strategy, runs)
+                    results.append(summary)
+                    latency = summary["latency_ms"]
+                    print(
+                        f"{fixture:<18} {strategy:<23} 성공 {summary['success_rate'] * 100:5.1f}%"
+                        f"  p50 {latency['p50']:8.1f} ms  p95 {latency['p95']:8.1f} ms"
+                        + (f"  오류 {summary['errors'][0]}" if summary["errors"] else "")
+                    )
+            version = browser.version
+            browser.close()
+    finally:
+        server.shutdown()
+    return {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "browser": version,
+            "repeat": repeat,
+            "delay_ms": delay,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return one line per fixture × strategy pair that regressed."""
+    before = {(r["fixture"], r["strategy"]): r for r in baseline["results"]}
+    regressions = []
+    for r in report["results"]:
+        old = before.get((r["fixture"], r["strategy"]))
+        if old is None:
+            continue
+        key = f"{r['fixture']}/{r['strategy']}"
+        if r["success_rate"] < old["success_rate"]:
+            regressions.append(f"{key}: 성공률 {old['success_rate']:.0%} → {r['success_rate']:.0%}")
+        new_p50, old_p50 = r["latency_ms"]["p50"], old["latency_ms"]["p50"]
+        # 수 ms 단위의 흔들림은 회귀로 보지 않는다
+        if new_p50 > old_p50 * (1 + tolerance) and new_p50 - old_p50 > 50:
+            regressions.append(f"{key}: p50 {old_p50:.1f} ms → {new_p50:.1f} ms")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", nargs="+", choices=list(FIXTURES), default=list(FIXTURES))
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--delay", type=int, default=300, help="ms before the next sequential popup")
+    parser.add_argument("--timeout", type=int, default=5000, help="Playwright timeout per action (ms)")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="earlier --json output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown ratio")
+    args = parser.parse_args()
+
+    report = run(args.fixtures, args.strategies, args.repeat, args.headed, args.timeout, args.delay)
+    if args.json == "-":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"❌ 회귀: {line}")
+        if regressions:
+            sys.exit(1)
+        print("✅ 기준 대비 회귀 없음")
@@ -0,0 +1,85 @@
+"""Startup-to-first-row time with and without the session cache.
+
+Runs against the mock portal with one account: a cold start (full login),
+a warm start (restored ``storage_state``) and a start with an expired
+session (probe fails, full login again). Each start goes through session,
+navigation, search and the first category's detail rows.
+
+Usage::
+
+    python -m benchmarks.bench_session_cache --latency 0.2
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.async_api import async_playwright
+
+from async_pipeline.extraction import _category_codes, extract_category, search, set_date_range
+from async_pipeline.navigation import navigate_sales_ratio
+from async_pipeline.session import start_session
+from benchmarks.fixtures import write_portal_fixtures
+from mock_portal.server import MockPortalHandler, start_server
+from utils import SessionCache
+
+ACCOUNT = ("store01", "pw01")
+
+
+async def first_row(browser, url: str, cache: SessionCache) -> tuple[float, int]:
+    start = time.perf_counter()
+    page = await start_session(browser, *ACCOUNT, url=url, cache=cache)
+    if page is None:
+        raise RuntimeError("로그인 실패")
+    try:
+        await navigate_sales_ratio(page)
+        today = datetime.date.today().isoformat()
+        await set_date_range(page, today, today, pause_ms=0)
+        await search(page, pause_ms=0)
+        codes = await _category_codes(page, None)
+        rows = await extract_category(page, codes[0], pause_ms=0)
+        return time.perf_counter() - start, len(rows)
+    finally:
+        await page.context.close()
+
+
+async def run(latency: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_portal_fixtures(tmp, 4, 100)
+        handler = type(
+            "BenchHandler",
+            (MockPortalHandler,),
+            {"fixture_dir": tmp, "latency": latency, "accounts": dict([ACCOUNT]), "sessions": {}},
+        )
+        server = start_server(handler=handler)
+        url = f"{server.url}/index.html"
+        cache = SessionCache(tmp / "sessions")
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch()
+                for label in ("cold (full login)", "warm (restored session)", "expired session"):
+                    if label == "expired session":
+                        # 서버 쪽 세션을 지워 저장된 쿠키를 만료시킨다
+                        handler.sessions.clear()
+                    elapsed, rows = await first_row(browser, url, cache)
+                    print(f"{label:<26} {elapsed:6.2f}s to first {rows} rows")
+                await browser.close()
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(run(args.latency))
@@ -0,0 +1,58 @@
+"""Benchmark :func:`read_virtual_grid` on a 20k-row virtualized grid.
+
+The fixture ``mock_portal/static/virtual_grid.html`` renders only the
+visible rows, like a Nexacro grid. A plain :func:`harvest_grid` read is
+shown for comparison to make the undercount visible.
+
+Usage::
+
+    python -m benchmarks.bench_virtual_grid --rows 20000 --delay 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.sync_api import sync_playwright
+
+from mock_portal.server import start_server
+from sales_analysis.grid_harvester import harvest_grid, read_virtual_grid
+
+
+def run(rows: int, delay: int, headless: bool = True) -> None:
+    server = start_server()
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            page = browser.new_page()
+            page.goto(f"{server.url}/virtual_grid.html?rows={rows}&delay={delay}")
+
+            visible = harvest_grid(page)
+            print(f"harvest_grid       {len(visible):>6} rows (보이는 행만)")
+
+            start = time.perf_counter()
+            result = read_virtual_grid(page)
+            elapsed = time.perf_counter() - start
+            print(
+                f"read_virtual_grid  {len(result):>6} rows  {elapsed:7.2f}s  "
+                f"{len(result) / elapsed:8.0f} rows/s"
+            )
+            if len(result) != rows:
+                print(f"⚠️ 누락된 행 {rows - len(result)}개")
+            browser.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--delay", type=int, default=16, help="fixture render delay in ms")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    run(args.rows, args.delay, headless=not args.headed)
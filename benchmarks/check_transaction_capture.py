@@ -0,0 +1,57 @@
+"""Run :func:`capture_category_details` against the mock portal fixtures.
+
+Usage::
+
+    python -m benchmarks.check_transaction_capture
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from playwright.sync_api import sync_playwright
+
+from mock_portal.server import FIXTURE_DIR, start_server
+from sales_analysis.transaction_capture import (
+    capture_category_details,
+    parse_transaction_payload,
+    pick_dataset,
+)
+
+
+def expected_details() -> list[dict]:
+    categories = pick_dataset(
+        parse_transaction_payload((FIXTURE_DIR / "category_list.ssv").read_text(encoding="utf-8"))
+    )
+    result = []
+    for category in categories:
+        code = category["MID_CD"]
+        path = next(FIXTURE_DIR.glob(f"detail_{code}.*"))
+        rows = pick_dataset(parse_transaction_payload(path.read_text(encoding="utf-8")))
+        result.append({"category": code, "rows": rows})
+    return result
+
+
+def main() -> int:
+    server = start_server()
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            page = browser.new_page()
+            page.goto(f"{server.url}/sales_ratio.html")
+            search = page.locator("div.nexacontentsbox:has-text('조 회')").first
+            captured = capture_category_details(page, search.click)
+            browser.close()
+    finally:
+        server.shutdown()
+
+    ok = captured == expected_details()
+    print("✅ 캡처 결과가 기록된 응답과 일치" if ok else f"❌ 불일치: {captured}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
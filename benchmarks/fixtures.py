@@ -0,0 +1,84 @@
+"""Synthetic Nexacro-like fixtures used by the benchmarks."""
+
+import random
+
+DETAIL_COLUMNS = ["상품코드", "상품명", "매출수량", "매출금액", "구성비"]
+
+
+def make_detail_rows(count: int, seed: int = 0) -> list[list[str]]:
+    """Return ``count`` fake product rows for the detail grid."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        qty = rnd.randint(0, 500)
+        rows.append(
+            [
+                f"88{i:011d}",
+                f"테스트상품 {i}",
+                str(qty),
+                str(qty * rnd.randint(500, 5000)),
+                f"{rnd.random() * 10:.2f}",
+            ]
+        )
+    return rows
+
+
+def grid_html(rows: list[list[str]], grid_id: str = "gdDetail") -> str:
+    """Render ``rows`` as a Nexacro style grid with ``gridrow_``/``cell_`` divs."""
+    parts = [f'<div id="{grid_id}">']
+    for r, row in enumerate(rows):
+        parts.append(f'<div class="gridrow_{r}" id="{grid_id}.body.gridrow_{r}">')
+        for c, value in enumerate(row):
+            parts.append(f'<div class="cell_0_{c}"><div>{value}</div></div>')
+        parts.append("</div>")
+    parts.append("</div>")
+    return "<html><body>" + "".join(parts) + "</body></html>"
+
+
+def write_portal_fixtures(directory, categories: int, rows: int) -> list[str]:
+    """Write ``category_list.ssv`` and one ``detail_<code>.ssv`` per category.
+
+    The files follow the mock portal fixture layout (``dsList``/``dsDetail``)
+    and the category codes are returned in grid order.
+    """
+    from pathlib import Path
+
+    from mock_portal.datasets import to_ssv
+
+    directory = Path(directory)
+    codes = [f"{i + 1:03d}" for i in range(categories)]
+    category_rows = [[code, f"중분류 {code}", 0] for code in codes]
+    (directory / "category_list.ssv").write_text(
+        to_ssv({"dsList": (["MID_CD", "MID_NM", "SALE_AMT"], category_rows)}), encoding="utf-8"
+    )
+    for i, code in enumerate(codes):
+        detail = [[f"{code}{r[0][5:]}"] + r[1:] for r in make_detail_rows(rows, seed=i)]
+        (directory / f"detail_{code}.ssv").write_text(
+            to_ssv({"dsDetail": (DETAIL_COLUMNS, detail)}), encoding="utf-8"
+        )
+    return codes
+
+
+def write_static_bundle(directory, files: int, size_kb: int) -> str:
+    """Write a fake Nexacro deploy under ``websrc/deploy/`` and return the page path.
+
+    ``index.html`` loads ``files`` scripts of about ``size_kb`` KB each,
+    half as ``.js`` and half as ``.xfdl.js`` forms, plus one stylesheet.
+    """
+    from pathlib import Path
+
+    deploy = Path(directory) / "websrc" / "deploy"
+    (deploy / "lib").mkdir(parents=True, exist_ok=True)
+    (deploy / "form").mkdir(exist_ok=True)
+    filler = "/* " + "x" * 1020 + " */\n"
+    tags = ['<link rel="stylesheet" href="theme.css">']
+    (deploy / "theme.css").write_text(".nexatextitem { color: #333; }\n" + filler * size_kb, encoding="utf-8")
+    for i in range(files):
+        name = f"lib/runtime_{i:03d}.js" if i % 2 == 0 else f"form/STMB{i:03d}.xfdl.js"
+        (deploy / name).write_text("window.__loaded = (window.__loaded || 0) + 1;\n" + filler * size_kb, encoding="utf-8")
+        tags.append(f'<script src="{name}"></script>')
+    (deploy / "index.html").write_text(
+        "<html><head>" + "".join(tags) + "</head><body><div id='topMenu'>ready</div></body></html>",
+        encoding="utf-8",
+    )
+    return "/websrc/deploy/index.html"
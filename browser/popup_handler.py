@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import datetime
 import time
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils import common as utils
+from utils.popup_scan import BROAD_SCAN_RULES, candidate_selector, scan_popups
 from popup_text_handler import handle_popup_by_text
 from . import popup_utils
 
@@ -115,89 +116,56 @@ def setup_dialog_handler(page: Page, auto_accept: bool = True) -> None:
 
 
 
+def click_scanned(page: Page, candidate: dict, settle_ms: int) -> bool:
+    """Click a candidate from :func:`utils.popup_scan.scan_popups`.
+
+    A window opened by the click is closed. Returns ``False`` if the
+    candidate is already gone (an earlier click closed its popup); click
+    errors are raised.
+    """
+    frame = candidate["frame"]
+    btn = frame.locator(candidate_selector(candidate))
+    if not btn.is_visible():
+        return False
+    popup_utils.add_safe_accept_once(page)
+    try:
+        with page.expect_popup(timeout=500) as pop:
+            btn.click(timeout=1000)
+        pop.value.close()
+    except PlaywrightTimeoutError:
+        # 새 창 없이 레이어만 닫힌 경우
+        pass
+    frame.wait_for_timeout(settle_ms)
+    return True
+
+
 def close_detected_popups(page: Page, loops: int = 2, wait_ms: int = 500) -> bool:
-    """Close visible popups using event based waits."""
+    """Close visible popups found by the one-shot scanner."""
     register_dialog_handler(page)
-    selectors = [
-        "text=닫기",
-        "button:has-text('닫기')",
-        "a:has-text('닫기')",
-        "[class*='close']",
-        "[id*='close']",
-        "div[id*='btn_close']",
-        "button:has-text('✕')",
-        "text=✕",
-    ]
 
     loops = max(2, loops)
     closed_any = False
     for _ in range(loops):
-        found = False
         if handle_popup_by_text(page):
-            found = True
             closed_any = True
             time.sleep(wait_ms / 1000)
             continue
-        for frame in [page, *page.frames]:
-            if hasattr(frame, "is_detached") and frame.is_detached():
+        found = False
+        for candidate in scan_popups(page, BROAD_SCAN_RULES)["candidates"]:
+            try:
+                if click_scanned(page, candidate, 3000):
+                    utils.log("⏱️ 팝업 닫기 후 3초간 안정화 대기")
+                    found = True
+                    closed_any = True
+            except Exception:
                 continue
-            for sel in selectors:
-                try:
-                    locs = frame.locator(sel)
-                except Exception as e:
-                    utils.log(f"선택자 오류({sel}): {e}")
-                    continue
-                for i in range(locs.count()):
-                    btn = locs.nth(i)
-                    if not btn.is_visible():
-                        continue
-                    try:
-                        popup_utils.add_safe_accept_once(frame)
-                        with frame.expect_popup(timeout=500) as pop:
-                            btn.click(timeout=0)
-                        if pop.value:
-                            pop.value.close()
-                        frame.wait_for_timeout(3000)
-                        utils.log("⏱️ 팝업 닫기 후 3초간 안정화 대기")
-                        found = True
-                        closed_any = True
-                    except Exception:
-                        continue
         if not found:
             break
         time.sleep(wait_ms / 1000)
 
-    if not closed_any:
-        # 팝업 버튼 탐색 실패 시 추가로 div/button 검색 시도
-        alt_selectors = ["div[id*='btn_close']", "div:has-text('닫기')", "button:has-text('닫기')"]
-        for sel in alt_selectors:
-            try:
-                locs = page.locator(sel)
-            except Exception:
-                continue
-            for i in range(locs.count()):
-                btn = locs.nth(i)
-                if btn.is_visible():
-                    try:
-                        btn.click(timeout=0)
-                        closed_any = True
-                        break
-                    except Exception:
-                        continue
-            if closed_any:
-                break
-
-
-    for frame in [page, *page.frames]:
-        for sel in selectors:
-            try:
-                locs = frame.locator(sel)
-            except Exception:
-                continue
-            for i in range(locs.count()):
-                if locs.nth(i).is_visible():
-                    utils.popup_handled = False
-                    return False
+    if scan_popups(page, BROAD_SCAN_RULES)["candidates"]:
+        utils.popup_handled = False
+        return False
     utils.popup_handled = True
     if closed_any:
         utils.log("✅ 팝업 처리 완료")
@@ -3,11 +3,13 @@ from playwright.sync_api import Page, TimeoutError
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import common as utils
+from utils import common as utils
 from .popup_handler import (
     setup_dialog_handler as _setup_dialog_handler,
+    click_scanned,
     register_dialog_handler,
 )
+from utils.popup_scan import BROAD_SCAN_RULES, CONFIRM_SCAN_RULES, scan_popups
 from . import popup_utils
 
 from popup_text_handler import handle_popup_by_text
@@ -22,81 +24,40 @@ def setup_dialog_handler(page: Page, accept: bool = True) -> None:
 
 
 def close_all_popups_event(page: Page, loops: int = 2, wait_ms: int = 1000) -> bool:
-    """Search and close popups using event based waits."""
+    """Close popups found by the one-shot scanner, then press '확인' if none."""
     register_dialog_handler(page)
-    selectors = [
-        "text=닫기",
-        "button:has-text('닫기')",
-        "a:has-text('닫기')",
-        "[class*='close']",
-        "[id*='close']",
-    ]
 
     closed_any = False
     for _ in range(max(2, loops)):
         found = False
-        for sel in selectors:
+        for candidate in scan_popups(page, BROAD_SCAN_RULES)["candidates"]:
             try:
-                locs = page.locator(sel)
-            except Exception as e:
-                utils.log(f"선택자 오류({sel}): {e}")
-                continue
-            for i in range(locs.count()):
-                btn = locs.nth(i)
-                if not btn.is_visible():
-                    continue
-                try:
-                    popup_utils.add_safe_accept_once(page)
-                    with page.expect_popup(timeout=500) as pop:
-                        btn.click(timeout=0)
-                    if pop.value:
-                        pop.value.close()
-                    page.wait_for_timeout(2000)
+                if click_scanned(page, candidate, 2000):
                     found = True
                     closed_any = True
-                except TimeoutError:
-                    utils.log("팝업 이벤트 시간 초과 → 다음으로 진행")
-                except Exception as e:
-                    utils.log(f"닫기 버튼 클릭 실패: {e}")
-                    try:
-                        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                        page.screenshot(path=f"popup_error_{ts}.png")
-                    except Exception:
-                        pass
+            except Exception as e:
+                utils.log(f"닫기 버튼 클릭 실패: {e}")
+                try:
+                    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                    page.screenshot(path=f"popup_error_{ts}.png")
+                except Exception:
+                    pass
         if not found:
             break
         page.wait_for_timeout(wait_ms)
 
     if not closed_any:
-        ok_selectors = ["text=확인", "button:has-text('확인')", "input[value='확인']"]
-        for ok_sel in ok_selectors:
+        for candidate in scan_popups(page, CONFIRM_SCAN_RULES)["candidates"]:
             try:
-                ok_btns = page.locator(ok_sel)
+                if click_scanned(page, candidate, 2000):
+                    break
             except Exception:
                 continue
-            for i in range(ok_btns.count()):
-                btn = ok_btns.nth(i)
-                if btn.is_visible():
-                    try:
-                        btn.click(timeout=0)
-                        page.wait_for_timeout(2000)
-                        found = True
-                        break
-                    except Exception:
-                        continue
-            if found:
-                break
 
     # verify no popups remain
-    for sel in selectors:
-        try:
-            locs = page.locator(sel)
-        except Exception:
-            continue
-        for i in range(locs.count()):
-            if locs.nth(i).is_visible():
-                utils.popup_handled = False
-                return False
+    if scan_popups(page, BROAD_SCAN_RULES)["candidates"]:
+        utils.popup_handled = False
+        return False
     utils.popup_handled = True
     return True
 
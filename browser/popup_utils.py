@@ -1,10 +1,10 @@
 # Utility functions for popup handling
 from playwright.sync_api import Page
-from common import log
 import time
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.common import log
 
 _last_dialog_message: str | None = None
 
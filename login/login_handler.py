@@ -2,10 +2,11 @@ import os
 import sys
 from playwright.sync_api import Page
 from dotenv import load_dotenv
-from browser.popup_handler import is_logged_in
-from common import log
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from browser.popup_handler import is_logged_in
+from utils.common import log, wait
+from utils.transaction_watch import transaction_mark, wait_for_transactions
 
 load_dotenv()
 ID = os.getenv("LOGIN_ID")
@@ -30,17 +31,18 @@ def perform_login(page: Page) -> bool:
         "#mainframe\\.HFrameSet00\\.LoginFrame\\.form\\.div_login\\.form\\.edt_id\\:input",
         ID,
     )
-    page.wait_for_timeout(1000)
+    wait(page, step="login_input")
 
     page.fill(
         "#mainframe\\.HFrameSet00\\.LoginFrame\\.form\\.div_login\\.form\\.edt_pw\\:input",
         PW,
     )
-    page.wait_for_timeout(1000)
+    wait(page, step="login_input")
 
+    mark = transaction_mark(page)
     page.keyboard.press("Enter")
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(2000)
+    wait_for_transactions(page, mark, step="login")
+    wait(page, 2000, step="login_submit")
 
     if is_logged_in(page):
         log("✅ 로그인 성공")
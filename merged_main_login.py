@@ -470,24 +470,30 @@ def perform_login(page: Page) -> bool:
 
 # ----- 메인 실행 흐름 -----
 from order import run_sales_analysis
+from sales_analysis.navigate_sales_ratio import load_config
+from utils import request_policy_from_config
 
 
 def main() -> None:
+    policy = request_policy_from_config(load_config())
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
         page = browser.new_page()
-        if not perform_login(page):
-            browser.close()
-            return
-
-        if not process_popups_once(page):
-            browser.close()
-            return
+        if policy is not None:
+            policy.install(page)
+        try:
+            if not perform_login(page):
+                return
 
-        if popups_handled() and datetime.datetime.today().weekday() == 0:
-            run_sales_analysis(page)
+            if not process_popups_once(page):
+                return
 
-        browser.close()
+            if popups_handled() and datetime.datetime.today().weekday() == 0:
+                run_sales_analysis(page)
+        finally:
+            browser.close()
+            if policy is not None:
+                policy.report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Local stand-in for the BGF store portal used by benchmarks."""
@@ -0,0 +1,56 @@
+"""Build Nexacro SSV/XML transaction payloads for the mock portal."""
+
+from xml.sax.saxutils import escape
+
+RS = "\x1e"
+US = "\x1f"
+NULL = "\x03"
+
+XML_NS = "http://www.nexacroplatform.com/platform/dataset"
+
+
+def _column_type(values: list) -> str:
+    if values and all(isinstance(v, int) for v in values if v is not None):
+        return "INT(10)"
+    if values and all(isinstance(v, (int, float)) for v in values if v is not None):
+        return "BIGDECIMAL(0)"
+    return "STRING(256)"
+
+
+def to_ssv(datasets: dict[str, tuple[list[str], list[list]]], error_code: int = 0) -> str:
+    """Serialize ``{dataset_id: (columns, rows)}`` as an SSV payload."""
+    records = ["SSV:UTF-8", f"ErrorCode:int={error_code}{US}ErrorMsg:string="]
+    for name, (columns, rows) in datasets.items():
+        types = [_column_type([r[i] for r in rows]) for i in range(len(columns))]
+        records.append(f"Dataset:{name}")
+        records.append(US.join(["_RowType_"] + [f"{c}:{t}" for c, t in zip(columns, types)]))
+        for row in rows:
+            records.append(US.join(["N"] + [NULL if v is None else str(v) for v in row]))
+        records.append("")
+    return RS.join(records)
+
+
+def to_xml(datasets: dict[str, tuple[list[str], list[list]]], error_code: int = 0) -> str:
+    """Serialize ``{dataset_id: (columns, rows)}`` as a Nexacro XML payload."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<Root xmlns="{XML_NS}">',
+        "<Parameters>",
+        f'<Parameter id="ErrorCode" type="int">{error_code}</Parameter>',
+        '<Parameter id="ErrorMsg" type="string"></Parameter>',
+        "</Parameters>",
+    ]
+    for name, (columns, rows) in datasets.items():
+        parts.append(f'<Dataset id="{name}"><ColumnInfo>')
+        for i, col in enumerate(columns):
+            col_type, _, size = _column_type([r[i] for r in rows]).partition("(")
+            parts.append(f'<Column id="{col}" type="{col_type}" size="{size.rstrip(")")}"/>')
+        parts.append("</ColumnInfo><Rows>")
+        for row in rows:
+            cols = "".join(
+                f'<Col id="{c}">{escape(str(v))}</Col>' for c, v in zip(columns, row) if v is not None
+            )
+            parts.append(f"<Row>{cols}</Row>")
+        parts.append("</Rows></Dataset>")
+    parts.append("</Root>")
+    return "\n".join(parts)
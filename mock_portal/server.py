@@ -0,0 +1,230 @@
+"""Minimal HTTP stand-in serving the mock portal pages and transactions.
+
+``POST /transaction/<name>`` answers with the recorded payload
+``fixtures/<name>.ssv`` or ``fixtures/<name>.xml``. Everything else is served
+from ``static/``.
+
+When ``accounts`` is set, ``index.html`` requires a login: ``POST /login``
+checks the id/password and sets a session cookie, ``GET /session`` reports
+the logged-in user, and transactions without a valid session get 401.
+Sessions older than ``session_ttl`` seconds count as expired and the page
+shows the portal's "세션이 만료" popup.
+
+After a login the page opens the popups listed in ``popups`` (see
+``POPUP_KINDS``), ``popup_delay`` ms apart, as read from ``GET /config``.
+The pages also carry a small Nexacro object model for the form driver:
+``nexacro.getApplication().mainframe.WorkFrame.form`` with the calendar
+components and ``fn_search``, and ``gfn_openMenu(SALES_RATIO_MENU_ID)`` on
+the application.
+
+``page_latency`` delays every static file like a slow deploy server. The
+pages are also served under ``/websrc/deploy/`` so the URLs match the real
+portal's.
+
+Usage::
+
+    python -m mock_portal.server --port 8765
+    python -m mock_portal.server --account store01:pw01 --categories 30 --rows 200 \
+        --latency 0.1 --popup notice --popup remote_work
+"""
+
+import argparse
+import json
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+FIXTURE_DIR = BASE_DIR / "fixtures"
+
+SESSION_COOKIE = "JSESSIONID"
+
+# 실제 포털 경로와 같은 URL 로도 정적 파일을 제공한다
+DEPLOY_PREFIX = "/websrc/deploy"
+
+# portal_mock.js 가 로그인 후 띄울 수 있는 팝업 종류
+POPUP_KINDS = ["notice", "remote_work", "confirm", "overlay"]
+
+# portal_mock.js 의 gfn_openMenu 가 아는 '중분류별 매출 구성비' 메뉴 id
+SALES_RATIO_MENU_ID = "STMB011_M0"
+
+CONTENT_TYPES = {".ssv": "text/plain; charset=UTF-8", ".xml": "text/xml; charset=UTF-8"}
+
+
+class MockPortalHandler(SimpleHTTPRequestHandler):
+    # 실제 포털처럼 keep-alive 연결을 유지한다
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle 지연(지연 ACK)을 피한다
+    disable_nagle_algorithm = True
+    fixture_dir = FIXTURE_DIR
+    # 트랜잭션 응답 지연(초), 실제 서버 왕복 시간을 흉내낸다
+    latency = 0.0
+    # 로그인 계정 {아이디: 비밀번호}; 비어 있으면 로그인 없이 동작
+    accounts: dict[str, str] = {}
+    # 세션 토큰 → (아이디, 발급 시각) (서버 전체 공유)
+    sessions: dict[str, tuple[str, float]] = {}
+    # 세션 유효 시간(초), 0 이면 만료 없음
+    session_ttl = 0.0
+    # 정적 파일 응답 지연(초)
+    page_latency = 0.0
+    # 로그인 후 띄울 팝업 (POPUP_KINDS) 과 팝업 사이 간격(ms)
+    popups: list[str] = []
+    popup_delay = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(STATIC_DIR), **kwargs)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def translate_path(self, path: str) -> str:
+        if path.startswith(DEPLOY_PREFIX + "/"):
+            path = path[len(DEPLOY_PREFIX):]
+        return super().translate_path(path)
+
+    def find_fixture(self, name: str) -> Path | None:
+        for suffix in CONTENT_TYPES:
+            path = self.fixture_dir / f"{name}{suffix}"
+            if path.is_file():
+                return path
+        return None
+
+    def session_token(self) -> str | None:
+        morsel = SimpleCookie(self.headers.get("Cookie") or "").get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def session_user(self) -> str | None:
+        entry = self.sessions.get(self.session_token())
+        if entry is None:
+            return None
+        user, issued = entry
+        if self.session_ttl and time.time() - issued > self.session_ttl:
+            return None
+        return user
+
+    def send_json(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/config":
+            self.send_json(200, {"popups": self.popups, "popupDelay": self.popup_delay})
+            return
+        if path == "/session":
+            user = self.session_user() if self.accounts else "anonymous"
+            expired = user is None and self.session_token() is not None
+            self.send_json(
+                200 if user else 401,
+                {"user": user, "login_required": bool(self.accounts), "expired": expired},
+            )
+            return
+        if self.page_latency:
+            time.sleep(self.page_latency)
+        super().do_GET()
+
+    def login(self, body: bytes) -> None:
+        try:
+            form = json.loads(body or b"{}")
+        except ValueError:
+            form = {}
+        user = form.get("id")
+        if user not in self.accounts or self.accounts[user] != form.get("pw"):
+            self.send_json(401, {"error": "아이디 또는 비밀번호가 올바르지 않습니다"})
+            return
+        token = secrets.token_hex(16)
+        self.sessions[token] = (user, time.time())
+        self.send_json(200, {"user": user}, {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0]
+        if path == "/login":
+            self.login(body)
+            return
+        if not path.startswith("/transaction/"):
+            self.send_error(404)
+            return
+        if self.accounts and self.session_user() is None:
+            self.send_error(401, "session expired")
+            return
+        fixture = self.find_fixture(path.rsplit("/", 1)[-1])
+        if fixture is None:
+            self.send_error(404, "fixture not found")
+            return
+        body = fixture.read_bytes()
+        if self.latency:
+            time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[fixture.suffix])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def portal_handler(**attrs) -> type[MockPortalHandler]:
+    """Return a :class:`MockPortalHandler` subclass configured by ``attrs``.
+
+    The subclass gets its own session store, so several servers in one
+    process do not share logins.
+    """
+    unknown = [name for name in attrs if not hasattr(MockPortalHandler, name)]
+    if unknown:
+        raise TypeError(f"unknown handler options: {', '.join(unknown)}")
+    if any(kind not in POPUP_KINDS for kind in attrs.get("popups", [])):
+        raise ValueError(f"popups must be among {POPUP_KINDS}")
+    return type("PortalHandler", (MockPortalHandler,), {"sessions": {}, **attrs})
+
+
+def start_server(port: int = 0, handler=MockPortalHandler) -> ThreadingHTTPServer:
+    """Start the server in a daemon thread and return it.
+
+    The base URL is available as ``server.url``.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Run the mock BGF portal")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per transaction")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="seconds per static file")
+    parser.add_argument("--account", action="append", default=[], metavar="ID:PW", help="login account")
+    parser.add_argument("--popup", action="append", default=[], choices=POPUP_KINDS, help="popup opened after login")
+    parser.add_argument("--popup-delay", type=int, default=0, help="ms between popups")
+    parser.add_argument("--categories", type=int, help="serve generated data instead of fixtures/")
+    parser.add_argument("--rows", type=int, default=50, help="detail rows per generated category")
+    args = parser.parse_args()
+    options = {
+        "latency": args.latency,
+        "page_latency": args.page_latency,
+        "accounts": dict(a.split(":", 1) for a in args.account),
+        "popups": args.popup,
+        "popup_delay": args.popup_delay,
+    }
+    if args.categories:
+        from benchmarks.fixtures import write_portal_fixtures
+
+        options["fixture_dir"] = Path(tempfile.mkdtemp(prefix="mock_portal_"))
+        write_portal_fixtures(options["fixture_dir"], args.categories, args.rows)
+    srv = ThreadingHTTPServer(("127.0.0.1", args.port), portal_handler(**options))
+    page = "index.html" if options["accounts"] else "sales_ratio.html"
+    print(f"mock portal → http://127.0.0.1:{args.port}{DEPLOY_PREFIX}/{page}")
+    srv.serve_forever()
@@ -0,0 +1,96 @@
+// Minimal imitation of a Nexacro form: datasets arrive via XHR transactions
+// and are rendered into gridrow_/cell_ divs. The form objects are reachable
+// from nexacro.getApplication().mainframe along their DOM ids, the way the
+// form driver looks them up.
+const RS = "\x1e", US = "\x1f", NULL = "\x03";
+
+function parseSSV(text) {
+  const datasets = {};
+  let name = null, columns = null;
+  for (const record of text.split(RS)) {
+    if (name === null) {
+      if (record.startsWith("Dataset:")) {
+        name = record.slice(8);
+        columns = null;
+        datasets[name] = [];
+      }
+      continue;
+    }
+    if (record === "") { name = null; continue; }
+    const fields = record.split(US);
+    if (columns === null) {
+      columns = fields.slice(1).map((f) => f.split(":")[0]);
+      continue;
+    }
+    datasets[name].push(fields.slice(1).map((v) => (v === NULL ? "" : v)));
+  }
+  return datasets;
+}
+
+function parseXML(text) {
+  const doc = new DOMParser().parseFromString(text, "text/xml");
+  const datasets = {};
+  for (const ds of doc.getElementsByTagName("Dataset")) {
+    const columns = Array.from(ds.getElementsByTagName("Column"), (c) => c.getAttribute("id"));
+    datasets[ds.getAttribute("id")] = Array.from(ds.getElementsByTagName("Row"), (row) => {
+      const values = {};
+      for (const col of row.getElementsByTagName("Col")) values[col.getAttribute("id")] = col.textContent;
+      return columns.map((c) => values[c] ?? "");
+    });
+  }
+  return datasets;
+}
+
+async function transaction(name) {
+  const res = await fetch(`/transaction/${name}`, { method: "POST", body: "" });
+  const text = await res.text();
+  const datasets = text.startsWith("<") ? parseXML(text) : parseSSV(text);
+  return Object.values(datasets).sort((a, b) => b.length - a.length)[0] || [];
+}
+
+function renderGrid(gridId, rows, onClick) {
+  const grid = document.getElementById(gridId);
+  grid.innerHTML = "";
+  rows.forEach((row, r) => {
+    const rowEl = document.createElement("div");
+    rowEl.className = `gridrow_${r}`;
+    rowEl.id = `${gridId}.body.gridrow_${r}`;
+    row.forEach((value, c) => {
+      const cell = document.createElement("div");
+      cell.className = `cell_0_${c}`;
+      cell.textContent = value;
+      rowEl.appendChild(cell);
+    });
+    if (onClick) rowEl.addEventListener("click", () => onClick(row));
+    grid.appendChild(rowEl);
+  });
+}
+
+async function search() {
+  const categories = await transaction("category_list");
+  renderGrid("gdDetail", []);
+  renderGrid("gdList", categories, async (row) => {
+    renderGrid("gdDetail", await transaction(`detail_${row[0]}`));
+  });
+}
+
+// Calendar value is YYYYMMDD; the edit box shows YYYY-MM-DD.
+function calendar(name, form) {
+  const input = document.getElementById(`mainframe.WorkFrame.form.${name}.calendaredit:input`);
+  return {
+    parent: form,
+    value: null,
+    set_value(value) {
+      this.value = value;
+      input.value = value ? `${value.slice(0, 4)}-${value.slice(4, 6)}-${value.slice(6, 8)}` : "";
+    },
+  };
+}
+
+const workForm = { fn_search: search };
+workForm.calFromDay = calendar("calFromDay", workForm);
+workForm.calToDay = calendar("calToDay", workForm);
+const application = { mainframe: { WorkFrame: { form: workForm } } };
+window.nexacro = { getApplication: () => application };
+
+document.getElementById("btn_search").addEventListener("click", search);
@@ -0,0 +1,80 @@
+// Reproduces the popup shapes of the BGF portal for the popup benchmark.
+// Every element a strategy must get rid of carries data-fixture-popup, so
+// remaining() tells whether the page is clear regardless of the strategy.
+const WORK_FRAME = "mainframe.HFrameSet00.VFrameSet00.FrameSet.WorkFrame";
+
+window.__popupFixture = {
+  ready: false,
+  remaining() {
+    return [...document.querySelectorAll("[data-fixture-popup]")].filter((el) => {
+      const r = el.getBoundingClientRect();
+      return el.isConnected && r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== "hidden";
+    }).length;
+  },
+};
+
+function fixtureParam(name, fallback) {
+  const value = new URLSearchParams(location.search).get(name);
+  return value === null ? fallback : Number(value);
+}
+
+function styleOnce() {
+  if (document.getElementById("fixtureStyle")) return;
+  const style = document.createElement("style");
+  style.id = "fixtureStyle";
+  style.textContent = `
+    .fx-popup { position: fixed; top: 80px; left: 120px; width: 420px; padding: 12px;
+                background: #fff; border: 1px solid #888; z-index: 20; }
+    .fx-popup + .fx-popup { top: 120px; left: 160px; }
+    .fx-btn { display: inline-block; margin-top: 12px; padding: 4px 10px; border: 1px solid #555; cursor: pointer; }
+    .nexamodaloverlay { position: fixed; inset: 0; background: rgba(0, 0, 0, 0.3); z-index: 10; }
+  `;
+  document.head.appendChild(style);
+}
+
+// Nexacro 팝업: "<WorkFrame>.<id>.form.Static00:text" 제목과 btn_close:icontext 버튼
+function nexaPopup({id, title, closeText = "", confirm = null, onClose = null}) {
+  styleOnce();
+  const prefix = `${WORK_FRAME}.${id}.form`;
+  const popup = document.createElement("div");
+  popup.className = "fx-popup";
+  popup.id = `${WORK_FRAME}.${id}`;
+  popup.setAttribute("data-fixture-popup", id);
+  popup.innerHTML = `
+    <div id="${prefix}.Static00:text">${title}</div>
+    <div class="fx-btn" id="${prefix}.btn_close"><div id="${prefix}.btn_close:icontext">${closeText}</div></div>`;
+  popup.querySelector(".fx-btn").addEventListener("click", () => {
+    // 닫기 전에 네이티브 확인창을 띄우는 팝업 (다이얼로그를 수락해야 닫힌다)
+    if (confirm !== null && !window.confirm(confirm)) return;
+    popup.remove();
+    if (onClose) onClose();
+  });
+  document.body.appendChild(popup);
+  return popup;
+}
+
+// 일반 HTML 레이어 공지 ("닫기" 텍스트와 aria-label 버튼)
+function layerNotice({id, title, label = "닫기"}) {
+  styleOnce();
+  const layer = document.createElement("div");
+  layer.className = "fx-popup";
+  layer.id = id;
+  layer.setAttribute("data-fixture-popup", id);
+  layer.innerHTML = `<p>${title}</p><button type="button" class="fx-btn">${label}</button>`;
+  layer.querySelector("button").addEventListener("click", () => layer.remove());
+  document.body.appendChild(layer);
+  return layer;
+}
+
+function modalOverlay() {
+  styleOnce();
+  const overlay = document.createElement("div");
+  overlay.className = "nexamodaloverlay";
+  overlay.setAttribute("data-fixture-popup", "overlay");
+  document.body.appendChild(overlay);
+  return overlay;
+}
+
+function fixtureReady(delayMs = 0) {
+  setTimeout(() => { window.__popupFixture.ready = true; }, delayMs);
+}
@@ -0,0 +1,64 @@
+// Login and top menu of the mock portal. A valid session cookie skips the
+// login form, the way a reloaded page of a logged-in browser context would.
+// After a login the popups configured on the server (GET /config) open one
+// after another, built with the helpers of popups/popup_fixture.js.
+// gfn_openMenu(menuId) on the Nexacro application opens a screen directly.
+const $ = (id) => document.getElementById(id);
+const idInput = $("mainframe.HFrameSet00.LoginFrame.form.div_login.form.edt_id:input");
+const pwInput = $("mainframe.HFrameSet00.LoginFrame.form.div_login.form.edt_pw:input");
+const loginButton = $("mainframe.HFrameSet00.LoginFrame.form.div_login.form.btn_login");
+
+const POPUP_KINDS = {
+  notice: () => nexaPopup({id: "STZZ120_P0", title: "공지사항"}),
+  remote_work: () => nexaPopup({id: "STZZ300_P0", title: "재택 유선권장 안내"}),
+  confirm: () => nexaPopup({id: "STZZ400_P0", title: "설문 안내", confirm: "설문을 다시 보지 않으시겠습니까?"}),
+  overlay: () => modalOverlay(),
+};
+
+async function openPopups() {
+  const {popups, popupDelay} = await (await fetch("/config")).json();
+  for (const kind of popups) {
+    if (popupDelay) await new Promise((resolve) => setTimeout(resolve, popupDelay));
+    POPUP_KINDS[kind]();
+  }
+}
+
+function showPortal() {
+  $("loginForm").classList.add("hidden");
+  $("topMenu").classList.remove("hidden");
+}
+
+async function login() {
+  const res = await fetch("/login", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ id: idInput.value, pw: pwInput.value }),
+  });
+  if (res.ok) {
+    $("sessionPopup").classList.add("hidden");
+    showPortal();
+    openPopups();
+  } else {
+    $("loginMessage").textContent = (await res.json()).error;
+  }
+}
+
+pwInput.addEventListener("keydown", (event) => {
+  if (event.key === "Enter") login();
+});
+loginButton.addEventListener("click", login);
+$("menu_sales").addEventListener("click", () => $("subMenu").classList.remove("hidden"));
+$("menu_sales_ratio").addEventListener("click", () => $("workFrame").classList.remove("hidden"));
+
+const MENU_SCREENS = { STMB011_M0: "workFrame" };
+nexacro.getApplication().gfn_openMenu = (menuId) => {
+  if (MENU_SCREENS[menuId]) $(MENU_SCREENS[menuId]).classList.remove("hidden");
+};
+
+fetch("/session").then(async (res) => {
+  if (res.ok) {
+    showPortal();
+  } else if ((await res.json()).expired) {
+    $("sessionPopup").classList.remove("hidden");
+  }
+});
@@ -1,27 +1,117 @@
 import datetime
+import os
+from pathlib import Path
 from playwright.sync_api import Page
-from utils import log, wait
-from sales_analysis.navigate_sales_ratio import navigate_sales_ratio
-from sales_analysis.extract_sales_detail import extract_sales_detail
-from sales_analysis.middle_category_product_extractor import extract_middle_category_products
+from utils import log, run_journal, wait
+from utils.run_journal import JOURNAL_PATH
+from sales_analysis.navigate_sales_ratio import (
+    SALES_RATIO_MENU,
+    load_config,
+    navigate_sales_ratio,
+)
+from sales_analysis.category_pipeline import OUTPUT_DIR, month_window, run_category_pipeline
+from sales_analysis.checkpoint import CHECKPOINT_PATH, CheckpointSink, CheckpointStore, JournalSink
+from sales_analysis.warehouse import WAREHOUSE_PATH, WarehouseSink
+from sales_analysis.columnar_export import COLUMNAR_ROOT, ColumnarSink
+from sales_analysis.extract_sales_detail import SalesTextSink
+from sales_analysis.middle_category_product_extractor import ProductJsonSink
 
 
-def run_sales_analysis(page: Page) -> None:
+def prepare_sales_run(
+    cfg: dict,
+    store: str,
+    *,
+    output_dir: Path | None = None,
+    warehouse_path: Path = WAREHOUSE_PATH,
+) -> dict:
+    """Build the sinks and date windows of one sales extraction run.
+
+    ``output_dir`` moves the per-store files (reports, checkpoints and the
+    run journal) into their own directory so several stores can run at
+    once. The warehouse stays shared at ``warehouse_path``.
+
+    Returns a dict with ``sinks``, ``windows``, ``journal`` and ``task``;
+    the journal task is already begun or resumed.
+    """
+    incremental = cfg.get("incremental", False)
+    outputs = cfg.get("outputs", {})
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # 실패한 이전 실행이 있으면 완료된 중분류를 건너뛰고 같은 출력에 이어 쓴다
+    journal = run_journal(output_dir / JOURNAL_PATH.name if output_dir else JOURNAL_PATH)
+    task = f"{store}:{SALES_RATIO_MENU}"
+    resume = cfg.get("resume", True) and journal.is_incomplete(task)
+
+    report_dir = output_dir or OUTPUT_DIR
+    sinks = []
+    if outputs.get("warehouse", True):
+        sinks.append(WarehouseSink(store, path=warehouse_path))
+    if outputs.get("text", True):
+        sinks.append(SalesTextSink(report_dir, history=incremental, append=resume))
+    if outputs.get("json", True):
+        sinks.append(ProductJsonSink(report_dir, append=resume))
+    if outputs.get("columnar", False):
+        sinks.append(
+            ColumnarSink(
+                store,
+                warehouse_path.parent / COLUMNAR_ROOT.name,
+                fmt=outputs.get("columnar_format", "parquet"),
+            )
+        )
+    windows = None
+    if incremental:
+        checkpoints = CheckpointStore(output_dir / CHECKPOINT_PATH.name) if output_dir else CheckpointStore()
+        backfill = cfg.get("backfill_start")
+        windows = checkpoints.windows(
+            store,
+            SALES_RATIO_MENU,
+            backfill_start=datetime.date.fromisoformat(backfill) if backfill else None,
+        )
+        sinks.append(CheckpointSink(checkpoints, store, SALES_RATIO_MENU))
+
+    if resume:
+        windows = journal.resume(task, windows)
+    else:
+        windows = windows or [month_window()]
+        journal.begin(task, windows)
+    sinks.append(JournalSink(journal, task))
+    return {"sinks": sinks, "windows": windows, "journal": journal, "task": task}
+
+
+def run_sales_analysis(page: Page, store: str | None = None) -> None:
     """Run sales analysis workflow on Mondays."""
     if datetime.datetime.today().weekday() != 0:
         log("오늘은 월요일이 아니므로 매출 분석을 건너뜁니다")
         return
 
     log("➡️ 매출분석 메뉴 진입 시도")
-    wait(page)
+    wait(page, step="sales_run")
     navigate_sales_ratio(page)
-    wait(page)
+    wait(page, step="sales_run")
     log("✅ 메뉴 진입 성공")
 
+    cfg = load_config()
+    store = store or os.getenv("LOGIN_ID") or "default"
+    run = prepare_sales_run(cfg, store)
+    journal, task = run["journal"], run["task"]
+
     log("🟡 매출 상세 데이터 추출 시작")
-    wait(page)
-    extract_sales_detail(page)
-    wait(page)
-    extract_middle_category_products(page)
-    wait(page)
+    journal.set_stage("데이터 추출")
+    wait(page, step="sales_run")
+    try:
+        run_category_pipeline(
+            page,
+            run["sinks"],
+            capture=cfg.get("transaction_capture", False),
+            windows=run["windows"],
+            concurrency=cfg.get("concurrency", 1),
+        )
+    except Exception as e:
+        journal.fail(task, str(e))
+        log(f"❌ 매출 상세 데이터 추출 실패, 다음 실행에서 이어서 진행합니다: {e}")
+        raise
+    journal.finish(task)
+    journal.set_stage("종료")
+    wait(page, step="sales_run")
     log("✅ 매출 상세 데이터 추출 완료")
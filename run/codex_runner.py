@@ -10,6 +10,16 @@ from playwright.sync_api import sync_playwright
 from utils import (
     inject_init_cleanup_script,
     popups_handled,
+    request_policy_from_config,
+    configure_form_driver,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_waits,
+    configure_transaction_watch,
+    wait_report,
+    popup_rule_engine,
+    watch_popups,
+    watch_transactions,
 )
 from browser.popup_handler import setup_dialog_handler
 from browser.popup_handler_utility import close_all_popups
@@ -49,10 +59,20 @@ def run() -> None:
         return
 
     normal_exit = False
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
         page = browser.new_page()
+        policy = request_policy_from_config(cfg)
+        if policy is not None:
+            policy.install(page)
         inject_init_cleanup_script(page)
+        watch_popups(page)
+        watch_transactions(page)
         setup_dialog_handler(page)
         try:
             page.goto(url)
@@ -92,6 +112,10 @@ def run() -> None:
         finally:
             try:
                 browser.close()
+                if policy is not None:
+                    policy.report()
+                popup_rule_engine().report()
+                wait_report()
             finally:
                 print("정상 종료" if normal_exit else "비정상 종료")
 
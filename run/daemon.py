@@ -0,0 +1,64 @@
+"""Start the warm browser daemon and wait for jobs.
+
+Usage::
+
+    python run/daemon.py --headless
+    python run/job.py products
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from async_pipeline.daemon import daemon_options, run_daemon
+from async_pipeline.session import session_cache_from_config
+from sales_analysis.navigate_sales_ratio import load_config
+from utils import (
+    configure_form_driver,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_transaction_watch,
+    configure_waits,
+    request_policy_from_config,
+)
+
+
+def main() -> None:
+    cfg = load_config()
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
+    options = daemon_options(cfg)
+    parser = argparse.ArgumentParser(description="Warm browser daemon")
+    parser.add_argument("--host", default=options["host"])
+    parser.add_argument("--port", type=int, default=options["port"])
+    parser.add_argument("--cdp-port", type=int, default=options["cdp_port"])
+    parser.add_argument("--health-interval", type=float, default=options["health_interval"])
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(
+            run_daemon(
+                cache=session_cache_from_config(cfg),
+                headless=args.headless,
+                host=args.host,
+                port=args.port,
+                cdp_port=args.cdp_port,
+                health_interval=args.health_interval,
+                policy=request_policy_from_config(cfg),
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Submit a job to the running browser daemon.
+
+Usage::
+
+    python run/job.py health
+    python run/job.py sales_ratio --force
+    python run/job.py products
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from async_pipeline.daemon import daemon_options, submit
+from sales_analysis.navigate_sales_ratio import load_config
+
+
+def main() -> None:
+    options = daemon_options(load_config())
+    parser = argparse.ArgumentParser(description="Browser daemon job client")
+    parser.add_argument("job", choices=["health", "sales_ratio", "products", "relogin"])
+    parser.add_argument("--host", default=options["host"])
+    parser.add_argument("--port", type=int, default=options["port"])
+    parser.add_argument("--store")
+    parser.add_argument("--force", action="store_true", help="run on any weekday")
+    parser.add_argument("--capture", action="store_true", help="read transaction payloads")
+    args = parser.parse_args()
+
+    params = {"force": args.force, "capture": args.capture}
+    if args.store:
+        params["store"] = args.store
+    response = submit(args.job, host=args.host, port=args.port, **params)
+    print(json.dumps(response, ensure_ascii=False, indent=2))
+    sys.exit(0 if response.get("ok") else 1)
+
+
+if __name__ == "__main__":
+    main()
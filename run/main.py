@@ -1,6 +1,4 @@
-import datetime
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -10,27 +8,16 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from login import perform_login
-from common import process_popups_once, popups_handled
-from order import run_sales_analysis
+import async_pipeline
 
 
 def main():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
-        if not perform_login(page):
-            browser.close()
-            return
+    """Login, handle popups and run the Monday sales analysis.
 
-        if not process_popups_once(page):
-            browser.close()
-            return
-
-        if popups_handled() and datetime.datetime.today().weekday() == 0:
-            run_sales_analysis(page)
-
-        browser.close()
+    Thin wrapper over :func:`async_pipeline.main`, which drives every step on
+    one event loop.
+    """
+    async_pipeline.run(headless=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""Run the sales extraction for every store listed in ``config/stores.json``.
+
+Usage::
+
+    python run/multi_store.py --concurrency 3
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from async_pipeline import load_stores, run_stores
+from async_pipeline.orchestrator import STORES_PATH
+from async_pipeline.session import session_cache_from_config
+from sales_analysis.navigate_sales_ratio import load_config
+from utils import (
+    configure_form_driver,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_transaction_watch,
+    configure_waits,
+    request_policy_from_config,
+)
+
+
+def main() -> None:
+    cfg = load_config()
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
+    parser = argparse.ArgumentParser(description="Multi-store sales extraction")
+    parser.add_argument("--stores", type=Path, default=STORES_PATH)
+    parser.add_argument("--concurrency", type=int, default=cfg.get("store_concurrency", 2))
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--force", action="store_true", help="run on any weekday")
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run_stores(
+            load_stores(args.stores),
+            concurrency=args.concurrency,
+            headless=args.headless,
+            cache=session_cache_from_config(cfg),
+            policy=request_policy_from_config(cfg),
+            force=args.force,
+        )
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,13 @@ from .navigate_sales_ratio import navigate_sales_ratio
 from .sales_ratio_detail_extractor import extract_sales_ratio_details
 from .extract_sales_detail import extract_sales_detail
 from .middle_category_product_extractor import extract_middle_category_products
+from .category_pipeline import CategorySink, run_category_pipeline
 
 __all__ = [
     "navigate_sales_ratio",
     "extract_sales_ratio_details",
     "extract_sales_detail",
     "extract_middle_category_products",
+    "CategorySink",
+    "run_category_pipeline",
 ]
@@ -0,0 +1,242 @@
+"""Single pass over the middle category grid feeding several sinks.
+
+Every category row is clicked once and its detail rows are handed to all
+registered :class:`CategorySink` objects, so adding an output never adds
+another walk over the grid.
+"""
+
+import abc
+import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from playwright.sync_api import Page, expect
+from utils import popups_handled, log, transaction_mark, wait, wait_for_transactions
+from utils.form_driver import call_form_search, nexacro_date, set_component_values
+from .grid_harvester import (
+    CATEGORY_ROW_SELECTOR,
+    DETAIL_ROW_SELECTOR,
+    click_grid_row,
+    read_virtual_grid,
+    row_text,
+)
+from .transaction_capture import iter_captured_categories
+from .dataset_parser import format_value
+
+SEARCH_BUTTON_SELECTOR = "div.nexacontentsbox:has-text('조 회')"
+
+# 날짜 컴포넌트 이름과 UI 입력 칸
+DATE_FIELDS = {
+    "calFromDay": "input[id$='calFromDay.calendaredit:input']",
+    "calToDay": "input[id$='calToDay.calendaredit:input']",
+}
+
+# 결과 파일 기본 저장 위치
+OUTPUT_DIR = Path(__file__).resolve().parent
+
+
+# (시작일, 종료일, 대상 중분류 판별 함수 또는 None)
+Window = tuple[str, str, Callable[[str], bool] | None]
+
+
+class CategorySink(abc.ABC):
+    """Receiver for the detail rows of each middle category.
+
+    Subclasses implement :meth:`write` and usually :meth:`close`. Each row is
+    a dict with ``cells`` (list of cell texts), ``text`` (tab separated line)
+    and ``values`` (typed dataset row in capture mode, otherwise ``None``).
+    When extraction stops early, :meth:`fail` is called before
+    :meth:`close` and ``error`` holds the exception.
+    """
+
+    error: BaseException | None = None
+
+    def open(self, context: dict) -> None:
+        """Called once before the first category with run information.
+
+        ``context`` holds ``start`` and ``end`` (``YYYY-MM-DD``) covering all
+        queried date windows.
+        """
+        self.context = context
+
+    def begin_window(self, start: str, end: str) -> None:
+        """Called before the categories of each queried date window."""
+        self.window = (start, end)
+
+    @abc.abstractmethod
+    def write(self, category: str, rows: list[dict]) -> None:
+        """Receive the detail rows of ``category``."""
+
+    def fail(self, error: BaseException) -> None:
+        """Called instead of a normal finish when extraction raised ``error``."""
+        self.error = error
+
+    def close(self) -> Path | None:
+        """Finish the output and return its path, if any."""
+        return None
+
+
+def fail_sinks(sinks: list[CategorySink], error: BaseException) -> None:
+    """Tell every sink that the run stopped early with ``error``."""
+    for sink in sinks:
+        sink.fail(error)
+
+
+def month_window(today: datetime.date | None = None) -> Window:
+    """Return the default window: first day of this month through today."""
+    today = today or datetime.date.today()
+    return today.replace(day=1).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"), None
+
+
+def _fill_date_input(page: Page, selector: str, value: str) -> None:
+    field = page.locator(selector)
+    if field.count() > 0:
+        wait(page, step="date_input")
+        field.click()
+        wait(page, step="date_input")
+        field.fill(value)
+        wait(page, step="date_input")
+        field.press("Enter")
+        wait(page, step="date_input")
+
+
+def set_date_range(page: Page, start_str: str, end_str: str) -> tuple[str, str]:
+    """Set the from/to date fields to ``YYYY-MM-DD`` strings.
+
+    The calendar components are set directly through the form driver; only
+    the fields it could not set are typed into the UI.
+    """
+    values = dict(zip(DATE_FIELDS, (start_str, end_str)))
+    missing = set_component_values(page, {name: nexacro_date(v) for name, v in values.items()})
+    for name in missing:
+        _fill_date_input(page, DATE_FIELDS[name], values[name])
+    return start_str, end_str
+
+
+def set_month_date_range(page: Page) -> tuple[str, str]:
+    """Set the from/to date fields to the first day of this month through today."""
+    start_str, end_str, _ = month_window()
+    return set_date_range(page, start_str, end_str)
+
+
+def _search(page: Page) -> None:
+    mark = transaction_mark(page)
+    if not call_form_search(page, anchor="calFromDay"):
+        search_btn = page.locator(SEARCH_BUTTON_SELECTOR)
+        if search_btn.count() == 0:
+            log("⚠️ 조회 버튼을 찾을 수 없습니다")
+            return
+        wait(page, step="search")
+        mark = transaction_mark(page)
+        search_btn.first.click()
+    wait_for_transactions(page, mark, step="search")
+    wait(page, step="search")
+
+
+def _dom_categories(page: Page, accept: Callable[[str], bool] | None) -> Iterator[tuple[str, list[dict]]]:
+    _search(page)
+    categories = read_virtual_grid(page, CATEGORY_ROW_SELECTOR)
+    log(f"🟡 중분류 {len(categories)}건 확인")
+    for category in categories:
+        code = category["cells"][0] if category["cells"] else ""
+        if accept is not None and not accept(code):
+            continue
+        wait(page, step="category")
+        mark = transaction_mark(page)
+        click_grid_row(page, CATEGORY_ROW_SELECTOR, code)
+        wait_for_transactions(page, mark, step="category")
+        wait(page, step="category")
+        expect(page.locator(DETAIL_ROW_SELECTOR).first).to_be_visible(timeout=3000)
+
+        rows = [
+            {"cells": d_row["cells"], "text": row_text(d_row), "values": None}
+            for d_row in read_virtual_grid(page, DETAIL_ROW_SELECTOR)
+        ]
+        yield code, rows
+        wait(page, step="category")
+
+
+def _captured_categories(page: Page, accept: Callable[[str], bool] | None) -> Iterator[tuple[str, list[dict]]]:
+    search_btn = page.locator(SEARCH_BUTTON_SELECTOR)
+    if search_btn.count() == 0:
+        raise RuntimeError("조회 버튼을 찾을 수 없습니다")
+    log("📡 트랜잭션 응답 캡처 모드로 추출")
+    for item in iter_captured_categories(page, search_btn.first.click, accept=accept):
+        rows = []
+        for values in item["rows"]:
+            cells = [format_value(v).strip() for v in values.values()]
+            rows.append({"cells": cells, "text": "\t".join(cells).strip(), "values": values})
+        yield item["category"], rows
+
+
+def run_category_pipeline(
+    page: Page,
+    sinks: list[CategorySink],
+    *,
+    capture: bool = False,
+    windows: list[Window] | None = None,
+    concurrency: int = 1,
+) -> list[Path | None]:
+    """Visit each middle category once and send its rows to every sink.
+
+    Parameters
+    ----------
+    page : Page
+        Playwright page showing the '중분류별 매출 구성비' screen.
+    sinks : list[CategorySink]
+        Outputs receiving the detail rows.
+    capture : bool, optional
+        If ``True``, rows are read from transaction responses instead of the
+        rendered grids.
+    windows : list[Window] | None, optional
+        Date windows to query as ``(start, end, accept)``. ``accept`` limits
+        the categories visited for that window. Defaults to this month.
+    concurrency : int, optional
+        Pages extracting categories in parallel. The sync API drives one
+        page at a time, so values above 1 are only honoured by
+        :func:`async_pipeline.extraction.run_category_pipeline`; here they
+        are logged and the categories are visited one by one.
+
+    Returns
+    -------
+    list[Path | None]
+        Result of :meth:`CategorySink.close` for each sink, in order.
+    """
+    if not popups_handled():
+        raise RuntimeError("팝업 처리가 완료되지 않아 데이터 추출을 중단합니다")
+
+    if windows is None:
+        windows = [month_window()]
+    if concurrency > 1 and not capture:
+        log(f"⚠️ 병렬 추출({concurrency}페이지)은 async 파이프라인에서만 지원되어 순차 추출합니다")
+
+    context = {
+        "start": min((w[0] for w in windows), default=None),
+        "end": max((w[1] for w in windows), default=None),
+    }
+    for sink in sinks:
+        sink.open(context)
+
+    try:
+        for start_str, end_str, accept in windows:
+            log(f"🟡 날짜 설정 시작 ({start_str} ~ {end_str})")
+            set_date_range(page, start_str, end_str)
+            for sink in sinks:
+                sink.begin_window(start_str, end_str)
+
+            log("🟡 중분류별 매출 상세 추출 시작")
+            if capture:
+                categories = _captured_categories(page, accept)
+            else:
+                categories = _dom_categories(page, accept)
+            for code, rows in categories:
+                if not rows:
+                    log(f"❌ 상세 테이블 항목 없음: {code}")
+                for sink in sinks:
+                    sink.write(code, rows)
+    except BaseException as e:
+        fail_sinks(sinks, e)
+        raise
+    finally:
+        results = [sink.close() for sink in sinks]
+    return results
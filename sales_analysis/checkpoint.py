@@ -0,0 +1,127 @@
+"""Per-store checkpoints for incremental sales extraction.
+
+The store keeps, for every store/menu/category, the last date whose data
+has been fully extracted. Only closed days (up to yesterday) are recorded
+so that consecutive delta windows never overlap.
+"""
+
+import datetime
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from utils import RunJournal, log
+from .category_pipeline import CategorySink, Window
+
+CHECKPOINT_PATH = Path(__file__).resolve().parent / "checkpoints.json"
+
+
+class CheckpointStore:
+    """JSON backed ``{store: {menu: {category: "YYYY-MM-DD"}}}`` mapping."""
+
+    def __init__(self, path: Path = CHECKPOINT_PATH):
+        self.path = Path(path)
+        self.data: dict = {}
+        if self.path.exists():
+            try:
+                self.data = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception as e:
+                log(f"⚠️ 체크포인트 파일 로드 실패, 새로 시작합니다: {e}")
+
+    def entries(self, store: str, menu: str) -> dict[str, datetime.date]:
+        raw = self.data.get(store, {}).get(menu, {})
+        return {cat: datetime.date.fromisoformat(day) for cat, day in raw.items()}
+
+    def get(self, store: str, menu: str, category: str) -> datetime.date | None:
+        return self.entries(store, menu).get(category)
+
+    def set(self, store: str, menu: str, category: str, day: datetime.date) -> None:
+        self.data.setdefault(store, {}).setdefault(menu, {})[category] = day.isoformat()
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def windows(
+        self,
+        store: str,
+        menu: str,
+        today: datetime.date | None = None,
+        backfill_start: datetime.date | None = None,
+    ) -> list[Window]:
+        """Return the date windows still missing for ``store``/``menu``.
+
+        Categories are grouped by their next missing day so each group needs
+        only one search. Categories without a checkpoint (new today, or
+        never extracted) get their own window from ``backfill_start``, by
+        default the first day of the month, so it is always queried even
+        when every known category is up to date. With no checkpoint at all
+        that is the only window.
+        """
+        today = today or datetime.date.today()
+        end = today - datetime.timedelta(days=1)
+        new_start = min(backfill_start or today.replace(day=1), end)
+        entries = self.entries(store, menu)
+        if not entries:
+            return [(new_start.isoformat(), end.isoformat(), None)]
+
+        groups: dict[datetime.date, set[str]] = defaultdict(set)
+        for category, last in entries.items():
+            if last < end:
+                groups[last + datetime.timedelta(days=1)].add(category)
+
+        known = set(entries)
+        result: list[Window] = []
+        for start in sorted(groups):
+            members = groups[start]
+            if start == new_start:
+                # 새 중분류와 시작일이 같으면 한 번의 조회로 함께 받는다
+                accept = lambda code, members=members: code in members or code not in known
+                new_start = None
+            else:
+                accept = lambda code, members=members: code in members
+            result.append((start.isoformat(), end.isoformat(), accept))
+        if new_start is not None:
+            result.insert(0, (new_start.isoformat(), end.isoformat(), lambda code: code not in known))
+        return result
+
+
+class CheckpointSink(CategorySink):
+    """Record each category as extracted up to its window end.
+
+    Register it after the output sinks: a category is only checkpointed
+    once every earlier sink has written it.
+    """
+
+    def __init__(self, checkpoints: CheckpointStore, store: str, menu: str):
+        self.checkpoints = checkpoints
+        self.store = store
+        self.menu = menu
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        end = datetime.date.fromisoformat(self.window[1])
+        self.checkpoints.set(self.store, self.menu, category, end)
+        self.checkpoints.save()
+
+    def close(self) -> Path:
+        self.checkpoints.save()
+        return self.checkpoints.path
+
+
+class JournalSink(CategorySink):
+    """Mark each written category as completed in a :class:`RunJournal` task.
+
+    Like :class:`CheckpointSink` it belongs after the output sinks.
+    """
+
+    def __init__(self, journal: RunJournal, task: str):
+        self.journal = journal
+        self.task = task
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        start, end = self.window
+        self.journal.complete(self.task, start, end, category)
+
+    def close(self) -> Path:
+        return self.journal.path
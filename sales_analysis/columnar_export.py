@@ -0,0 +1,228 @@
+"""Columnar (Parquet / Arrow IPC) export of extracted sales.
+
+Files are partitioned as ``store=<code>/month=<YYYY-MM>/`` and category and
+product columns are dictionary encoded, so downstream jobs can read just
+the columns and months they need, memory-mapped. Writes merge into the
+partitions they touch on the warehouse key ``(store, sale_date,
+period_start, category, product_code)``, so re-running a window replaces its
+rows like the SQLite warehouse does. Rows with ``period_start <
+sale_date`` are period totals, not daily sales.
+"""
+
+import uuid
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from utils import log
+from .category_pipeline import CategorySink
+from .warehouse import SalesWarehouse, parse_number
+
+COLUMNAR_ROOT = Path(__file__).resolve().parent / "columnar"
+
+FORMATS = ("parquet", "arrow")
+
+DICTIONARY_COLUMNS = ("category", "product_code", "product_name")
+
+# SalesWarehouse 의 daily_sales / period_sales 기본 키와 같은 열
+KEY_COLUMNS = ("store", "sale_date", "period_start", "category", "product_code")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("pyarrow가 설치되어 있지 않아 컬럼형 내보내기를 사용할 수 없습니다")
+
+
+def _file_format(fmt: str):
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    if fmt == "parquet":
+        return ds.ParquetFileFormat()
+    return ds.IpcFileFormat()
+
+
+def build_table(columns: dict[str, list]):
+    """Build an Arrow table from column lists of the sales schema.
+
+    Expected keys: ``store``, ``sale_date``, ``period_start``, ``category``,
+    ``product_code``, ``product_name``, ``sale_qty``, ``sale_amt``. Dates are
+    ``YYYY-MM-DD`` strings.
+    """
+    _require_pyarrow()
+    sale_date = pa.array(columns["sale_date"], pa.string()).cast(pa.date32())
+    arrays = {
+        "store": pa.array(columns["store"], pa.string()),
+        "month": pa.array([d[:7] for d in columns["sale_date"]], pa.string()),
+        "sale_date": sale_date,
+        "period_start": pa.array(columns["period_start"], pa.string()).cast(pa.date32()),
+    }
+    for name in DICTIONARY_COLUMNS:
+        arrays[name] = pa.array(columns[name], pa.string()).dictionary_encode()
+    arrays["sale_qty"] = pa.array(columns["sale_qty"], pa.float64())
+    arrays["sale_amt"] = pa.array(columns["sale_amt"], pa.float64())
+    return pa.table(arrays)
+
+
+def _partitioning():
+    # 점포 코드 "001" 이 정수로 추론되지 않게 문자열로 고정한다
+    return ds.partitioning(pa.schema([("store", pa.string()), ("month", pa.string())]), flavor="hive")
+
+
+def _merge_existing(table, root: Path, fmt: str):
+    """Combine ``table`` with the stored rows of the partitions it touches.
+
+    Stored rows whose key also occurs in ``table`` are dropped, so the new
+    rows win.
+    """
+    if not Path(root).exists():
+        return table
+    touched = set(zip(table.column("store").to_pylist(), table.column("month").to_pylist()))
+    dataset = ds.dataset(str(root), format=_file_format(fmt), partitioning=_partitioning())
+    existing = dataset.to_table(
+        filter=ds.field("store").isin(sorted({s for s, _ in touched}))
+        & ds.field("month").isin(sorted({m for _, m in touched}))
+    )
+    if existing.num_rows == 0:
+        return table
+    existing = existing.select(table.column_names).cast(table.schema)
+    keys = set(zip(*(table.column(name).to_pylist() for name in KEY_COLUMNS)))
+    stored = zip(
+        existing.column("store").to_pylist(),
+        existing.column("month").to_pylist(),
+        *(existing.column(name).to_pylist() for name in KEY_COLUMNS[1:]),
+    )
+    keep = [
+        (store, month) in touched and (store, *rest) not in keys
+        for store, month, *rest in stored
+    ]
+    return pa.concat_tables([existing.filter(pa.array(keep)), table]).unify_dictionaries().combine_chunks()
+
+
+def write_table(table, root: Path = COLUMNAR_ROOT, fmt: str = "parquet") -> Path:
+    """Write ``table`` into the ``store=/month=`` partitioned dataset at ``root``.
+
+    Each touched partition is rewritten with its stored rows merged in (see
+    :func:`_merge_existing`); other partitions are left alone.
+    """
+    _require_pyarrow()
+    file_format = _file_format(fmt)
+    table = _merge_existing(table, root, fmt)
+    options = None
+    if fmt == "parquet":
+        options = file_format.make_write_options(compression="zstd", use_dictionary=True)
+    else:
+        options = file_format.make_write_options(compression="zstd")
+    ds.write_dataset(
+        table,
+        str(root),
+        format=file_format,
+        file_options=options,
+        partitioning=["store", "month"],
+        partitioning_flavor="hive",
+        basename_template=f"part-{uuid.uuid4().hex[:12]}-{{i}}.{fmt}",
+        existing_data_behavior="delete_matching",
+    )
+    return Path(root)
+
+
+def read_sales(
+    root: Path = COLUMNAR_ROOT,
+    columns: list[str] | None = None,
+    filter=None,
+    fmt: str = "parquet",
+):
+    """Read the dataset memory-mapped, projecting ``columns`` only.
+
+    ``filter`` is a ``pyarrow.dataset`` expression, e.g.
+    ``ds.field("month") == "2025-06"``.
+    """
+    _require_pyarrow()
+    dataset = ds.dataset(
+        str(root),
+        format=_file_format(fmt),
+        partitioning=_partitioning(),
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+    return dataset.to_table(columns=columns, filter=filter)
+
+
+def export_warehouse(
+    warehouse: SalesWarehouse,
+    root: Path = COLUMNAR_ROOT,
+    *,
+    store: str | None = None,
+    since: str | None = None,
+    fmt: str = "parquet",
+) -> int:
+    """Convert warehouse history (optionally one store / from ``since``) to columnar files.
+
+    Period totals are exported with ``sale_date`` set to the period end.
+    """
+    query = """
+        SELECT st.code, s.sale_date, s.period_start, c.code, p.code, p.name, s.sale_qty, s.sale_amt
+        FROM daily_sales s
+        JOIN store st ON st.id = s.store_id
+        JOIN category c ON c.id = s.category_id
+        JOIN product p ON p.id = s.product_id
+        WHERE (? IS NULL OR st.code = ?) AND (? IS NULL OR s.sale_date >= ?)
+        UNION ALL
+        SELECT st.code, s.period_end, s.period_start, c.code, p.code, p.name, s.sale_qty, s.sale_amt
+        FROM period_sales s
+        JOIN store st ON st.id = s.store_id
+        JOIN category c ON c.id = s.category_id
+        JOIN product p ON p.id = s.product_id
+        WHERE (? IS NULL OR st.code = ?) AND (? IS NULL OR s.period_end >= ?)
+    """
+    rows = warehouse.conn.execute(query, (store, store, since, since) * 2).fetchall()
+    if not rows:
+        return 0
+    names = ["store", "sale_date", "period_start", "category", "product_code", "product_name", "sale_qty", "sale_amt"]
+    columns = {name: list(values) for name, values in zip(names, zip(*rows))}
+    write_table(build_table(columns), root, fmt)
+    return len(rows)
+
+
+class ColumnarSink(CategorySink):
+    """Append each run's rows to the partitioned columnar dataset."""
+
+    def __init__(self, store: str, root: Path = COLUMNAR_ROOT, fmt: str = "parquet"):
+        _require_pyarrow()
+        _file_format(fmt)
+        self.store = store
+        self.root = root
+        self.fmt = fmt
+        self.columns: dict[str, list] = {
+            name: []
+            for name in ("store", "sale_date", "period_start", "category", "product_code", "product_name", "sale_qty", "sale_amt")
+        }
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        start, end = self.window
+        for row in rows:
+            cells = row["cells"]
+            if not cells or not cells[0]:
+                continue
+            self.columns["store"].append(self.store)
+            self.columns["sale_date"].append(end)
+            self.columns["period_start"].append(start)
+            self.columns["category"].append(category)
+            self.columns["product_code"].append(cells[0])
+            self.columns["product_name"].append(cells[1] if len(cells) > 1 else None)
+            self.columns["sale_qty"].append(parse_number(cells[2]) if len(cells) > 2 else None)
+            self.columns["sale_amt"].append(parse_number(cells[3]) if len(cells) > 3 else None)
+
+    def close(self) -> Path | None:
+        count = len(self.columns["store"])
+        if count == 0:
+            return None
+        write_table(build_table(self.columns), self.root, self.fmt)
+        if self.error is not None:
+            log(f"⚠️ 추출 중단, 컬럼형({self.fmt}) 매출 {count}건만 저장 → {self.root}")
+        else:
+            log(f"✅ 컬럼형({self.fmt}) 매출 저장 {count}건 → {self.root}")
+        return Path(self.root)
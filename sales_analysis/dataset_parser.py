@@ -0,0 +1,292 @@
+"""Streaming parser for Nexacro SSV and XML dataset payloads.
+
+Rows are produced one at a time with values converted according to the
+column types in the dataset header, so large payloads are never held as a
+single tree or record list.
+"""
+
+import codecs
+import datetime
+import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Nexacro SSV 구분자
+RS = "\x1e"
+US = "\x1f"
+NULL = "\x03"
+
+CHUNK_SIZE = 64 * 1024
+
+# 삭제/원본 행은 서버 응답 데이터로 취급하지 않는다
+SKIP_ROW_TYPES = ("D", "O")
+
+
+def _to_int(value: str):
+    return int(value) if value else None
+
+
+def _to_float(value: str):
+    return float(value) if value else None
+
+
+def _to_date(value: str):
+    return datetime.datetime.strptime(value[:8], "%Y%m%d").date() if value else None
+
+
+def _to_datetime(value: str):
+    return datetime.datetime.strptime(value[:14], "%Y%m%d%H%M%S") if value else None
+
+
+def _to_time(value: str):
+    return datetime.datetime.strptime(value[:6], "%H%M%S").time() if value else None
+
+
+def _to_str(value: str):
+    return value
+
+
+CONVERTERS = {
+    "STRING": _to_str,
+    "INT": _to_int,
+    "BIGDECIMAL": _to_float,
+    "DECIMAL": _to_float,
+    "FLOAT": _to_float,
+    "DATE": _to_date,
+    "DATETIME": _to_datetime,
+    "TIME": _to_time,
+    "BLOB": _to_str,
+}
+
+NUMPY_DTYPES = {
+    "INT": "int64",
+    "BIGDECIMAL": "float64",
+    "DECIMAL": "float64",
+    "FLOAT": "float64",
+    "DATE": "datetime64[D]",
+    "DATETIME": "datetime64[s]",
+}
+
+
+def column_type(spec: str) -> str:
+    """Return the base type of a column spec such as ``STRING(256)``."""
+    return spec.split("(", 1)[0].strip().upper() or "STRING"
+
+
+def _converter(col_type: str):
+    return CONVERTERS.get(col_type, _to_str)
+
+
+def iter_text(source, encoding: str = "utf-8") -> Iterator[str]:
+    """Yield text chunks from a str, bytes, file object or iterable of chunks."""
+    if isinstance(source, str):
+        yield source
+        return
+    if isinstance(source, (bytes, bytearray)):
+        yield bytes(source).decode(encoding)
+        return
+    if hasattr(source, "read"):
+        chunks: Iterable = iter(lambda: source.read(CHUNK_SIZE), source.read(0))
+    else:
+        chunks = source
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk
+        else:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_records(source) -> Iterator[str]:
+    buffer = ""
+    for chunk in iter_text(source):
+        buffer += chunk
+        records = buffer.split(RS)
+        buffer = records.pop()
+        yield from records
+    if buffer:
+        yield buffer
+
+
+def iter_ssv_events(source) -> Iterator[tuple]:
+    """Yield ``("columns", id, [(name, type)])`` and ``("row", id, values)`` events."""
+    name = None
+    columns = None
+    converters = None
+    for record in _iter_records(source):
+        if name is None:
+            if record.startswith("Dataset:"):
+                name = record.split(":", 1)[1]
+                columns = None
+            continue
+        if record == "":
+            name = None
+            continue
+        fields = record.split(US)
+        if columns is None:
+            if fields[0] == "_Const_":
+                continue
+            columns = []
+            for field in fields[1:]:
+                col, _, spec = field.partition(":")
+                columns.append((col, column_type(spec)))
+            converters = [_converter(t) for _, t in columns]
+            yield "columns", name, columns
+            continue
+        if fields[0] in SKIP_ROW_TYPES:
+            continue
+        yield "row", name, [
+            None if v == NULL else conv(v) for conv, v in zip(converters, fields[1:])
+        ]
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_xml_events(source) -> Iterator[tuple]:
+    """XML counterpart of :func:`iter_ssv_events` using a pull parser."""
+    parser = ET.XMLPullParser(events=("start", "end"))
+    name = None
+    columns: list[tuple[str, str]] = []
+    index: dict[str, int] = {}
+    converters = []
+    rows_el = None
+    for chunk in iter_text(source):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            tag = _local(elem.tag)
+            if event == "start":
+                if tag == "Dataset":
+                    name = elem.get("id")
+                    columns, index = [], {}
+                    rows_el = None
+                elif tag == "Rows":
+                    rows_el = elem
+                    converters = [_converter(t) for _, t in columns]
+                    yield "columns", name, columns
+                continue
+            if tag == "Column":
+                index[elem.get("id")] = len(columns)
+                columns.append((elem.get("id"), column_type(elem.get("type", "STRING"))))
+            elif tag == "Row":
+                if elem.get("type", "N")[:1].upper() in SKIP_ROW_TYPES:
+                    rows_el.remove(elem)
+                    continue
+                values = [None] * len(columns)
+                for col in elem:
+                    pos = index.get(col.get("id"))
+                    if pos is not None and col.text is not None:
+                        values[pos] = converters[pos](col.text)
+                rows_el.remove(elem)
+                yield "row", name, values
+            elif tag == "Dataset":
+                if rows_el is None:
+                    yield "columns", name, columns
+                elem.clear()
+                name = None
+    parser.close()
+
+
+def _events(source) -> Iterator[tuple]:
+    chunks = iter_text(source)
+    first = ""
+    for first in chunks:
+        if first.strip():
+            break
+    head = first.lstrip()
+
+    def replay():
+        yield first
+        yield from chunks
+
+    if head.startswith("SSV"):
+        return iter_ssv_events(replay())
+    if head.startswith("<"):
+        return iter_xml_events(replay())
+    return iter(())
+
+
+def iter_rows(source, dataset_id: str | None = None) -> Iterator[tuple[str, dict]]:
+    """Yield ``(dataset_id, row)`` pairs from an SSV or XML payload.
+
+    Parameters
+    ----------
+    source : str | bytes | file object | iterable of chunks
+        Transaction payload. The format is detected from its first bytes.
+    dataset_id : str | None, optional
+        If given, only rows of this dataset are produced.
+    """
+    names: list[str] = []
+    for kind, name, data in _events(source):
+        if dataset_id is not None and name != dataset_id:
+            continue
+        if kind == "columns":
+            names = [c for c, _ in data]
+        else:
+            yield name, dict(zip(names, data))
+
+
+def read_datasets(source) -> dict[str, list[dict]]:
+    """Parse every dataset of a payload into ``{dataset_id: rows}``."""
+    datasets: dict[str, list[dict]] = {}
+    names: list[str] = []
+    for kind, name, data in _events(source):
+        if kind == "columns":
+            names = [c for c, _ in data]
+            datasets[name] = []
+        else:
+            datasets[name].append(dict(zip(names, data)))
+    return datasets
+
+
+def read_columns(source, dataset_id: str | None = None) -> dict:
+    """Read one dataset into NumPy arrays, one array per column.
+
+    Integer columns containing nulls become ``float64`` with ``NaN``. When
+    ``dataset_id`` is omitted the first dataset of the payload is used.
+    """
+    if np is None:
+        raise RuntimeError("numpy가 설치되어 있지 않아 컬럼 모드를 사용할 수 없습니다")
+
+    columns: list[tuple[str, str]] | None = None
+    values: list[list] = []
+    for kind, name, data in _events(source):
+        if dataset_id is None:
+            dataset_id = name
+        if name != dataset_id:
+            if columns is not None:
+                break
+            continue
+        if kind == "columns":
+            columns = data
+            values = [[] for _ in data]
+        else:
+            for col_values, value in zip(values, data):
+                col_values.append(value)
+
+    result = {}
+    for (col, col_type), col_values in zip(columns or [], values):
+        dtype = NUMPY_DTYPES.get(col_type, "object")
+        if None in col_values:
+            if dtype == "int64" or dtype == "float64":
+                dtype = "float64"
+                col_values = [np.nan if v is None else v for v in col_values]
+            elif dtype.startswith("datetime64"):
+                col_values = ["NaT" if v is None else v for v in col_values]
+        result[col] = np.array(col_values, dtype=dtype)
+    return result
+
+
+def format_value(value) -> str:
+    """Return ``value`` as text for report files (``None`` becomes ``""``)."""
+    return "" if value is None else str(value)
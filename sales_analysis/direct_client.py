@@ -0,0 +1,223 @@
+"""Replay the sales-ratio transactions over HTTP instead of driving the grid.
+
+After login the browser is only needed for the session: the category list
+and the per-category details come from the portal's transaction endpoints.
+:class:`DirectSalesClient` sends those transactions itself through an
+:class:`~utils.http_pool.HTTPPool` seeded with the context's cookies, for any
+date window and many categories at once.
+
+Transactions are request templates in ``runtime_config["direct_client"]
+["transactions"]``: ``path`` and ``body`` are ``str.format`` templates with
+``{start}``/``{end}`` (``YYYYMMDD``) and ``{category}``; ``content_type`` is
+optional. The defaults are the mock portal's endpoints. For the live portal,
+take a request from the browser with :func:`template_from_request` and put
+the result into the config.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+from utils import log
+from utils.form_driver import nexacro_date
+from utils.http_pool import MAX_CONNECTIONS, TIMEOUT, HTTPPool
+from .category_pipeline import CategorySink, Window, fail_sinks, month_window
+from .dataset_parser import format_value, read_datasets
+from .transaction_capture import pick_dataset
+
+DEFAULT_TRANSACTIONS = {
+    "category_list": {"path": "/transaction/category_list", "body": ""},
+    "detail": {"path": "/transaction/detail_{category}", "body": ""},
+}
+
+DEFAULT_CONTENT_TYPE = "text/plain;charset=UTF-8"
+
+
+def template_from_request(request, values: dict[str, str]) -> dict:
+    """Turn a recorded Playwright ``Request`` into a transaction template.
+
+    ``values`` maps placeholder names to the literal values used in that
+    request, e.g. ``{"start": "20240501", "category": "001"}``.
+    """
+    parts = urlsplit(request.url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    body = request.post_data or ""
+    # 본문의 중괄호가 format 자리표시자로 읽히지 않게 한다
+    path, body = (s.replace("{", "{{").replace("}", "}}") for s in (path, body))
+    for name, literal in values.items():
+        path = path.replace(literal, f"{{{name}}}")
+        body = body.replace(literal, f"{{{name}}}")
+    template = {"path": path, "body": body}
+    content_type = request.headers.get("content-type")
+    if content_type:
+        template["content_type"] = content_type
+    return template
+
+
+def _sink_rows(rows: list[dict]) -> list[dict]:
+    result = []
+    for values in rows:
+        cells = [format_value(v).strip() for v in values.values()]
+        result.append({"cells": cells, "text": "\t".join(cells).strip(), "values": values})
+    return result
+
+
+class DirectSalesClient:
+    """Category list and detail transactions sent without the browser.
+
+    Parameters
+    ----------
+    pool : HTTPPool
+        Connections carrying the logged-in session's cookies.
+    transactions : dict | None, optional
+        ``category_list`` and ``detail`` templates (see module docstring).
+    category_dataset, detail_dataset : str | None, optional
+        Dataset ids to read; the largest dataset when omitted.
+    """
+
+    def __init__(
+        self,
+        pool: HTTPPool,
+        transactions: dict | None = None,
+        *,
+        category_dataset: str | None = None,
+        detail_dataset: str | None = None,
+    ):
+        self.pool = pool
+        self.transactions = {**DEFAULT_TRANSACTIONS, **(transactions or {})}
+        self.category_dataset = category_dataset
+        self.detail_dataset = detail_dataset
+
+    def transaction(self, name: str, **params) -> dict[str, list[dict]]:
+        """Send transaction ``name`` with ``params`` and return its datasets."""
+        template = self.transactions[name]
+        payload = self.pool.request(
+            "POST",
+            template["path"].format(**params),
+            template.get("body", "").format(**params),
+            {"Content-Type": template.get("content_type", DEFAULT_CONTENT_TYPE)},
+        )
+        return read_datasets(payload)
+
+    def categories(self, start_str: str, end_str: str) -> list[str]:
+        """Middle category codes of the window, in grid order."""
+        rows = pick_dataset(
+            self.transaction("category_list", start=nexacro_date(start_str), end=nexacro_date(end_str)),
+            self.category_dataset,
+        )
+        return [format_value(next(iter(row.values()), None)).strip() for row in rows]
+
+    def details(self, code: str, start_str: str, end_str: str) -> list[dict]:
+        """Detail rows of category ``code`` in the shape sinks expect."""
+        rows = pick_dataset(
+            self.transaction("detail", category=code, start=nexacro_date(start_str), end=nexacro_date(end_str)),
+            self.detail_dataset,
+        )
+        return _sink_rows(rows)
+
+    def iter_categories(
+        self,
+        start_str: str,
+        end_str: str,
+        accept: Callable[[str], bool] | None = None,
+        concurrency: int | None = None,
+    ) -> Iterator[tuple[str, list[dict]]]:
+        """Yield ``(code, rows)`` in grid order, fetching ``concurrency`` details at once."""
+        codes = self.categories(start_str, end_str)
+        log(f"📡 중분류 {len(codes)}건 수신 (직접 요청)")
+        codes = [code for code in codes if accept is None or accept(code)]
+        workers = max(1, min(concurrency or self.pool.max_connections, self.pool.max_connections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map 은 완료 순서와 관계없이 입력 순서대로 돌려준다
+            yield from zip(codes, executor.map(lambda code: self.details(code, start_str, end_str), codes))
+
+
+def direct_options(cfg: dict) -> dict:
+    """Read ``runtime_config["direct_client"]`` with the module defaults filled in."""
+    options = cfg.get("direct_client", {})
+    return {
+        "enabled": options.get("enabled", False),
+        "max_connections": options.get("max_connections", MAX_CONNECTIONS),
+        "timeout": options.get("timeout", TIMEOUT),
+        "transactions": options.get("transactions"),
+        "category_dataset": options.get("category_dataset"),
+        "detail_dataset": options.get("detail_dataset"),
+    }
+
+
+def _client(pool: HTTPPool, options: dict) -> DirectSalesClient:
+    return DirectSalesClient(
+        pool,
+        options["transactions"],
+        category_dataset=options["category_dataset"],
+        detail_dataset=options["detail_dataset"],
+    )
+
+
+def direct_client_from_context(context, url: str, cfg: dict) -> DirectSalesClient:
+    """Client for the portal at ``url`` using a sync API context's session."""
+    options = direct_options(cfg)
+    pool = HTTPPool.from_context(context, url, max_connections=options["max_connections"], timeout=options["timeout"])
+    return _client(pool, options)
+
+
+async def direct_client_from_context_async(context, url: str, cfg: dict) -> DirectSalesClient:
+    """Async API counterpart of :func:`direct_client_from_context`."""
+    options = direct_options(cfg)
+    pool = await HTTPPool.from_context_async(
+        context, url, max_connections=options["max_connections"], timeout=options["timeout"]
+    )
+    return _client(pool, options)
+
+
+def run_direct_pipeline(
+    client: DirectSalesClient,
+    sinks: list[CategorySink],
+    *,
+    windows: list[Window] | None = None,
+    concurrency: int | None = None,
+) -> list[Path | None]:
+    """:func:`~sales_analysis.category_pipeline.run_category_pipeline` over HTTP.
+
+    Parameters
+    ----------
+    client : DirectSalesClient
+        Client carrying the logged-in session.
+    sinks : list[CategorySink]
+        Outputs receiving the detail rows.
+    windows : list[Window] | None, optional
+        Date windows as ``(start, end, accept)``; defaults to this month.
+    concurrency : int | None, optional
+        Detail transactions in flight at once, capped by the pool size.
+
+    Returns
+    -------
+    list[Path | None]
+        Result of :meth:`CategorySink.close` for each sink, in order.
+    """
+    if windows is None:
+        windows = [month_window()]
+    context = {
+        "start": min((w[0] for w in windows), default=None),
+        "end": max((w[1] for w in windows), default=None),
+    }
+    for sink in sinks:
+        sink.open(context)
+    try:
+        for start_str, end_str, accept in windows:
+            log(f"🟡 직접 요청으로 추출 ({start_str} ~ {end_str})")
+            for sink in sinks:
+                sink.begin_window(start_str, end_str)
+            for code, rows in client.iter_categories(start_str, end_str, accept, concurrency):
+                if not rows:
+                    log(f"❌ 상세 데이터 없음: {code}")
+                for sink in sinks:
+                    sink.write(code, rows)
+    except BaseException as e:
+        fail_sinks(sinks, e)
+        raise
+    finally:
+        results = [sink.close() for sink in sinks]
+        client.pool.report()
+    return results
@@ -1,92 +1,67 @@
-import datetime
 from pathlib import Path
-from playwright.sync_api import Page, expect
-from utils import popups_handled, log, wait
+from playwright.sync_api import Page
+from utils import log
+from .category_pipeline import OUTPUT_DIR, CategorySink, run_category_pipeline
 
+# 기존 import 경로 호환을 위해 재노출
+from .category_pipeline import SEARCH_BUTTON_SELECTOR, set_month_date_range
 
-def set_month_date_range(page: Page) -> tuple[str, str]:
-    """Set the from/to date fields to the first day of this month through today."""
-    today = datetime.date.today()
-    start = today.replace(day=1)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = today.strftime("%Y-%m-%d")
 
-    start_input = page.locator("input[id$='calFromDay.calendaredit:input']")
-    if start_input.count() > 0:
-        wait(page)
-        start_input.click()
-        wait(page)
-        start_input.fill(start_str)
-        wait(page)
-        start_input.press("Enter")
-        wait(page)
+HISTORY_FILE_NAME = "중분류상세매출_누적.txt"
 
-    end_input = page.locator("input[id$='calToDay.calendaredit:input']")
-    if end_input.count() > 0:
-        wait(page)
-        end_input.click()
-        wait(page)
-        end_input.fill(end_str)
-        wait(page)
-        end_input.press("Enter")
-        wait(page)
 
-    return start_str, end_str
+class SalesTextSink(CategorySink):
+    """Write detail rows to ``중분류상세매출_{end}.txt``.
 
+    With ``history=True`` the rows are appended to ``중분류상세매출_누적.txt``
+    under a ``[기간: start ~ end]`` header per queried window instead.
+    ``append=True`` keeps the rows already in the file, used when resuming
+    a failed run.
+    """
 
-def extract_sales_detail(page: Page) -> Path:
-    """Extract daily sales details for each middle category."""
-    if not popups_handled():
-        raise RuntimeError("팝업 처리가 완료되지 않아 데이터 추출을 중단합니다")
+    def __init__(self, output_dir: Path = OUTPUT_DIR, *, history: bool = False, append: bool = False):
+        self.output_dir = output_dir
+        self.history = history
+        self.append = append
+        self.total = 0
 
-    log("🟡 날짜 설정 시작")
-    start_str, end_str = set_month_date_range(page)
+    def open(self, context: dict) -> None:
+        super().open(context)
+        if self.history:
+            self.out_path = self.output_dir / HISTORY_FILE_NAME
+            self._file = self.out_path.open("a", encoding="utf-8")
+        else:
+            self.out_path = self.output_dir / f"중분류상세매출_{context['end']}.txt"
+            self._file = self.out_path.open("a" if self.append else "w", encoding="utf-8")
 
-    search_btn = page.locator("div.nexacontentsbox:has-text('조 회')")
-    if search_btn.count() > 0:
-        wait(page)
-        search_btn.first.click()
-        wait(page)
-        page.wait_for_load_state("networkidle")
-        wait(page)
-    else:
-        log("⚠️ 조회 버튼을 찾을 수 없습니다")
+    def begin_window(self, start: str, end: str) -> None:
+        super().begin_window(start, end)
+        if self.history:
+            self._file.write(f"[기간: {start} ~ {end}]\n")
 
-    left_rows = page.locator("div[class^='gridrow_'] .cell_0_0")
-    row_count = left_rows.count()
+    def write(self, category: str, rows: list[dict]) -> None:
+        if not rows:
+            return
+        self.total += len(rows)
+        self._file.write(f"[중분류: {category}]\n")
+        for d_row in rows:
+            if d_row["text"]:
+                self._file.write(d_row["text"] + "\n")
+        self._file.write("\n")
 
-    output_dir = Path(__file__).resolve().parent
-    file_name = f"중분류상세매출_{end_str}.txt"
-    out_path = output_dir / file_name
+    def close(self) -> Path:
+        self._file.close()
+        if self.error is not None:
+            log(f"⚠️ 추출 중단으로 매출상세 데이터 일부만 저장 → {self.out_path}")
+        elif self.total > 0:
+            log(f"✅ 매출상세 데이터 저장 → {self.out_path}")
+        return self.out_path
 
-    log("🟡 중분류별 매출 상세 추출 시작")
-    total_details = 0
-    with out_path.open("w", encoding="utf-8") as f:
-        for i in range(row_count):
-            row = left_rows.nth(i)
-            code = row.inner_text().strip()
-            wait(page)
-            row.click()
-            wait(page)
-            expect(page.locator("#gdDetail div[class^='gridrow_']")).to_be_visible(timeout=3000)
 
-            container = page.locator("div[id*='gdDetail']")
-            details = page.locator("#gdDetail div[class^='gridrow_']")
-            if container.count() == 0 or details.count() == 0:
-                log("❌ 상세 테이블 항목 없음")
-                continue
+def extract_sales_detail(page: Page, *, capture: bool = False) -> Path:
+    """Extract daily sales details for each middle category.
 
-            detail_count = details.count()
-            total_details += detail_count
-            f.write(f"[중분류: {code}]\n")
-            for j in range(detail_count):
-                d_row = details.nth(j)
-                text = d_row.inner_text().replace("\n", "\t").strip()
-                if text:
-                    f.write(text + "\n")
-            f.write("\n")
-            wait(page)
-
-    if total_details > 0:
-        log(f"✅ 매출상세 데이터 저장 → {out_path}")
-    return out_path
+    When ``capture`` is ``True`` the rows are read from the Nexacro
+    transaction responses instead of the rendered grids.
+    """
+    return run_category_pipeline(page, [SalesTextSink()], capture=capture)[0]
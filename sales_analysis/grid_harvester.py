@@ -0,0 +1,279 @@
+import time
+
+from playwright.sync_api import Page
+from utils import log
+
+# 상세 그리드(#gdDetail)의 행과 셀 선택자
+DETAIL_ROW_SELECTOR = "#gdDetail div[class^='gridrow_']"
+# 중분류 그리드 행 (상세 그리드 행 제외)
+CATEGORY_ROW_SELECTOR = "div[class^='gridrow_']:not(#gdDetail *)"
+CELL_SELECTOR = "div[class^='cell_'], div[class*=' cell_']"
+
+_HARVEST_JS = """
+({ rowSelector, cellSelector }) => {
+    const rows = document.querySelectorAll(rowSelector);
+    return Array.from(rows, (row, index) => {
+        let cells = row.querySelectorAll(cellSelector);
+        if (cells.length === 0) {
+            cells = row.querySelectorAll("div");
+        }
+        return {
+            index,
+            id: row.id || null,
+            text: row.innerText,
+            cells: Array.from(cells, (cell) => cell.innerText.trim()),
+        };
+    });
+}
+"""
+
+
+def harvest_grid(
+    page: Page,
+    row_selector: str = DETAIL_ROW_SELECTOR,
+    cell_selector: str = CELL_SELECTOR,
+) -> list[dict]:
+    """Read every rendered row of a grid in a single ``page.evaluate`` call.
+
+    Parameters
+    ----------
+    page : Page
+        Playwright page showing the grid.
+    row_selector : str, optional
+        CSS selector matching the grid rows. Defaults to the ``#gdDetail`` rows.
+    cell_selector : str, optional
+        CSS selector for cells inside a row. When a row has no matching cell,
+        all ``div`` descendants are used instead.
+
+    Returns
+    -------
+    list[dict]
+        One dict per row with ``index``, ``id``, ``text`` and ``cells`` keys.
+    """
+    return page.evaluate(
+        _HARVEST_JS, {"rowSelector": row_selector, "cellSelector": cell_selector}
+    )
+
+
+def row_text(row: dict) -> str:
+    """Return the row text flattened to a single tab separated line."""
+    return row["text"].replace("\n", "\t").strip()
+
+
+# 가상 스크롤 그리드 공통 헬퍼: 스크롤 컨테이너가 없으면 wheel 이벤트로 넘긴다
+_VIRTUAL_HELPERS_JS = """
+const makeGrid = ({ rowSelector, cellSelector, mutationTimeout }) => {
+    const readCells = (row) => {
+        let cells = row.querySelectorAll(cellSelector);
+        if (cells.length === 0) {
+            cells = row.querySelectorAll("div");
+        }
+        return Array.from(cells, (cell) => cell.innerText.trim());
+    };
+    const first = document.querySelector(rowSelector);
+    let scroller = first ? first.parentElement : null;
+    while (scroller && scroller.scrollHeight <= scroller.clientHeight + 1) {
+        scroller = scroller.parentElement;
+    }
+    if (scroller === document.documentElement || scroller === document.body) {
+        scroller = null;
+    }
+    const observed = scroller || (first && first.parentElement) || document.body;
+    // 데이터상의 행 번호: 접근성 속성이 있으면 쓰고, 없으면 스크롤 내용 안의 위치로 계산한다
+    // (Nexacro 는 화면의 행 div 를 재사용하므로 id 의 gridrow_N 은 화면 슬롯 번호다)
+    const rowIndex = (row) => {
+        const attr = row.getAttribute("aria-rowindex") ?? row.getAttribute("data-row");
+        if (attr !== null && attr !== "" && !Number.isNaN(Number(attr))) {
+            return Number(attr);
+        }
+        if (!scroller) {
+            return null;
+        }
+        const r = row.getBoundingClientRect();
+        if (r.height <= 0) {
+            return null;
+        }
+        const top = r.top - scroller.getBoundingClientRect().top + scroller.scrollTop;
+        return Math.round(top / r.height);
+    };
+    const nextMutation = () => new Promise((resolve) => {
+        const observer = new MutationObserver(() => {
+            observer.disconnect();
+            clearTimeout(timer);
+            requestAnimationFrame(() => resolve(true));
+        });
+        observer.observe(observed, { childList: true, subtree: true, characterData: true, attributes: true });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, mutationTimeout);
+    });
+    // 한 화면 아래로 이동; 더 내려갈 수 없으면 false
+    const step = async () => {
+        const mutation = nextMutation();
+        if (scroller) {
+            const previousTop = scroller.scrollTop;
+            scroller.scrollTop = previousTop + Math.max(scroller.clientHeight - 1, 1);
+            if (scroller.scrollTop === previousTop) {
+                return false;
+            }
+            await mutation;
+            return true;
+        }
+        observed.dispatchEvent(
+            new WheelEvent("wheel", { deltaY: Math.max(observed.clientHeight, 100), bubbles: true })
+        );
+        return await mutation;
+    };
+    const rewind = async () => {
+        if (scroller && scroller.scrollTop !== 0) {
+            const mutation = nextMutation();
+            scroller.scrollTop = 0;
+            await mutation;
+        }
+    };
+    return { first, scroller, readCells, rowIndex, step, rewind };
+};
+"""
+
+_VIRTUAL_READ_JS = (
+    "async (args) => {"
+    + _VIRTUAL_HELPERS_JS
+    + """
+    const { rowSelector, maxIdle, maxSteps } = args;
+    const grid = makeGrid(args);
+    const seen = new Map();
+    const collect = () => {
+        for (const row of document.querySelectorAll(rowSelector)) {
+            const cells = grid.readCells(row);
+            // 행 번호를 알 수 없으면(휠 스크롤) 셀 전체로 같은 행을 가린다
+            const index = grid.rowIndex(row);
+            const key = index === null ? `cells:${JSON.stringify(cells)}` : `row:${index}`;
+            if (!seen.has(key)) {
+                seen.set(key, { index: seen.size, id: row.id || null, text: row.innerText, cells });
+            }
+        }
+    };
+    if (!grid.first) {
+        return { rows: [], scrolls: 0 };
+    }
+    await grid.rewind();
+    collect();
+    let idle = 0;
+    let scrolls = 0;
+    while (idle < maxIdle && scrolls < maxSteps) {
+        const before = seen.size;
+        const moved = await grid.step();
+        scrolls += 1;
+        collect();
+        if (seen.size > before) {
+            idle = 0;
+        } else if (!moved) {
+            break;
+        } else {
+            idle += 1;
+        }
+    }
+    await grid.rewind();
+    return { rows: Array.from(seen.values()), scrolls };
+}
+"""
+)
+
+_SCROLL_TO_ROW_JS = (
+    "async (args) => {"
+    + _VIRTUAL_HELPERS_JS
+    + """
+    const { rowSelector, keyIndex, key, maxSteps } = args;
+    const grid = makeGrid(args);
+    const find = () =>
+        Array.from(document.querySelectorAll(rowSelector)).findIndex(
+            (row) => grid.readCells(row)[keyIndex] === key
+        );
+    let index = find();
+    if (index >= 0 || !grid.first) {
+        return index;
+    }
+    await grid.rewind();
+    index = find();
+    for (let step = 0; index < 0 && step < maxSteps; step++) {
+        if (!(await grid.step())) {
+            break;
+        }
+        index = find();
+    }
+    return index;
+}
+"""
+)
+
+
+def read_virtual_grid(
+    page: Page,
+    row_selector: str = DETAIL_ROW_SELECTOR,
+    *,
+    cell_selector: str = CELL_SELECTOR,
+    mutation_timeout: int = 1000,
+    max_idle: int = 2,
+    max_steps: int = 10000,
+) -> list[dict]:
+    """Read all rows of a virtually scrolled grid.
+
+    Nexacro grids only render the visible rows, so the grid body is scrolled
+    page by page and rows are collected until the set stops growing. New
+    rows are awaited with a ``MutationObserver`` rather than fixed sleeps.
+    Rows seen twice are dropped by their virtual row index (the
+    ``aria-rowindex``/``data-row`` attribute, else the row's offset in the
+    scrolled content), so distinct rows with the same product code are
+    kept. Grids scrolled by wheel events only, with no index attribute,
+    fall back to comparing all cells.
+
+    Returns
+    -------
+    list[dict]
+        Rows in first-seen order, shaped like :func:`harvest_grid` rows.
+    """
+    start = time.perf_counter()
+    result = page.evaluate(
+        _VIRTUAL_READ_JS,
+        {
+            "rowSelector": row_selector,
+            "cellSelector": cell_selector,
+            "mutationTimeout": mutation_timeout,
+            "maxIdle": max_idle,
+            "maxSteps": max_steps,
+        },
+    )
+    elapsed = time.perf_counter() - start
+    rows = result["rows"]
+    if result["scrolls"]:
+        rate = len(rows) / elapsed if elapsed > 0 else float("inf")
+        log(f"📜 가상 스크롤 {result['scrolls']}회, {len(rows)}행 ({rate:.0f} rows/s)")
+    return rows
+
+
+def click_grid_row(
+    page: Page,
+    row_selector: str,
+    key: str,
+    *,
+    key_index: int = 0,
+    cell_selector: str = CELL_SELECTOR,
+    mutation_timeout: int = 1000,
+    max_steps: int = 10000,
+) -> None:
+    """Scroll the grid until the row whose key cell equals ``key`` is rendered and click it."""
+    index = page.evaluate(
+        _SCROLL_TO_ROW_JS,
+        {
+            "rowSelector": row_selector,
+            "cellSelector": cell_selector,
+            "keyIndex": key_index,
+            "key": key,
+            "mutationTimeout": mutation_timeout,
+            "maxSteps": max_steps,
+        },
+    )
+    if index < 0:
+        raise RuntimeError(f"그리드에서 행을 찾을 수 없습니다: {key}")
+    page.locator(row_selector).nth(index).click()
@@ -1,56 +1,64 @@
 import json
 import datetime
 from pathlib import Path
-from playwright.sync_api import Page, expect
-from utils import popups_handled, log, wait
+from playwright.sync_api import Page
+from utils import log
+from .category_pipeline import OUTPUT_DIR, CategorySink, run_category_pipeline
 
 
-def extract_middle_category_products(page: Page) -> Path:
+class ProductJsonSink(CategorySink):
+    """Collect product codes and names into ``중분류상품_{YYYYMMDD}.json``.
+
+    With ``append=True`` categories already saved in that file are kept and
+    the new ones are added, used when resuming a failed run.
+    """
+
+    def __init__(self, output_dir: Path = OUTPUT_DIR, *, append: bool = False):
+        self.output_dir = output_dir
+        self.append = append
+        self.result: list[dict] = []
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        products: list[dict] = []
+        for d_row in rows:
+            cells = d_row["cells"]
+            if len(cells) >= 2:
+                code, name = cells[0], cells[1]
+                if code and name:
+                    products.append({"code": code, "name": name})
+        self.result.append({"category": category, "products": products})
+
+    def close(self) -> Path:
+        file_name = f"중분류상품_{datetime.date.today():%Y%m%d}.json"
+        out_path = self.output_dir / file_name
+        if self.append and out_path.exists():
+            written = {item["category"] for item in self.result}
+            previous = json.loads(out_path.read_text(encoding="utf-8"))
+            self.result = [item for item in previous if item["category"] not in written] + self.result
+        with out_path.open("w", encoding="utf-8") as f:
+            json.dump(self.result, f, ensure_ascii=False, indent=2)
+
+        if self.error is not None:
+            log(f"⚠️ 추출 중단으로 중분류 {len(self.result)}건만 저장 → {out_path}")
+        else:
+            log(f"✅ 상품코드 및 상품명 저장 → {out_path}")
+        return out_path
+
+
+def extract_middle_category_products(page: Page, *, capture: bool = False) -> Path:
     """Extract product codes and names for each middle category.
 
     Parameters
     ----------
     page : Page
         Playwright page already navigated to the middle category sales page.
+    capture : bool, optional
+        If ``True``, read products from the transaction responses instead of
+        the rendered detail grid.
 
     Returns
     -------
     Path
         Path to the saved JSON file.
     """
-    if not popups_handled():
-        raise RuntimeError("팝업 처리가 완료되지 않았습니다.")
-
-    left_rows = page.locator("div[class^='gridrow_'] .cell_0_0")
-    row_count = left_rows.count()
-
-    result: list[dict] = []
-    for i in range(row_count):
-        row = left_rows.nth(i)
-        category = row.inner_text().strip()
-        wait(page)
-        row.click()
-        wait(page)
-        expect(page.locator("#gdDetail div[class^='gridrow_']")).to_be_visible(timeout=3000)
-
-        detail_rows = page.locator("#gdDetail div[class^='gridrow_']")
-        products: list[dict] = []
-        for j in range(detail_rows.count()):
-            d_row = detail_rows.nth(j)
-            cells = d_row.locator("div")
-            if cells.count() >= 2:
-                code = cells.nth(0).inner_text().strip()
-                name = cells.nth(1).inner_text().strip()
-                if code and name:
-                    products.append({"code": code, "name": name})
-        result.append({"category": category, "products": products})
-
-    output_dir = Path(__file__).resolve().parent
-    file_name = f"중분류상품_{datetime.date.today():%Y%m%d}.json"
-    out_path = output_dir / file_name
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-        wait(page)
-
-    log(f"✅ 상품코드 및 상품명 저장 → {out_path}")
-    return out_path
+    return run_category_pipeline(page, [ProductJsonSink()], capture=capture)[0]
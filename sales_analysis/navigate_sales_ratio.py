@@ -9,7 +9,19 @@ from utils import (
     popups_handled,
     log,
     wait,
+    request_policy_from_config,
+    configure_popup_rules,
+    configure_popup_watch,
+    configure_form_driver,
+    configure_waits,
+    configure_transaction_watch,
+    transaction_mark,
+    wait_for_transactions,
+    wait_report,
+    watch_popups,
+    watch_transactions,
 )
+from utils.form_driver import open_menu_by_id
 from browser.popup_handler import setup_dialog_handler
 from browser.popup_handler_utility import close_all_popups_event
 
@@ -19,9 +31,9 @@ def click_sales_analysis_tab(page) -> bool:
     selector = "div.nexatextitem:has-text('매출분석')"
     try:
         element = page.wait_for_selector(selector, timeout=5000)
-        wait(page)
+        wait(page, step="menu")
         element.click()
-        wait(page)
+        wait(page, step="menu")
         log("'매출분석' 탭 클릭 성공")
         return True
     except Exception as e:
@@ -30,6 +42,8 @@ def click_sales_analysis_tab(page) -> bool:
 
 load_dotenv()
 
+SALES_RATIO_MENU = "중분류별 매출 구성비"
+
 # 프로젝트 루트 디렉터리 경로
 BASE_DIR = Path(__file__).resolve().parent.parent
 ROOT_DIR = BASE_DIR
@@ -53,9 +67,9 @@ def find_and_click(page, text: str) -> bool:
     for target in search_targets:
         locator = target.locator(f"text={text}")
         if locator.count() > 0:
-            wait(page)
+            wait(page, step="menu")
             locator.first.click()
-            wait(page)
+            wait(page, step="menu")
             return True
     return False
 
@@ -63,16 +77,20 @@ def find_and_click(page, text: str) -> bool:
 def navigate_sales_ratio(page):
     if not popups_handled():
         raise RuntimeError("팝업 처리가 완료되지 않아 메뉴 이동을 중단합니다")
-    wait(page)
-    if not click_sales_analysis_tab(page):
-        raise RuntimeError("Cannot find '매출분석' menu")
-    wait(page)
-    expect(page.locator("text=중분류별 매출 구성비")).to_be_visible(timeout=5000)
-    if not find_and_click(page, "중분류별 매출 구성비"):
-        raise RuntimeError("Cannot find '중분류별 매출 구성비' submenu")
-    wait(page)
-    page.wait_for_load_state("networkidle")
-    wait(page)
+    mark = transaction_mark(page)
+    if open_menu_by_id(page, SALES_RATIO_MENU):
+        log(f"'{SALES_RATIO_MENU}' 메뉴 id 로 열기")
+    else:
+        wait(page, step="menu")
+        if not click_sales_analysis_tab(page):
+            raise RuntimeError("Cannot find '매출분석' menu")
+        wait(page, step="menu")
+        expect(page.locator(f"text={SALES_RATIO_MENU}")).to_be_visible(timeout=5000)
+        mark = transaction_mark(page)
+        if not find_and_click(page, SALES_RATIO_MENU):
+            raise RuntimeError("Cannot find '중분류별 매출 구성비' submenu")
+    wait_for_transactions(page, mark, step="menu")
+    wait(page, step="menu")
 
 
 def run():
@@ -89,37 +107,47 @@ def run():
     url = "https://store.bgfretail.com/websrc/deploy/index.html"
 
     normal_exit = False
+    configure_popup_rules(cfg)
+    configure_popup_watch(cfg)
+    configure_waits(cfg)
+    configure_transaction_watch(cfg)
+    configure_form_driver(cfg)
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
         page = browser.new_page()
+        policy = request_policy_from_config(cfg)
+        if policy is not None:
+            policy.install(page)
         inject_init_cleanup_script(page)
+        watch_popups(page)
+        watch_transactions(page)
         setup_dialog_handler(page)
         try:
-            wait(page)
+            wait(page, step="login")
             page.goto(url)
-            wait(page)
+            wait(page, step="login")
 
             page.locator(st["id"]).click()
-            wait(page)
+            wait(page, step="login")
             page.keyboard.type(user_id)
-            wait(page)
+            wait(page, step="login")
             page.locator(st["password"]).click()
-            wait(page)
+            wait(page, step="login")
             page.keyboard.type(user_pw)
-            wait(page)
+            wait(page, step="login")
             page.locator(st["login_button"]).click()
-            wait(page)
+            wait(page, step="login")
 
             wait_after_login = cfg.get("wait_after_login", 0)
             if wait_after_login:
                 page.wait_for_timeout(wait_after_login * 1000)
-            wait(page)
+            wait(page, step="login")
 
             if not popups_handled():
                 if not close_all_popups_event(page):
                     log("❗ 팝업을 모두 닫지 못해 작업을 중단합니다")
                     return
-            wait(page)
+            wait(page, step="login")
 
             navigate_sales_ratio(page)
             log("메뉴 이동 완료")
@@ -129,6 +157,9 @@ def run():
         finally:
             try:
                 browser.close()
+                if policy is not None:
+                    policy.report()
+                wait_report()
             finally:
                 log("정상 종료" if normal_exit else "비정상 종료")
 
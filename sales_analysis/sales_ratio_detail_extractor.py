@@ -1,7 +1,7 @@
 import datetime
 from pathlib import Path
 from playwright.sync_api import Page
-from utils import popups_handled, log
+from utils import popups_handled, log, transaction_mark, wait, wait_for_transactions
 
 
 def set_current_month_range(page: Page) -> tuple[str, str]:
@@ -35,12 +35,13 @@ def set_current_month_range(page: Page) -> tuple[str, str]:
         if locator.count() > 0:
             locator.first.fill(end_str)
             break
+    mark = transaction_mark(page)
     for sel in button_selectors:
         locator = page.locator(sel)
         if locator.count() > 0:
             locator.first.click()
             break
-    page.wait_for_load_state("networkidle")
+    wait_for_transactions(page, mark, step="search")
     return start_str, end_str
 
 
@@ -66,7 +67,7 @@ def extract_sales_ratio_details(page: Page) -> Path:
             row = left_rows.nth(i)
             category = row.inner_text().strip()
             row.click()
-            page.wait_for_timeout(500)
+            wait(page, 500, step="category")
             details = page.locator("table:has(th:text('상품명')) tr")
             texts = [d.inner_text().strip() for d in details.all()]
             f.write(f"[중분류: {category}]\n")
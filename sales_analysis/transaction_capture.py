@@ -0,0 +1,127 @@
+from typing import Callable, Iterator
+
+from playwright.sync_api import Page, Response
+from utils import log
+from .dataset_parser import format_value, read_datasets
+from .grid_harvester import CATEGORY_ROW_SELECTOR, click_grid_row
+
+# 트랜잭션이 아닌 정적 리소스 확장자
+STATIC_SUFFIXES = (".js", ".xfdl", ".css", ".png", ".gif", ".jpg", ".svg", ".woff", ".woff2", ".html")
+
+
+def is_transaction_response(response: Response) -> bool:
+    """Return ``True`` if ``response`` looks like a Nexacro transaction."""
+    request = response.request
+    if request.resource_type not in ("xhr", "fetch"):
+        return False
+    path = response.url.split("?", 1)[0].lower()
+    return not path.endswith(STATIC_SUFFIXES)
+
+
+def parse_transaction_payload(payload: str | bytes) -> dict[str, list[dict]]:
+    """Parse an SSV or XML transaction payload into ``{dataset_id: rows}``."""
+    return read_datasets(payload)
+
+
+def pick_dataset(datasets: dict[str, list[dict]], dataset_id: str | None = None) -> list[dict]:
+    """Return rows of ``dataset_id`` or, if omitted, of the largest dataset."""
+    if dataset_id is not None:
+        return datasets.get(dataset_id, [])
+    if not datasets:
+        return []
+    return max(datasets.values(), key=len)
+
+
+class TransactionCapture:
+    """Collect dataset payloads from Nexacro transaction responses.
+
+    The capture listens to ``page.on("response")`` and keeps the most recent
+    rows of every dataset it sees. :meth:`run` performs an action and returns
+    the datasets of the transaction it triggered, so callers no longer need to
+    wait for the grid to render.
+    """
+
+    def __init__(self, page: Page, predicate: Callable[[Response], bool] = is_transaction_response):
+        self.page = page
+        self.predicate = predicate
+        self.datasets: dict[str, list[dict]] = {}
+        self.responses = 0
+        self._attached = False
+
+    def _on_response(self, response: Response) -> None:
+        if not self.predicate(response):
+            return
+        try:
+            parsed = parse_transaction_payload(response.body())
+        except Exception as e:
+            log(f"트랜잭션 응답 파싱 실패({response.url}): {e}")
+            return
+        if parsed:
+            self.responses += 1
+            self.datasets.update(parsed)
+
+    def attach(self) -> "TransactionCapture":
+        if not self._attached:
+            self.page.on("response", self._on_response)
+            self._attached = True
+        return self
+
+    def detach(self) -> None:
+        if self._attached:
+            self.page.remove_listener("response", self._on_response)
+            self._attached = False
+
+    def __enter__(self) -> "TransactionCapture":
+        return self.attach()
+
+    def __exit__(self, *exc) -> None:
+        self.detach()
+
+    def run(self, action: Callable[[], None], timeout: int = 10000) -> dict[str, list[dict]]:
+        """Run ``action`` and return the datasets of the response it caused."""
+        with self.page.expect_response(self.predicate, timeout=timeout) as info:
+            action()
+        parsed = parse_transaction_payload(info.value.body())
+        self.datasets.update(parsed)
+        return parsed
+
+
+def iter_captured_categories(
+    page: Page,
+    search: Callable[[], None],
+    *,
+    category_dataset: str | None = None,
+    detail_dataset: str | None = None,
+    category_row_selector: str = CATEGORY_ROW_SELECTOR,
+    accept: Callable[[str], bool] | None = None,
+) -> Iterator[dict]:
+    """Yield middle categories and their detail rows from transaction payloads.
+
+    ``search`` triggers the category query. Each category row is still
+    clicked once (scrolled into view first) so the portal sends its detail
+    transaction, but rows are taken from the response instead of the
+    rendered grid. Categories rejected by ``accept`` are not clicked.
+
+    Yields
+    ------
+    dict
+        ``{"category": code, "rows": [...]}`` in grid order.
+    """
+    capture = TransactionCapture(page)
+    categories = pick_dataset(capture.run(search), category_dataset)
+    log(f"📡 중분류 데이터셋 {len(categories)}건 수신")
+
+    for category in categories:
+        code = format_value(next(iter(category.values()), None)).strip()
+        if accept is not None and not accept(code):
+            continue
+        rows = pick_dataset(
+            capture.run(lambda: click_grid_row(page, category_row_selector, code)),
+            detail_dataset,
+        )
+        yield {"category": code, "rows": rows}
+
+
+def capture_category_details(page: Page, search: Callable[[], None], **kwargs) -> list[dict]:
+    """List version of :func:`iter_captured_categories`."""
+    return list(iter_captured_categories(page, search, **kwargs))
@@ -0,0 +1,291 @@
+"""Embedded SQLite warehouse for extracted sales.
+
+Products, categories and stores are normalized into their own tables.
+One-day windows are stored in ``daily_sales`` keyed by ``(store, date,
+category, product)``. Longer windows, such as the month-to-date totals of a
+non-incremental run, are totals for the whole period, not sales of their
+last day, so they go to ``period_sales`` keyed by ``(store, start, end,
+category, product)``. The database runs in WAL mode so reads do not block a
+running extraction.
+"""
+
+import datetime
+import json
+import re
+import sqlite3
+from pathlib import Path
+
+from utils import log
+from .category_pipeline import CategorySink
+
+WAREHOUSE_PATH = Path(__file__).resolve().parent / "sales_warehouse.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS store (
+    id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS category (
+    id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS product (
+    id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL UNIQUE,
+    name TEXT,
+    category_id INTEGER REFERENCES category(id)
+);
+CREATE TABLE IF NOT EXISTS daily_sales (
+    store_id INTEGER NOT NULL REFERENCES store(id),
+    sale_date TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES category(id),
+    product_id INTEGER NOT NULL REFERENCES product(id),
+    sale_qty REAL,
+    sale_amt REAL,
+    cells TEXT NOT NULL,
+    PRIMARY KEY (store_id, sale_date, category_id, product_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_daily_sales_product
+    ON daily_sales (store_id, product_id, sale_date);
+CREATE TABLE IF NOT EXISTS period_sales (
+    store_id INTEGER NOT NULL REFERENCES store(id),
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES category(id),
+    product_id INTEGER NOT NULL REFERENCES product(id),
+    sale_qty REAL,
+    sale_amt REAL,
+    cells TEXT NOT NULL,
+    PRIMARY KEY (store_id, period_start, period_end, category_id, product_id)
+) WITHOUT ROWID;
+"""
+
+# 이전 버전이 daily_sales 에 넣은 기간 합계 행을 period_sales 로 옮긴다
+MIGRATE_PERIOD_ROWS = """
+INSERT OR REPLACE INTO period_sales
+    (store_id, period_start, period_end, category_id, product_id, sale_qty, sale_amt, cells)
+SELECT store_id, period_start, sale_date, category_id, product_id, sale_qty, sale_amt, cells
+FROM daily_sales WHERE period_start <> sale_date;
+DELETE FROM daily_sales WHERE period_start <> sale_date;
+"""
+
+_UPSERT_SALES = """
+INSERT INTO daily_sales
+    (store_id, sale_date, period_start, category_id, product_id, sale_qty, sale_amt, cells)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (store_id, sale_date, category_id, product_id) DO UPDATE SET
+    period_start = excluded.period_start,
+    sale_qty = excluded.sale_qty,
+    sale_amt = excluded.sale_amt,
+    cells = excluded.cells
+"""
+
+_UPSERT_PERIOD = """
+INSERT INTO period_sales
+    (store_id, period_end, period_start, category_id, product_id, sale_qty, sale_amt, cells)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (store_id, period_start, period_end, category_id, product_id) DO UPDATE SET
+    sale_qty = excluded.sale_qty,
+    sale_amt = excluded.sale_amt,
+    cells = excluded.cells
+"""
+
+_NUMBER_RE = re.compile(r"^-?[\d,]+(\.\d+)?$")
+
+
+def parse_number(text: str) -> float | None:
+    """Parse ``"1,234"`` style cell text, returning ``None`` if not numeric."""
+    text = text.strip()
+    if not _NUMBER_RE.match(text):
+        return None
+    return float(text.replace(",", ""))
+
+
+class SalesWarehouse:
+    """Thin wrapper around the warehouse SQLite connection."""
+
+    def __init__(self, path: Path | str = WAREHOUSE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.executescript(MIGRATE_PERIOD_ROWS)
+        self._ids: dict[tuple[str, str], int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _id(self, table: str, code: str) -> int:
+        key = (table, code)
+        if key not in self._ids:
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} (code) VALUES (?)", (code,))
+            row = self.conn.execute(f"SELECT id FROM {table} WHERE code = ?", (code,)).fetchone()
+            self._ids[key] = row[0]
+        return self._ids[key]
+
+    def insert_sales(
+        self,
+        store: str,
+        start: str,
+        end: str,
+        category: str,
+        rows: list[list[str]],
+    ) -> int:
+        """Insert one category's rows in a single transaction.
+
+        Each row is a list of cell texts ``[code, name, qty, amount, ...]``.
+        Rows are upserted, so re-running a window replaces its data. A
+        one-day window (``start == end``) goes to ``daily_sales``, a longer
+        one to ``period_sales``.
+        """
+        with self.conn:
+            store_id = self._id("store", store)
+            category_id = self._id("category", category)
+            products = [(r[0], r[1] if len(r) > 1 else None, category_id) for r in rows if r and r[0]]
+            self.conn.executemany(
+                """
+                INSERT INTO product (code, name, category_id) VALUES (?, ?, ?)
+                ON CONFLICT (code) DO UPDATE SET
+                    name = COALESCE(excluded.name, product.name),
+                    category_id = excluded.category_id
+                """,
+                products,
+            )
+            ids = {}
+            for code, _, _ in products:
+                key = ("product", code)
+                if key not in self._ids:
+                    found = self.conn.execute("SELECT id FROM product WHERE code = ?", (code,)).fetchone()
+                    self._ids[key] = found[0]
+                ids[code] = self._ids[key]
+            self.conn.executemany(
+                _UPSERT_SALES if start == end else _UPSERT_PERIOD,
+                [
+                    (
+                        store_id,
+                        end,
+                        start,
+                        category_id,
+                        ids[r[0]],
+                        parse_number(r[2]) if len(r) > 2 else None,
+                        parse_number(r[3]) if len(r) > 3 else None,
+                        json.dumps(r, ensure_ascii=False),
+                    )
+                    for r in rows
+                    if r and r[0]
+                ],
+            )
+        return len(products)
+
+    def product_history(self, store: str, product_code: str, weeks: int = 8) -> list[tuple]:
+        """Return per-day ``(sale_date, period_start, qty, amount)`` for the last ``weeks`` weeks.
+
+        Only one-day windows count; period totals are in :meth:`period_totals`.
+        """
+        since = (datetime.date.today() - datetime.timedelta(weeks=weeks)).isoformat()
+        return self.conn.execute(
+            """
+            SELECT s.sale_date, s.period_start, s.sale_qty, s.sale_amt
+            FROM daily_sales s
+            JOIN store st ON st.id = s.store_id
+            JOIN product p ON p.id = s.product_id
+            WHERE st.code = ? AND p.code = ? AND s.sale_date >= ?
+            ORDER BY s.sale_date
+            """,
+            (store, product_code, since),
+        ).fetchall()
+
+    def period_totals(self, store: str, product_code: str) -> list[tuple]:
+        """Return ``(period_start, period_end, qty, amount)`` of every stored period."""
+        return self.conn.execute(
+            """
+            SELECT s.period_start, s.period_end, s.sale_qty, s.sale_amt
+            FROM period_sales s
+            JOIN store st ON st.id = s.store_id
+            JOIN product p ON p.id = s.product_id
+            WHERE st.code = ? AND p.code = ?
+            ORDER BY s.period_end, s.period_start
+            """,
+            (store, product_code),
+        ).fetchall()
+
+    def import_text_report(self, path: Path, store: str) -> int:
+        """Load an existing ``중분류상세매출_{date}.txt`` or ``_누적.txt`` report.
+
+        ``[기간: start ~ end]`` header lines set the period of the categories
+        below them. Without one, the file name date is used as the period end
+        and the first day of its month as the period start, matching how
+        those reports were queried.
+        """
+        path = Path(path)
+        start = end = None
+        try:
+            day = datetime.date.fromisoformat(path.stem.rsplit("_", 1)[-1])
+            start, end = day.replace(day=1).isoformat(), day.isoformat()
+        except ValueError:
+            # 누적 파일은 [기간: ...] 머리줄로 기간을 정한다
+            pass
+        total = 0
+        category = None
+        rows: list[list[str]] = []
+        for line in path.read_text(encoding="utf-8").splitlines() + [""]:
+            if line.startswith("[기간:"):
+                start, end = (part.strip() for part in line[len("[기간:"):].rstrip("]").split("~"))
+            elif line.startswith("[중분류:"):
+                if start is None:
+                    raise ValueError(f"기간을 알 수 없는 보고서입니다: {path.name}")
+                category = line[len("[중분류:"):].rstrip("]").strip()
+                rows = []
+            elif line.strip():
+                rows.append([c.strip() for c in line.split("\t")])
+            elif category is not None:
+                total += self.insert_sales(store, start, end, category, rows)
+                category = None
+        return total
+
+
+class WarehouseSink(CategorySink):
+    """Store each category's rows in :class:`SalesWarehouse`.
+
+    Without ``warehouse`` the sink opens ``path`` itself in :meth:`open`, on
+    the thread that later writes to it.
+    """
+
+    def __init__(
+        self,
+        store: str,
+        warehouse: SalesWarehouse | None = None,
+        *,
+        path: Path | str = WAREHOUSE_PATH,
+    ):
+        self.store = store
+        self.warehouse = warehouse
+        self.path = path
+        self._owns_warehouse = warehouse is None
+        self.total = 0
+
+    def open(self, context: dict) -> None:
+        super().open(context)
+        if self.warehouse is None:
+            self.warehouse = SalesWarehouse(self.path)
+
+    def write(self, category: str, rows: list[dict]) -> None:
+        start, end = self.window
+        self.total += self.warehouse.insert_sales(
+            self.store, start, end, category, [r["cells"] for r in rows]
+        )
+
+    def close(self) -> Path:
+        if self.error is not None:
+            log(f"⚠️ 추출 중단, 매출 웨어하우스에 {self.total}건만 저장 → {self.warehouse.path}")
+        else:
+            log(f"✅ 매출 웨어하우스 저장 {self.total}건 → {self.warehouse.path}")
+        path = Path(self.warehouse.path)
+        if self._owns_warehouse:
+            self.warehouse.close()
+            self.warehouse = None
+        return path
@@ -1 +1,16 @@
 from .common import *
+from .run_journal import RunJournal, run_journal
+from .session_cache import SessionCache
+from .request_policy import RequestPolicy, request_policy_from_config
+from .asset_cache import AssetCache
+from .http_pool import HTTPPool, SessionExpired
+from .popup_watch import configure_popup_watch, watch_popups
+from .popup_rules import PopupRuleEngine, configure_popup_rules, popup_rule_engine
+from .wait_engine import configure_waits, reset_waits, wait_report
+from .form_driver import configure_form_driver
+from .transaction_watch import (
+    configure_transaction_watch,
+    transaction_mark,
+    wait_for_transactions,
+    watch_transactions,
+)
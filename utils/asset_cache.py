@@ -0,0 +1,260 @@
+"""Content-addressed disk cache for the static Nexacro deploy files.
+
+Every run starts from an empty browser profile, and routing disables
+Chromium's own HTTP cache, so the runtime JS, XFDL forms and CSS would be
+downloaded again by every context. :class:`AssetCache` serves matching GET
+requests from ``ASSET_CACHE_DIR`` through ``route.fulfill``:
+
+- within ``fresh_seconds`` of the last check a file is served straight from
+  disk
+- after that it is revalidated with ``If-None-Match`` / ``If-Modified-Since``;
+  a 304 serves the disk copy, a 200 replaces it
+- bodies are stored once per SHA-256 under ``objects/`` and the least
+  recently used URLs are evicted beyond ``max_bytes``
+
+The index is shared by all contexts of a process and saved by :meth:`save`.
+"""
+
+import fnmatch
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+from .common import log
+
+ASSET_CACHE_DIR = Path(__file__).resolve().parent.parent / "asset_cache"
+
+DEFAULT_PATTERNS = [
+    "*/websrc/deploy/*.js*",
+    "*/websrc/deploy/*.xfdl*",
+    "*/websrc/deploy/*.xjs*",
+    "*/websrc/deploy/*.css*",
+]
+
+# 디스크 응답에 되돌려 줄 헤더
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class AssetCache:
+    """URL index plus SHA-256 addressed bodies on disk.
+
+    Parameters
+    ----------
+    directory : Path, optional
+        Cache root holding ``index.json`` and ``objects/``.
+    patterns : list[str] | None, optional
+        URL globs of the static files to cache.
+    max_bytes : int, optional
+        Size cap of the stored bodies.
+    fresh_seconds : float, optional
+        How long a file is served without revalidation.
+    """
+
+    def __init__(
+        self,
+        directory: Path = ASSET_CACHE_DIR,
+        *,
+        patterns: list[str] | None = None,
+        max_bytes: int = 200 * 1024 * 1024,
+        fresh_seconds: float = 300,
+    ):
+        self.directory = Path(directory)
+        self.patterns = list(DEFAULT_PATTERNS if patterns is None else patterns)
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.index: dict[str, dict] = {}
+        index_path = self.directory / "index.json"
+        if index_path.exists():
+            try:
+                self.index = json.loads(index_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                log(f"⚠️ 정적 파일 캐시 색인 로드 실패: {e}")
+        # sync 페이지와 병렬 추출 스레드가 같은 캐시를 쓸 수 있다
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_from_disk = 0
+
+    def matches(self, url: str) -> bool:
+        return any(fnmatch.fnmatchcase(url, p) for p in self.patterns)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def _lookup(self, url: str) -> dict | None:
+        entry = self.index.get(url)
+        if entry is None or not self._object_path(entry["hash"]).exists():
+            return None
+        return entry
+
+    def _fresh(self, entry: dict) -> bool:
+        return time.time() - entry["checked"] < self.fresh_seconds
+
+    @staticmethod
+    def _conditional_headers(entry: dict | None) -> dict:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry["headers"].get("etag"):
+            headers["if-none-match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            headers["if-modified-since"] = entry["headers"]["last-modified"]
+        return headers
+
+    def _serve(self, entry: dict, *, revalidated: bool = False) -> dict | None:
+        """Record a disk hit and return ``route.fulfill`` arguments.
+
+        Returns ``None`` if the body was evicted in the meantime.
+        """
+        try:
+            body = self._object_path(entry["hash"]).read_bytes()
+        except OSError:
+            return None
+        now = time.time()
+        with self._lock:
+            entry["used"] = now
+            if revalidated:
+                entry["checked"] = now
+                self.revalidated += 1
+            else:
+                self.hits += 1
+            self.bytes_from_disk += entry["size"]
+        return {"status": 200, "headers": dict(entry["headers"]), "body": body}
+
+    def _store(self, url: str, headers: dict, body: bytes) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            tmp.replace(path)
+        now = time.time()
+        with self._lock:
+            self.misses += 1
+            self.index[url] = {
+                "hash": digest,
+                "size": len(body),
+                "headers": {k: headers[k] for k in _KEPT_HEADERS if k in headers},
+                "checked": now,
+                "used": now,
+            }
+            self._evict()
+
+    def _evict(self) -> None:
+        # 같은 본문을 여러 URL 이 공유하므로 해시 단위로 크기를 센다
+        sizes = {e["hash"]: e["size"] for e in self.index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            del self.index[url]
+            if all(e["hash"] != entry["hash"] for e in self.index.values()):
+                self._object_path(entry["hash"]).unlink(missing_ok=True)
+                total -= entry["size"]
+
+    def install(self, target) -> None:
+        """Serve matching requests of a sync API context or page from disk."""
+
+        def _handle(route) -> None:
+            request = route.request
+            if request.method != "GET" or not self.matches(request.url):
+                route.fallback()
+                return
+            entry = self._lookup(request.url)
+            if entry is not None and self._fresh(entry):
+                cached = self._serve(entry)
+                if cached is not None:
+                    route.fulfill(**cached)
+                    return
+            try:
+                response = route.fetch(headers={**request.headers, **self._conditional_headers(entry)})
+            except Exception:
+                route.fallback()
+                return
+            if response.status == 304 and entry is not None:
+                cached = self._serve(entry, revalidated=True)
+                if cached is not None:
+                    route.fulfill(**cached)
+                else:
+                    # 재검증 사이에 삭제된 경우 조건 없이 다시 받는다
+                    route.fallback()
+                return
+            body = response.body()
+            if response.ok:
+                self._store(request.url, response.headers, body)
+            route.fulfill(response=response, body=body)
+
+        target.route("**/*", _handle)
+
+    async def install_async(self, target) -> None:
+        """Async API counterpart of :meth:`install`."""
+
+        async def _handle(route) -> None:
+            request = route.request
+            if request.method != "GET" or not self.matches(request.url):
+                await route.fallback()
+                return
+            entry = self._lookup(request.url)
+            if entry is not None and self._fresh(entry):
+                cached = self._serve(entry)
+                if cached is not None:
+                    await route.fulfill(**cached)
+                    return
+            try:
+                response = await route.fetch(headers={**request.headers, **self._conditional_headers(entry)})
+            except Exception:
+                await route.fallback()
+                return
+            if response.status == 304 and entry is not None:
+                cached = self._serve(entry, revalidated=True)
+                if cached is not None:
+                    await route.fulfill(**cached)
+                else:
+                    # 재검증 사이에 삭제된 경우 조건 없이 다시 받는다
+                    await route.fallback()
+                return
+            body = await response.body()
+            if response.ok:
+                self._store(request.url, response.headers, body)
+            await route.fulfill(response=response, body=body)
+
+        await target.route("**/*", _handle)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "bytes_from_disk": self.bytes_from_disk,
+            "entries": len(self.index),
+        }
+
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps(self.index, ensure_ascii=False)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / "index.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(path)
+
+
+def asset_cache_from_config(cfg: dict) -> AssetCache | None:
+    """Build the cache from ``runtime_config["asset_cache"]`` or return ``None``."""
+    options = cfg.get("asset_cache", {})
+    if not options.get("enabled", False):
+        return None
+    return AssetCache(
+        patterns=options.get("patterns"),
+        max_bytes=int(options.get("max_mb", 200) * 1024 * 1024),
+        fresh_seconds=options.get("fresh_seconds", 300),
+    )
@@ -9,12 +9,24 @@ import pyautogui
 import pygetwindow as gw
 from playwright.sync_api import Page
 
+from .popup_scan import candidate_selector, scan_popups
+from .popup_watch import wait_for_popups_settled, watching
+
 DEFAULT_WAIT_MS = 1000
 
 
-def wait(page: Page, ms: int = DEFAULT_WAIT_MS) -> None:
-    """Convenience wrapper for ``page.wait_for_timeout``."""
-    page.wait_for_timeout(ms)
+def wait(page: Page, ms: int = DEFAULT_WAIT_MS, step: str | None = None) -> None:
+    """Let the page settle after an action, for at most ``ms``.
+
+    Returns once the DOM is quiet (see :mod:`utils.wait_engine`); in legacy
+    mode this is a plain ``page.wait_for_timeout(ms)``. ``step`` names the
+    wait for the learned timeouts and the wait report.
+    """
+    # wait_engine 이 이 모듈의 log 를 불러오므로(순환 import) 실행 시점에 가져온다
+    from .wait_engine import settle
+
+    settle(page, ms, step)
+
 
 # 팝업 처리 상태를 추적하기 위한 전역 변수
 EXPECTED_POPUPS = 2
@@ -259,9 +271,12 @@ def close_popups(
         Number of passes to search for popups. ``repeat`` is forced to be at
         least ``2``.
     interval : int, optional
-        Delay in milliseconds between passes. Default is ``1000``.
+        Maximum wait in milliseconds for a clicked button to disappear.
+        Default is ``1000``.
     final_wait : int, optional
-        Extra wait after the routine finishes. Default is ``3000``.
+        Maximum settle time after the routine, only when something was
+        closed. With the popup watcher it ends as soon as the DOM is
+        quiet. Default is ``3000``.
     max_wait : int | None, optional
         If set, maximum time in milliseconds to spend searching for popups.
     force : bool, optional
@@ -279,34 +294,6 @@ def close_popups(
         log("✅ 모든 팝업 이미 처리됨, 추가 닫기 생략")
         return 0, 0
 
-    text_selectors = [
-        "text=닫기",
-        "text=닫습니다",
-        "button:has-text('닫기')",
-        "[role='button']:has-text('닫기')",
-        "a:has-text('닫기')",
-        "[aria-label='닫기']",
-        "button:has-text('Close')",
-        "[aria-label='close']",
-        "button:has-text('✕')",
-        "text=✕",
-    ]
-    attr_selectors = [
-        "button[id*='close']",
-        "button[class*='close']",
-        "a[class*='close']",
-        "div[class*='close']",
-        "span[class*='close']",
-        "[role='button'][id*='close']",
-        "[role='button'][class*='close']",
-        "button.close",
-        "a.close",
-        ".btn-close",
-        ".modal-close",
-        "[data-dismiss='modal']",
-    ]
-    selectors = text_selectors + attr_selectors
-
     closed = 0
     detected = 0
 
@@ -314,37 +301,32 @@ def close_popups(
     start = time.time() * 1000
     for _ in range(loops):
         loop_closed = 0
-        for frame in [page, *page.frames]:
-            if hasattr(frame, "is_detached") and frame.is_detached():
-                log("프레임이 분리되어 건너뜀")
-                continue
-            for sel in selectors:
-                try:
-                    loc = frame.locator(sel)
-                    count = loc.count()
-                except Exception as e:
-                    log(f"Locator.count 오류({sel}): {e}")
-                    continue
-                if count == 0:
+        # 프레임마다 evaluate 한 번으로 보이는 닫기 버튼을 모두 찾는다
+        candidates = scan_popups(page)["candidates"]
+        detected += len(candidates)
+        for candidate in candidates:
+            frame = candidate["frame"]
+            btn = frame.locator(candidate_selector(candidate))
+            try:
+                # 앞선 클릭으로 같은 팝업이 이미 닫혔을 수 있다
+                if not btn.is_visible():
+                    detected -= 1
                     continue
-                detected += count
-                for i in range(count):
-                    btn = loc.nth(i)
-                    if not btn.is_visible():
-                        continue
-                    try:
-                        btn.click(timeout=0)
-                        frame.wait_for_timeout(2000)
-                        closed += 1
-                        loop_closed += 1
-                    except Exception as e:  # pragma: no cover - logging only
-                        log(f"팝업 닫기 실패: {e}")
+                btn.click(timeout=1000)
+                # 고정 대기 대신 버튼이 사라지는 즉시 다음으로 넘어간다
+                try:
+                    btn.wait_for(state="hidden", timeout=interval)
+                except Exception:
+                    pass
+                closed += 1
+                loop_closed += 1
+            except Exception as e:  # pragma: no cover - logging only
+                log(f"팝업 닫기 실패({candidate['rule']}): {e}")
         if loop_closed == 0:
             break
         if max_wait is not None and (time.time() * 1000 - start) >= max_wait:
             log("max_wait 초과로 팝업 탐색 중단")
             break
-        page.wait_for_timeout(interval)
 
     _closed_popups += closed
 
@@ -359,58 +341,15 @@ def close_popups(
         _popup_failure_count = 0
 
     log(f"총 {closed}개 팝업 닫기, 감지된 버튼 {detected}개")
-    page.wait_for_timeout(final_wait)
+    # 닫은 팝업이 없으면 안정화 대기가 필요 없다
+    if closed and wait_for_popups_settled(page, timeout=final_wait) is None:
+        page.wait_for_timeout(final_wait)
     return closed, detected
 
 
 def remaining_popup_button_ids(page: Page) -> list[str]:
     """Return IDs of still visible popup close buttons."""
-    text_selectors = [
-        "text=닫기",
-        "text=닫습니다",
-        "button:has-text('닫기')",
-        "[role='button']:has-text('닫기')",
-        "a:has-text('닫기')",
-        "[aria-label='닫기']",
-        "button:has-text('Close')",
-        "[aria-label='close']",
-        "button:has-text('✕')",
-        "text=✕",
-    ]
-    attr_selectors = [
-        "button[id*='close']",
-        "button[class*='close']",
-        "a[class*='close']",
-        "div[class*='close']",
-        "span[class*='close']",
-        "[role='button'][id*='close']",
-        "[role='button'][class*='close']",
-        "button.close",
-        "a.close",
-        ".btn-close",
-        ".modal-close",
-        "[data-dismiss='modal']",
-    ]
-    selectors = text_selectors + attr_selectors
-
-    ids: list[str] = []
-    for frame in [page, *page.frames]:
-        if hasattr(frame, "is_detached") and frame.is_detached():
-            continue
-        for sel in selectors:
-            try:
-                loc = frame.locator(sel)
-                count = loc.count()
-            except Exception:
-                continue
-            for i in range(count):
-                btn = loc.nth(i)
-                if not btn.is_visible():
-                    continue
-                btn_id = btn.get_attribute("id")
-                if btn_id:
-                    ids.append(btn_id)
-    return ids
+    return [c["id"] for c in scan_popups(page)["candidates"] if c["id"]]
 
 
 def handle_popup(page: Page) -> bool:
@@ -418,6 +357,11 @@ def handle_popup(page: Page) -> bool:
 
     global popup_handled
     try:
+        # 감시 스크립트가 규칙 팝업을 닫으므로 DOM 이 잠잠해질 때까지만 기다린다.
+        # 감시는 Nexacro 닫기 버튼만 보므로 모든 프레임 탐색에서도 후보가 없어야 끝낸다
+        if watching(page) and wait_for_popups_settled(page) == [] and not scan_popups(page)["candidates"]:
+            popup_handled = True
+            return popup_handled
         close_popups(page, repeat=4, interval=1000, force=True)
         close_stzz120_popup(page)
         close_popups(page, repeat=2, interval=1000, force=True)
@@ -427,6 +371,7 @@ def handle_popup(page: Page) -> bool:
         popup_handled = False
     return popup_handled
 
+
 def process_popups_once(page: Page, *, force: bool = False) -> bool:
     """Run popup handling only once for the whole program.
 
@@ -455,7 +400,13 @@ def process_popups_once(page: Page, *, force: bool = False) -> bool:
 
 
 def update_instruction_state(step: str, failure: str | None = None) -> None:
-    """Update progress status in codex_instruction.txt."""
+    """Update progress status in codex_instruction.txt and the run journal."""
+    # run_journal 도 이 모듈의 log 를 불러오므로 실행 시점에 가져온다
+    from .run_journal import run_journal
+
+    # 실행 중인 저널과 같은 인스턴스여야 작업 기록을 덮어쓰지 않는다
+    run_journal().set_stage(step, failure)
+
     instr_path = Path(__file__).resolve().parent.parent / "instructions" / "codex_instruction.txt"
     if not instr_path.exists():
         return
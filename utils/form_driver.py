@@ -0,0 +1,224 @@
+"""Drive Nexacro forms through their objects instead of UI clicks.
+
+Setting the date range used to click, fill and press Enter on each calendar
+field with a ``wait()`` around every step, and menus were opened by clicking
+their text. The form driver does the same work in one ``page.evaluate``:
+
+- :func:`set_component_values`: ``component.set_value(value)`` for each
+  named component, e.g. ``{"calFromDay": "20240501"}``
+- :func:`call_form_search`: calls the first of ``search_functions`` defined
+  on the form holding the anchor component, or ``click()`` on the
+  ``search_button`` component
+- :func:`open_menu_by_id`: calls ``menu_function`` on the application or a
+  frame form with the id configured in ``menu_ids``
+
+Components are looked up by the DOM id Nexacro renders for them
+(``mainframe.WorkFrame.form.calFromDay.calendaredit:input`` belongs to
+``nexacro.getApplication().mainframe.WorkFrame.form.calFromDay``). Every
+function reports what it could not do, so callers fall back to the UI for
+exactly those steps. ``runtime_config["form_driver"]`` holds the options;
+``enabled: false`` always takes the UI path.
+"""
+
+from .common import log
+
+DEFAULT_OPTIONS = {
+    "enabled": True,
+    "search_functions": ["fn_search", "fn_retrieve", "fnSearch"],
+    "search_button": "btn_search",
+    "menu_function": "gfn_openMenu",
+    # 메뉴 이름 → 메뉴 id (포털마다 달라 설정으로 받는다)
+    "menu_ids": {},
+}
+
+# 컴포넌트 조회 도우미: DOM id 에서 객체 경로를 얻어 mainframe 부터 따라간다
+_RESOLVE_JS = r"""
+const app = window.nexacro && (nexacro.getApplication ? nexacro.getApplication() : window.application);
+const resolve = (path) => {
+    let obj = app.mainframe;
+    for (const part of path.split('.').slice(1)) {
+        if (!obj) return null;
+        obj = obj[part] ?? (obj.all && obj.all[part]) ?? null;
+    }
+    return obj;
+};
+const component = (name) => {
+    for (const el of document.querySelectorAll(`[id*='.${name}']`)) {
+        const end = el.id.indexOf(`.${name}`) + name.length + 1;
+        const next = el.id[end];
+        if (next !== undefined && next !== '.' && next !== ':') continue;
+        const obj = resolve(el.id.slice(0, end));
+        if (obj) return obj;
+    }
+    return null;
+};
+"""
+
+_SET_VALUES_JS = (
+    r"""
+(values) => {
+    if (!window.nexacro) return Object.keys(values);
+"""
+    + _RESOLVE_JS
+    + r"""
+    if (!app || !app.mainframe) return Object.keys(values);
+    const missing = [];
+    for (const [name, value] of Object.entries(values)) {
+        const obj = component(name);
+        if (!obj || typeof obj.set_value !== 'function') {
+            missing.push(name);
+            continue;
+        }
+        obj.set_value(value);
+        if (obj.value !== undefined && String(obj.value) !== String(value)) missing.push(name);
+    }
+    return missing;
+}
+"""
+)
+
+_SEARCH_JS = (
+    r"""
+(args) => {
+    if (!window.nexacro) return null;
+"""
+    + _RESOLVE_JS
+    + r"""
+    if (!app || !app.mainframe) return null;
+    // 기준 컴포넌트에서 위로 올라가며 조회 함수를 가진 폼을 찾는다
+    for (let form = component(args.anchor); form; form = form.parent) {
+        for (const fn of args.functions) {
+            if (typeof form[fn] === 'function') {
+                form[fn].call(form);
+                return fn;
+            }
+        }
+    }
+    const button = component(args.button);
+    if (button && typeof button.click === 'function') {
+        button.click();
+        return args.button;
+    }
+    return null;
+}
+"""
+)
+
+_MENU_JS = (
+    r"""
+(args) => {
+    if (!window.nexacro) return false;
+"""
+    + _RESOLVE_JS
+    + r"""
+    if (!app) return false;
+    const targets = [app, app.mainframe];
+    for (const el of document.querySelectorAll("[id$='.form']")) targets.push(resolve(el.id));
+    for (const target of targets) {
+        if (target && typeof target[args.fn] === 'function') {
+            target[args.fn].call(target, args.id);
+            return true;
+        }
+    }
+    return false;
+}
+"""
+)
+
+_options = dict(DEFAULT_OPTIONS)
+
+
+def configure_form_driver(cfg: dict) -> None:
+    """Apply ``runtime_config["form_driver"]``."""
+    _options.clear()
+    _options.update(DEFAULT_OPTIONS, **cfg.get("form_driver", {}))
+
+
+def nexacro_date(value: str) -> str:
+    """``YYYY-MM-DD`` → the ``YYYYMMDD`` value of a Nexacro Calendar."""
+    return value.replace("-", "")
+
+
+def _search_arg(anchor: str) -> dict:
+    return {"anchor": anchor, "functions": _options["search_functions"], "button": _options["search_button"]}
+
+
+def _menu_arg(name: str) -> dict | None:
+    menu_id = _options["menu_ids"].get(name)
+    if not _options["enabled"] or not menu_id or not _options["menu_function"]:
+        return None
+    return {"fn": _options["menu_function"], "id": menu_id}
+
+
+def set_component_values(page, values: dict[str, str]) -> list[str]:
+    """Set component values on a sync API ``page``.
+
+    Returns the names that could not be set (all of them when disabled or
+    when the page has no Nexacro application).
+    """
+    if not _options["enabled"]:
+        return list(values)
+    try:
+        return page.evaluate(_SET_VALUES_JS, values)
+    except Exception as e:
+        log(f"⚠️ 폼 값 직접 설정 실패, UI 입력으로 대체: {e}")
+        return list(values)
+
+
+async def set_component_values_async(page, values: dict[str, str]) -> list[str]:
+    """Async API counterpart of :func:`set_component_values`."""
+    if not _options["enabled"]:
+        return list(values)
+    try:
+        return await page.evaluate(_SET_VALUES_JS, values)
+    except Exception as e:
+        log(f"⚠️ 폼 값 직접 설정 실패, UI 입력으로 대체: {e}")
+        return list(values)
+
+
+def call_form_search(page, anchor: str) -> bool:
+    """Run the search of the form holding component ``anchor``; ``False`` → click the UI."""
+    if not _options["enabled"]:
+        return False
+    try:
+        called = page.evaluate(_SEARCH_JS, _search_arg(anchor))
+    except Exception as e:
+        log(f"⚠️ 폼 조회 함수 호출 실패: {e}")
+        return False
+    return called is not None
+
+
+async def call_form_search_async(page, anchor: str) -> bool:
+    """Async API counterpart of :func:`call_form_search`."""
+    if not _options["enabled"]:
+        return False
+    try:
+        called = await page.evaluate(_SEARCH_JS, _search_arg(anchor))
+    except Exception as e:
+        log(f"⚠️ 폼 조회 함수 호출 실패: {e}")
+        return False
+    return called is not None
+
+
+def open_menu_by_id(page, name: str) -> bool:
+    """Open menu ``name`` by its configured id; ``False`` → click the UI."""
+    arg = _menu_arg(name)
+    if arg is None:
+        return False
+    try:
+        return page.evaluate(_MENU_JS, arg)
+    except Exception as e:
+        log(f"⚠️ 메뉴 id 로 열기 실패 ({name}): {e}")
+        return False
+
+
+async def open_menu_by_id_async(page, name: str) -> bool:
+    """Async API counterpart of :func:`open_menu_by_id`."""
+    arg = _menu_arg(name)
+    if arg is None:
+        return False
+    try:
+        return await page.evaluate(_MENU_JS, arg)
+    except Exception as e:
+        log(f"⚠️ 메뉴 id 로 열기 실패 ({name}): {e}")
+        return False
@@ -0,0 +1,178 @@
+"""Keep-alive HTTP connections that carry a browser session's cookies.
+
+:class:`HTTPPool` talks to one host with at most ``max_connections``
+``http.client`` connections at a time. Idle connections are reused, so many
+requests from several threads share a few TCP (and TLS) handshakes. The
+cookies come from a logged-in Playwright context (:meth:`HTTPPool.from_context`)
+and ``Set-Cookie`` answers keep them current. A 401/403 answer raises
+:class:`SessionExpired` so callers can log in again with the browser.
+"""
+
+import asyncio
+import http.client
+import queue
+import threading
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+from .common import log
+
+MAX_CONNECTIONS = 8
+TIMEOUT = 30.0
+
+# 서버가 유휴 연결을 닫은 뒤 재사용하면 나는 오류 (새 연결로 한 번 다시 보낸다)
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class SessionExpired(RuntimeError):
+    """The server no longer accepts the session cookies."""
+
+
+class HTTPPool:
+    """Bounded, thread-safe pool of keep-alive connections to one host.
+
+    Parameters
+    ----------
+    base_url : str
+        ``scheme://host[:port]`` of the server; any path is ignored.
+    cookies : dict[str, str] | None, optional
+        Cookies sent with every request.
+    max_connections : int, optional
+        Upper bound of open connections and concurrent requests.
+    timeout : float, optional
+        Socket timeout in seconds.
+    headers : dict[str, str] | None, optional
+        Extra headers sent with every request (e.g. ``User-Agent``).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cookies: dict[str, str] | None = None,
+        *,
+        max_connections: int = MAX_CONNECTIONS,
+        timeout: float = TIMEOUT,
+        headers: dict[str, str] | None = None,
+    ):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"지원하지 않는 URL: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.cookies = dict(cookies or {})
+        self.headers = dict(headers or {})
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "connections": 0, "reused": 0, "retries": 0}
+
+    @classmethod
+    def from_context(cls, context, url: str, **kwargs) -> "HTTPPool":
+        """Pool for ``url`` with the cookies of a sync API ``BrowserContext``."""
+        return cls(url, {c["name"]: c["value"] for c in context.cookies(url)}, **kwargs)
+
+    @classmethod
+    async def from_context_async(cls, context, url: str, **kwargs) -> "HTTPPool":
+        """Async API counterpart of :meth:`from_context`."""
+        return cls(url, {c["name"]: c["value"] for c in await context.cookies(url)}, **kwargs)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        conn_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.stats["connections"] += 1
+        return conn_cls(self.host, self.port, timeout=self.timeout)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _cookie_header(self) -> str:
+        with self._lock:
+            return "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+
+    def _store_cookies(self, response: http.client.HTTPResponse) -> None:
+        for header in response.headers.get_all("Set-Cookie") or []:
+            cookie = SimpleCookie()
+            try:
+                cookie.load(header)
+            except Exception:
+                continue
+            with self._lock:
+                self.cookies.update({name: morsel.value for name, morsel in cookie.items()})
+
+    def _send(self, conn, method: str, path: str, body: bytes, headers: dict) -> http.client.HTTPResponse:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
+
+    def request(self, method: str, path: str, body: bytes | str = b"", headers: dict | None = None) -> bytes:
+        """Send one request and return the response body.
+
+        Raises :class:`SessionExpired` on 401/403 and ``RuntimeError`` on
+        other error statuses.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        all_headers = {**self.headers, **(headers or {})}
+        cookie = self._cookie_header()
+        if cookie:
+            all_headers["Cookie"] = cookie
+        with self._slots:
+            conn, reused = self._checkout()
+            try:
+                try:
+                    response = self._send(conn, method, path, body, all_headers)
+                except _STALE_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    conn, reused = self._connect(), False
+                    with self._lock:
+                        self.stats["retries"] += 1
+                    response = self._send(conn, method, path, body, all_headers)
+                data = response.read()
+            except Exception:
+                conn.close()
+                raise
+            with self._lock:
+                self.stats["requests"] += 1
+                self.stats["reused"] += reused
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+        self._store_cookies(response)
+        if response.status in (401, 403):
+            raise SessionExpired(f"세션이 만료되었습니다 ({response.status} {path})")
+        if response.status >= 400:
+            raise RuntimeError(f"HTTP {response.status} {response.reason}: {path}")
+        return data
+
+    async def request_async(self, method: str, path: str, body: bytes | str = b"", headers: dict | None = None) -> bytes:
+        """:meth:`request` on a worker thread, for use from an event loop."""
+        return await asyncio.to_thread(self.request, method, path, body, headers)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def report(self) -> dict:
+        stats = dict(self.stats)
+        log(
+            f"🔌 직접 요청 {stats['requests']}건, 연결 {stats['connections']}개"
+            f" (재사용 {stats['reused']}회, 재시도 {stats['retries']}회)"
+        )
+        return stats
+
+    def __enter__(self) -> "HTTPPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,279 @@
+"""Popup title rules compiled into one multi-pattern matcher.
+
+``popup_text_handler`` used to try every ``contains`` keyword of every rule
+against the popup title in turn. :class:`PopupRuleEngine` compiles all
+keywords into an Aho-Corasick automaton instead, so one pass over a title
+finds every matching rule however many rules there are. Rules are loaded
+from ``POPUP_RULES_PATH`` (``config/popup_rules.json``) and are plain dicts:
+
+- ``name``: label used in logs and hit counters
+- ``contains``: keywords, any of which must occur in the popup title
+  (optional for rules that only target a ``selector``)
+- ``priority``: the highest priority wins when several rules match
+  (ties keep file order)
+- ``action``: ``click`` (``selector``), ``remove`` (``selector``),
+  ``accept_dialog``, ``reload`` or ``ignore``
+- ``session_expired``: ``true`` marks the 세션 만료 popup
+
+``ignore`` rules replace the old ``EXCLUDE_TEXTS`` list; give them a high
+priority so they win over the rule that would otherwise close the popup.
+
+The file is the only popup rule source: the init script of
+:mod:`utils.popup_watch` gets its rules from :meth:`PopupRuleEngine.watch_rules`,
+and both the watcher and the session probe take the 세션 만료 keywords
+from :meth:`PopupRuleEngine.session_expired_texts`.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+
+from .common import log
+from .popup_scan import popup_titles
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+POPUP_RULES_PATH = PROJECT_ROOT / "config" / "popup_rules.json"
+
+CLICK = "click"
+ACCEPT_DIALOG = "accept_dialog"
+RELOAD = "reload"
+IGNORE = "ignore"
+REMOVE = "remove"
+ACTIONS = (CLICK, ACCEPT_DIALOG, RELOAD, IGNORE, REMOVE)
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+
+    Each added keyword carries a value; :meth:`find` returns the values of
+    every keyword occurring in a text in ``O(len(text) + matches)``.
+    """
+
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list] = [[]]
+        self._built = True
+
+    def add(self, keyword: str, value) -> None:
+        if not keyword:
+            raise ValueError("빈 키워드는 등록할 수 없습니다")
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(value)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute the failure links; called lazily by :meth:`find`."""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                # 실패 링크 쪽에서 끝나는 키워드도 함께 보고한다
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+        self._built = True
+
+    def find(self, text: str) -> list:
+        if not self._built:
+            self.build()
+        found = []
+        node = 0
+        for ch in text:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            if self._out[node]:
+                found.extend(self._out[node])
+        return found
+
+
+def load_popup_rules(path: Path = POPUP_RULES_PATH) -> list[dict]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["rules"]
+
+
+class PopupRuleEngine:
+    """Matches popup titles against the rule set and applies the winning rule.
+
+    Parameters
+    ----------
+    rules : list[dict]
+        Rule dicts as described in the module docstring.
+    """
+
+    def __init__(self, rules: list[dict]):
+        self.rules = []
+        self._matcher = AhoCorasick()
+        for order, rule in enumerate(rules):
+            action = rule.get("action", CLICK)
+            if action not in ACTIONS:
+                raise ValueError(f"알 수 없는 팝업 규칙 동작: {rule.get('name')} → {action}")
+            if action in (CLICK, REMOVE) and not rule.get("selector"):
+                raise ValueError(f"{action} 규칙에 selector 가 없습니다: {rule.get('name')}")
+            contains = list(rule.get("contains", []))
+            if not rule.get("name") and not contains:
+                raise ValueError(f"팝업 규칙에 name 또는 contains 가 필요합니다: {rule}")
+            compiled = {
+                "name": rule.get("name") or contains[0],
+                "contains": contains,
+                "priority": rule.get("priority", 0),
+                "action": action,
+                "selector": rule.get("selector"),
+                "session_expired": bool(rule.get("session_expired", False)),
+                "order": order,
+            }
+            self.rules.append(compiled)
+            for keyword in compiled["contains"]:
+                self._matcher.add(keyword, order)
+        self.hits = {rule["name"]: 0 for rule in self.rules}
+        self.misses = 0
+
+    @classmethod
+    def from_file(cls, path: Path = POPUP_RULES_PATH) -> "PopupRuleEngine":
+        return cls(load_popup_rules(path))
+
+    def watch_rules(self) -> list[dict]:
+        """Rules for the :mod:`utils.popup_watch` init script.
+
+        Every ``click`` and ``remove`` rule becomes ``{"name", "css",
+        "action"}`` plus its ``contains`` keywords as ``title`` when it has
+        any.
+        """
+        result = []
+        for rule in self.rules:
+            if rule["action"] not in (CLICK, REMOVE):
+                continue
+            watch = {"name": rule["name"], "css": rule["selector"], "action": rule["action"]}
+            if rule["contains"]:
+                watch["title"] = rule["contains"]
+            result.append(watch)
+        return result
+
+    def session_expired_texts(self) -> list[str]:
+        """Title keywords of the rules marked ``session_expired``."""
+        return [keyword for rule in self.rules if rule["session_expired"] for keyword in rule["contains"]]
+
+    def match(self, title: str) -> dict | None:
+        """Return the highest priority rule matching ``title``, if any."""
+        orders = set(self._matcher.find(title))
+        if not orders:
+            return None
+        return max((self.rules[o] for o in orders), key=lambda r: (r["priority"], -r["order"]))
+
+    def match_titles(self, titles: list[dict]) -> tuple[dict, dict] | None:
+        """Pick the best rule over :func:`~utils.popup_scan.popup_titles` entries.
+
+        ``ignore`` applies per title: an ignored title is skipped and the
+        best match among the other titles wins. Returns ``(entry, rule)``,
+        the ignore match when every matching title is ignored, or ``None``
+        when no title matches.
+        """
+        best = None
+        ignored = None
+        for entry in titles:
+            rule = self.match(entry["title"])
+            if rule is None:
+                continue
+            if rule["action"] == IGNORE:
+                ignored = ignored or (entry, rule)
+                continue
+            if best is None or (rule["priority"], -rule["order"]) > (best[1]["priority"], -best[1]["order"]):
+                best = (entry, rule)
+        return best or ignored
+
+    def apply(self, page, entry: dict, rule: dict) -> bool:
+        """Run ``rule`` for the popup title ``entry`` of a sync API ``page``.
+
+        Returns ``True`` when the popup was dealt with; ``ignore`` rules
+        return ``False`` so that callers leave the popup alone.
+        """
+        self.hits[rule["name"]] += 1
+        action = rule["action"]
+        title = entry["title"]
+        if action == IGNORE:
+            log(f"⏩ 제외 팝업으로 판단 - 무시: '{title}'")
+            return False
+        log(f"📌 팝업 탐지됨: '{title}' → 규칙 '{rule['name']}' ({action})")
+        if action == CLICK:
+            frame = entry["frame"]
+            button = frame.locator(rule["selector"])
+            if entry["scope"]:
+                # 같은 팝업의 버튼을 우선 누른다
+                scoped = frame.locator(f"{rule['selector']}[id^='{entry['scope']}']")
+                if scoped.count() > 0:
+                    button = scoped
+            button = button.first
+            button.click()
+            # 고정 대기 대신 버튼이 사라질 때까지만 기다린다
+            button.wait_for(state="hidden", timeout=3000)
+        elif action == ACCEPT_DIALOG:
+            # 다이얼로그 이벤트는 프레임이 아닌 페이지에서 발생한다
+            from browser.popup_utils import add_safe_accept_once
+
+            add_safe_accept_once(page)
+        elif action == RELOAD:
+            page.reload(wait_until="domcontentloaded")
+        elif action == REMOVE:
+            entry["frame"].locator(rule["selector"]).evaluate_all("(els) => els.forEach((el) => el.remove())")
+        return True
+
+    def handle(self, page) -> bool:
+        """Scan the popup titles of every frame and apply the best rule."""
+        titles = popup_titles(page)
+        if not titles:
+            return False
+        best = self.match_titles(titles)
+        if best is None:
+            self.misses += 1
+            log(f"⚠️ 팝업 규칙 없음: {', '.join(t['title'] for t in titles)}")
+            return False
+        entry, rule = best
+        try:
+            return self.apply(page, entry, rule)
+        except Exception as e:
+            log(f"❌ 팝업 닫기 실패: {e}")
+            return False
+
+    def stats(self) -> dict:
+        return {"hits": dict(self.hits), "misses": self.misses}
+
+    def report(self) -> dict:
+        result = self.stats()
+        fired = ", ".join(f"{name} {n}" for name, n in self.hits.items() if n)
+        log(f"📊 팝업 규칙 적중: {fired or '없음'}" + (f", 규칙 없음 {self.misses}건" if self.misses else ""))
+        return result
+
+
+_engine: PopupRuleEngine | None = None
+
+
+def configure_popup_rules(cfg: dict) -> None:
+    """Load the rule file named by ``runtime_config["popup_rules"]["path"]``.
+
+    Relative paths are resolved against the project root.
+    """
+    global _engine
+    path = cfg.get("popup_rules", {}).get("path")
+    _engine = PopupRuleEngine.from_file(POPUP_RULES_PATH if path is None else PROJECT_ROOT / path)
+
+
+def popup_rule_engine() -> PopupRuleEngine:
+    """Shared engine, loaded from ``POPUP_RULES_PATH`` on first use."""
+    global _engine
+    if _engine is None:
+        _engine = PopupRuleEngine.from_file()
+    return _engine
@@ -0,0 +1,240 @@
+"""One-shot popup scanner evaluated once per frame.
+
+The popup helpers used to loop over frames x selectors x ``count()`` x
+``nth(i).is_visible()``, one IPC round-trip per call. :data:`POPUP_SCAN_JS`
+does the whole search inside the page instead. It returns every visible
+close candidate with its rule, id, text and bounding box, plus the visible
+popup titles. Each candidate is tagged with a ``data-popup-candidate``
+marker so it can be clicked with :func:`candidate_selector`.
+
+Rules are plain dicts tried in order (earlier is better):
+
+- ``css``: a CSS selector list
+- ``text``: keywords matched case-insensitively in text nodes. Inside a
+  clickable element (:data:`CLICKABLE_CSS`, or the rule's ``clickable``)
+  the keyword may be part of the text and the candidate is that element.
+  Elsewhere the node's whole text must equal a keyword and the candidate
+  is its parent element, so ``Close`` in a notice body is not a button.
+
+When a candidate contains, or is contained by, a better ranked one, only
+the better ranked one is kept.
+"""
+
+# 팝업 닫기 버튼 탐색에 쓰는 텍스트/속성 선택자 (기존 locator 루프용 목록)
+POPUP_TEXT_SELECTORS = [
+    "text=닫기",
+    "text=닫습니다",
+    "button:has-text('닫기')",
+    "[role='button']:has-text('닫기')",
+    "a:has-text('닫기')",
+    "[aria-label='닫기']",
+    "button:has-text('Close')",
+    "[aria-label='close']",
+    "button:has-text('✕')",
+    "text=✕",
+]
+POPUP_ATTR_SELECTORS = [
+    "button[id*='close']",
+    "button[class*='close']",
+    "a[class*='close']",
+    "div[class*='close']",
+    "span[class*='close']",
+    "[role='button'][id*='close']",
+    "[role='button'][class*='close']",
+    "button.close",
+    "a.close",
+    ".btn-close",
+    ".modal-close",
+    "[data-dismiss='modal']",
+]
+POPUP_CLOSE_SELECTORS = POPUP_TEXT_SELECTORS + POPUP_ATTR_SELECTORS
+
+POPUP_TITLE_CSS = "div[id$='Static00:text']"
+
+# text 규칙이 부분 일치를 허용하는 클릭 가능한 요소 (Nexacro Button 은 div.Button)
+CLICKABLE_CSS = "button, [role='button'], a, input[type='button'], input[type='submit'], div.Button"
+
+# 순위 순서의 닫기 규칙 (위의 선택자 목록과 같은 대상을 찾는다)
+POPUP_SCAN_RULES = [
+    {"name": "nexacro_close", "css": "[id$='btn_close:icontext'], [id$='btn_close']"},
+    {"name": "close_text", "text": ["닫기", "닫습니다", "Close", "✕"]},
+    {"name": "close_label", "css": "[aria-label='닫기'], [aria-label='close' i]"},
+    {"name": "close_attr", "css": ", ".join(POPUP_ATTR_SELECTORS)},
+]
+
+# browser.popup_handler 계열이 쓰던 넓은 id/class 매칭까지 포함
+BROAD_SCAN_RULES = POPUP_SCAN_RULES + [
+    {"name": "close_any", "css": "[class*='close'], [id*='close']"},
+]
+
+# 닫기 버튼이 없을 때 누르는 확인 버튼
+CONFIRM_SCAN_RULES = [
+    {"name": "confirm_input", "css": "input[value='확인']"},
+    {"name": "confirm_text", "text": ["확인"]},
+]
+
+MARKER_ATTR = "data-popup-candidate"
+
+POPUP_SCAN_JS = r"""
+({rules, titleCss, clickable, marker}) => {
+    const visible = (el) => {
+        if (!el.isConnected) return false;
+        const style = getComputedStyle(el);
+        if (style.visibility === 'hidden' || style.display === 'none') return false;
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0;
+    };
+    document.querySelectorAll(`[${marker}]`).forEach((el) => el.removeAttribute(marker));
+
+    const found = new Map();
+    const add = (el, rank, name) => {
+        if (!el || found.has(el) || !visible(el)) return;
+        found.set(el, {rank, rule: name});
+    };
+    rules.forEach((rule, rank) => {
+        if (rule.css) {
+            try {
+                document.querySelectorAll(rule.css).forEach((el) => add(el, rank, rule.name));
+            } catch (e) {}
+        }
+        if (rule.text && rule.text.length) {
+            const words = rule.text.map((w) => w.toLowerCase());
+            const walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                const parent = node.parentElement;
+                if (!parent) continue;
+                const text = node.nodeValue.toLowerCase();
+                // 부분 일치는 버튼 안에서만, 그 밖에서는 텍스트 전체가 같아야 한다
+                let button = null;
+                try {
+                    button = parent.closest(rule.clickable || clickable);
+                } catch (e) {}
+                if (button && words.some((w) => text.includes(w))) add(button, rank, rule.name);
+                else if (!button && words.includes(text.trim())) add(parent, rank, rule.name);
+            }
+        }
+    });
+
+    // 같은 버튼의 안팎 요소는 순위가 높은 하나만 남긴다
+    const entries = [...found.entries()].sort((a, b) => a[1].rank - b[1].rank);
+    const kept = [];
+    for (const [el, info] of entries) {
+        if (kept.some(([k]) => k.contains(el) || el.contains(k))) continue;
+        kept.push([el, info]);
+    }
+
+    const candidates = kept.map(([el, info], i) => {
+        el.setAttribute(marker, String(i));
+        const r = el.getBoundingClientRect();
+        return {
+            marker: String(i),
+            rule: info.rule,
+            rank: info.rank,
+            id: el.id || null,
+            text: (el.innerText || el.value || '').trim().slice(0, 80),
+            box: {x: r.x, y: r.y, width: r.width, height: r.height},
+        };
+    });
+    const titles = [...document.querySelectorAll(titleCss)]
+        .filter(visible)
+        .map((el) => (el.innerText || '').trim())
+        .filter(Boolean);
+    return {candidates, titles};
+}
+"""
+
+
+# 팝업 제목과 Nexacro 팝업 범위("<팝업>.form.")만 모은다
+POPUP_TITLES_JS = r"""
+(titleCss) => [...document.querySelectorAll(titleCss)]
+    .filter((el) => {
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    })
+    .map((el) => {
+        const id = el.id || '';
+        const i = id.lastIndexOf('.form.');
+        return {title: (el.innerText || '').trim(), scope: i >= 0 ? id.slice(0, i + 6) : ''};
+    })
+    .filter((t) => t.title)
+"""
+
+
+def scan_args(rules: list[dict] | None = None) -> dict:
+    return {
+        "rules": POPUP_SCAN_RULES if rules is None else rules,
+        "titleCss": POPUP_TITLE_CSS,
+        "clickable": CLICKABLE_CSS,
+        "marker": MARKER_ATTR,
+    }
+
+
+def candidate_selector(candidate: dict) -> str:
+    """CSS selector of a scanned candidate inside its frame."""
+    return f"[{MARKER_ATTR}='{candidate['marker']}']"
+
+
+def merge_scans(results: list[tuple[object, dict]]) -> dict:
+    """Combine per-frame scan results, ranking candidates across frames.
+
+    Each candidate gets its ``frame``; titles are concatenated.
+    """
+    candidates: list[dict] = []
+    titles: list[str] = []
+    for frame, result in results:
+        for candidate in result["candidates"]:
+            candidates.append({**candidate, "frame": frame})
+        titles.extend(result["titles"])
+    candidates.sort(key=lambda c: c["rank"])
+    return {"candidates": candidates, "titles": titles}
+
+
+def scan_popups(page, rules: list[dict] | None = None) -> dict:
+    """Scan every frame of a sync API ``page`` with one ``evaluate`` each.
+
+    Returns ``{"candidates": [...], "titles": [...]}``; see
+    :data:`POPUP_SCAN_JS` for the candidate fields.
+    """
+    results = []
+    args = scan_args(rules)
+    for frame in page.frames:
+        if frame.is_detached():
+            continue
+        try:
+            results.append((frame, frame.evaluate(POPUP_SCAN_JS, args)))
+        except Exception:
+            # 탐색 도중 이동/분리된 프레임은 건너뛴다
+            continue
+    return merge_scans(results)
+
+
+async def scan_popups_async(page, rules: list[dict] | None = None) -> dict:
+    """Async API counterpart of :func:`scan_popups`."""
+    results = []
+    args = scan_args(rules)
+    for frame in page.frames:
+        if frame.is_detached():
+            continue
+        try:
+            results.append((frame, await frame.evaluate(POPUP_SCAN_JS, args)))
+        except Exception:
+            continue
+    return merge_scans(results)
+
+
+def popup_titles(page) -> list[dict]:
+    """Visible popup titles of every frame, one ``evaluate`` per frame.
+
+    Each entry has the ``frame``, the ``title`` text and the Nexacro
+    ``scope`` id prefix shared by the popup's components.
+    """
+    titles = []
+    for frame in page.frames:
+        if frame.is_detached():
+            continue
+        try:
+            found = frame.evaluate(POPUP_TITLES_JS, POPUP_TITLE_CSS)
+        except Exception:
+            continue
+        titles.extend({**t, "frame": frame} for t in found)
+    return titles
@@ -0,0 +1,249 @@
+"""Init script that dismisses known popups as soon as they appear.
+
+Nexacro popups (STZZ120_P0, '재택 유선권장 안내', ...) show up at different
+times after login, so polling for them needed fixed multi-second waits.
+:data:`POPUP_WATCH_JS` runs in every frame with a ``MutationObserver``.
+After each burst of DOM changes it applies the rule set and reports to
+Python through the ``__popupEvent`` binding:
+
+- ``{"type": "dismissed", "rule", "title", "id"}`` when a rule fired
+- ``{"type": "state", "open": [...]}`` when the set of open popups changed
+
+The events only update the page they came from (``_popups_handled``,
+``_popups_dismissed``), never the ``utils.common`` flags, because several
+stores' pages run in one process; see
+:func:`async_pipeline.common.page_popups_handled`. Every frame reports its
+own open popups and the page counts as clear only when no frame has one
+open.
+
+The rules come from ``config/popup_rules.json`` through
+:meth:`utils.popup_rules.PopupRuleEngine.watch_rules`: a ``css`` selector,
+an optional list of ``title`` keywords the popup title must contain, and an
+``action`` (``click`` or ``remove``). Popups whose title contains a
+keyword of a ``session_expired`` rule are never dismissed, because they
+need a new login. Elements outside a popup form (the modal overlay) have
+no title of their own; they are left alone while any open popup is
+excluded.
+"""
+
+import json
+
+POPUP_OPEN_CSS = "[id$='btn_close:icontext']"
+
+POPUP_WATCH_JS = r"""
+(config) => {
+    if (window.__popupWatch) return;
+    const state = {lastMutation: Date.now(), open: [], pending: false, dismissed: 0};
+    window.__popupWatch = state;
+
+    const visible = (el) => {
+        if (!el.isConnected) return false;
+        const style = getComputedStyle(el);
+        if (style.visibility === 'hidden' || style.display === 'none') return false;
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0;
+    };
+    const report = (event) => {
+        if (window.__popupEvent) window.__popupEvent(event).catch(() => {});
+    };
+    // Nexacro 폼 id 는 "<팝업>.form.<컴포넌트>" 형태라 제목과 버튼을 묶을 수 있다
+    const scope = (el) => {
+        const id = el.id || '';
+        const i = id.lastIndexOf('.form.');
+        return i >= 0 ? id.slice(0, i + 6) : '';
+    };
+    const titleOf = (prefix) => {
+        if (!prefix) return '';
+        for (const t of document.querySelectorAll(config.titleCss)) {
+            if ((t.id || '').startsWith(prefix) && visible(t)) return (t.innerText || '').trim();
+        }
+        return '';
+    };
+    const openTitles = () => [...document.querySelectorAll(config.titleCss)]
+        .filter(visible)
+        .map((t) => (t.innerText || '').trim())
+        .filter(Boolean);
+    // Nexacro 버튼은 click 이벤트만으로 반응하지 않아 마우스 이벤트를 순서대로 보낸다
+    const press = (el) => {
+        const r = el.getBoundingClientRect();
+        const opts = {bubbles: true, cancelable: true, view: window, button: 0,
+                      clientX: r.x + r.width / 2, clientY: r.y + r.height / 2};
+        for (const type of ['pointerdown', 'mousedown', 'pointerup', 'mouseup', 'click']) {
+            el.dispatchEvent(type.startsWith('pointer') ? new PointerEvent(type, opts) : new MouseEvent(type, opts));
+        }
+    };
+
+    const apply = () => {
+        for (const rule of config.rules) {
+            let targets;
+            try {
+                targets = [...document.querySelectorAll(rule.css)].filter(visible);
+            } catch (e) {
+                continue;
+            }
+            for (const el of targets) {
+                const prefix = scope(el);
+                const title = titleOf(prefix);
+                if (rule.title && !rule.title.some((w) => title.includes(w))) continue;
+                // 팝업 밖 요소(모달 오버레이)는 열린 팝업 모두를 보고 판단한다
+                const titles = prefix ? [title] : openTitles();
+                if (titles.some((t) => config.exclude.some((w) => t.includes(w)))) continue;
+                const last = Number(el.getAttribute('data-popup-dismissed') || 0);
+                if (Date.now() - last < 1000) continue;
+                el.setAttribute('data-popup-dismissed', String(Date.now()));
+                if (rule.action === 'remove') el.remove();
+                else press(el);
+                state.dismissed += 1;
+                report({type: 'dismissed', rule: rule.name, title, id: el.id || null});
+            }
+        }
+    };
+
+    let lastKey = null;
+    const check = () => {
+        state.pending = false;
+        apply();
+        state.open = [...document.querySelectorAll(config.openCss)]
+            .filter(visible)
+            .map((el) => titleOf(scope(el)) || el.id);
+        const key = JSON.stringify(state.open);
+        if (key !== lastKey) {
+            lastKey = key;
+            report({type: 'state', open: state.open});
+        }
+    };
+    const schedule = () => {
+        state.lastMutation = Date.now();
+        if (state.pending) return;
+        state.pending = true;
+        setTimeout(check, config.debounceMs);
+    };
+    state.settled = (quietMs) =>
+        !state.pending && Date.now() - state.lastMutation >= quietMs ? {open: state.open} : null;
+
+    new MutationObserver(schedule).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['style', 'class'],
+    });
+    schedule();
+}
+"""
+
+_enabled = True
+
+
+def configure_popup_watch(cfg: dict) -> None:
+    """Apply ``runtime_config["popup_watch"]`` (``enabled``).
+
+    The rules are those of :func:`utils.popup_rules.configure_popup_rules`.
+    """
+    global _enabled
+    _enabled = cfg.get("popup_watch", {}).get("enabled", True)
+
+
+def watch_script(rules: list[dict] | None = None) -> str:
+    # popup_rules 가 utils.common 을 거쳐 이 모듈을 불러오므로 실행 시점에 가져온다
+    from .popup_rules import popup_rule_engine
+
+    engine = popup_rule_engine()
+    config = {
+        "rules": engine.watch_rules() if rules is None else rules,
+        "exclude": engine.session_expired_texts(),
+        "titleCss": "div[id$='Static00:text']",
+        "openCss": POPUP_OPEN_CSS,
+        "debounceMs": 50,
+    }
+    return f"({POPUP_WATCH_JS})({json.dumps(config, ensure_ascii=False)})"
+
+
+def _on_event(source: dict, event: dict) -> None:
+    # utils.common 이 이 모듈을 불러오므로 실행 시점에 가져온다
+    from .common import log
+
+    # 상태는 이벤트가 온 페이지에만 남긴다 (여러 점포가 한 프로세스에서 돈다)
+    page = source.get("page")
+    if page is None:
+        return
+    if event["type"] == "dismissed":
+        setattr(page, "_popups_dismissed", getattr(page, "_popups_dismissed", 0) + 1)
+        setattr(page, "_popup_watch_seen", True)
+        log(f"🧹 팝업 자동 닫기: {event['rule']} '{event.get('title') or event.get('id')}'")
+        return
+    if event["type"] != "state":
+        return
+    # 프레임마다 따로 보고하므로 프레임별로 두고 페이지 상태는 합집합으로 정한다
+    frames = getattr(page, "_popup_watch_frames", None)
+    if frames is None:
+        frames = {}
+        setattr(page, "_popup_watch_frames", frames)
+    frames[source.get("frame")] = event["open"]
+    for frame in [f for f in frames if f is not None and f.is_detached()]:
+        del frames[frame]
+    open_popups = [title for titles in frames.values() for title in titles]
+    setattr(page, "_popup_watch_open", open_popups)
+    if open_popups:
+        setattr(page, "_popup_watch_seen", True)
+        if event["open"]:
+            log_open = ", ".join(open_popups)
+            log(f"🔔 열린 팝업: {log_open}")
+        # 처리 완료 후 다시 뜬 팝업은 추출을 막는다
+        if getattr(page, "_popups_handled", None):
+            setattr(page, "_popups_handled", False)
+    elif getattr(page, "_popup_watch_seen", False):
+        setattr(page, "_popups_handled", True)
+
+
+def watching(page) -> bool:
+    return bool(getattr(page, "_popup_watch", False) or getattr(page.context, "_popup_watch", False))
+
+
+def watch_popups(target, rules: list[dict] | None = None) -> None:
+    """Install the watcher on a sync API ``Page`` or ``BrowserContext``.
+
+    Takes effect from the next navigation. Does nothing when disabled by
+    :func:`configure_popup_watch` or already installed.
+    """
+    if not _enabled or getattr(target, "_popup_watch", False):
+        return
+    target.expose_binding("__popupEvent", _on_event)
+    target.add_init_script(watch_script(rules))
+    setattr(target, "_popup_watch", True)
+
+
+async def watch_popups_async(target, rules: list[dict] | None = None) -> None:
+    """Async API counterpart of :func:`watch_popups`."""
+    if not _enabled or getattr(target, "_popup_watch", False):
+        return
+    await target.expose_binding("__popupEvent", _on_event)
+    await target.add_init_script(watch_script(rules))
+    setattr(target, "_popup_watch", True)
+
+
+_SETTLED_JS = "(quietMs) => window.__popupWatch && window.__popupWatch.settled(quietMs)"
+
+
+def wait_for_popups_settled(page, timeout: int = 5000, quiet_ms: int = 300) -> list[str] | None:
+    """Wait until the DOM has been quiet for ``quiet_ms`` and return the open popups.
+
+    Returns ``None`` when the page is not watched or does not settle in time.
+    """
+    if not watching(page):
+        return None
+    try:
+        handle = page.wait_for_function(_SETTLED_JS, arg=quiet_ms, timeout=timeout)
+        return handle.json_value()["open"]
+    except Exception:
+        return None
+
+
+async def wait_for_popups_settled_async(page, timeout: int = 5000, quiet_ms: int = 300) -> list[str] | None:
+    """Async API counterpart of :func:`wait_for_popups_settled`."""
+    if not watching(page):
+        return None
+    try:
+        handle = await page.wait_for_function(_SETTLED_JS, arg=quiet_ms, timeout=timeout)
+        return (await handle.json_value())["open"]
+    except Exception:
+        return None
@@ -0,0 +1,227 @@
+"""Route policy that aborts requests the extraction does not need.
+
+Scraping only needs the Nexacro runtime, the form definitions and the
+transaction XHRs; banners, images, fonts and notice content are dropped.
+Rules come from ``runtime_config["request_policy"]``:
+
+- ``allow_patterns``: URL globs that are never blocked (checked first)
+- ``block_patterns``: URL globs that are always blocked
+- ``block_types``: Playwright resource types blocked otherwise
+
+The policy is off unless ``enabled`` is set, and a config without ``mode``
+only observes: popup close images and the visibility checks depend on
+images loading, so blocking is an explicit opt-in. In ``observe`` mode
+nothing is blocked; the requests that would have been are counted with
+their real sizes. Sizes are remembered per URL in
+``SIZES_PATH`` so that later ``block`` runs can estimate the bytes saved.
+Routing disables Chromium's HTTP cache for the context; an
+:class:`~utils.asset_cache.AssetCache` attached to the policy serves the
+static deploy files from disk instead.
+"""
+
+import fnmatch
+import json
+from pathlib import Path
+
+from .asset_cache import AssetCache, asset_cache_from_config
+from .common import log
+
+SIZES_PATH = Path(__file__).resolve().parent.parent / "instructions" / "resource_sizes.json"
+
+BLOCK = "block"
+OBSERVE = "observe"
+
+DEFAULT_BLOCK_TYPES = ["image", "media", "font"]
+
+
+def _content_length(headers: dict) -> int | None:
+    try:
+        return int(headers.get("content-length", ""))
+    except ValueError:
+        return None
+
+
+class RequestPolicy:
+    """Allow/deny decision plus per-run counters for one or more contexts.
+
+    One instance may be installed on several contexts (e.g. every store of
+    a multi-store run); :meth:`report` then covers all of them. Allowed
+    requests fall back to ``asset_cache`` when one is given.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: str = BLOCK,
+        block_types: list[str] | None = None,
+        block_patterns: list[str] | None = None,
+        allow_patterns: list[str] | None = None,
+        sizes_path: Path | None = SIZES_PATH,
+        asset_cache: AssetCache | None = None,
+    ):
+        self.mode = mode
+        self.asset_cache = asset_cache
+        self.block_types = set(DEFAULT_BLOCK_TYPES if block_types is None else block_types)
+        self.block_patterns = list(block_patterns or [])
+        self.allow_patterns = list(allow_patterns or [])
+        self.sizes_path = sizes_path
+        self.sizes: dict[str, int] = {}
+        if sizes_path is not None and Path(sizes_path).exists():
+            try:
+                self.sizes = json.loads(Path(sizes_path).read_text(encoding="utf-8"))
+            except Exception as e:
+                log(f"⚠️ 리소스 크기 기록 로드 실패: {e}")
+        self._would_block: set[str] = set()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.blocked = 0
+        self.blocked_by_type: dict[str, int] = {}
+        self.bytes_loaded = 0
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if any(fnmatch.fnmatchcase(url, p) for p in self.allow_patterns):
+            return False
+        if any(fnmatch.fnmatchcase(url, p) for p in self.block_patterns):
+            return True
+        return resource_type in self.block_types
+
+    def _decide(self, request) -> bool:
+        """Count ``request`` and return whether it must be aborted."""
+        self.requests += 1
+        if not self.should_block(request.resource_type, request.url):
+            return False
+        self.blocked += 1
+        kind = request.resource_type
+        self.blocked_by_type[kind] = self.blocked_by_type.get(kind, 0) + 1
+        if self.mode == OBSERVE:
+            # 실제 크기는 응답에서 더한다
+            self._would_block.add(request.url)
+            return False
+        size = self.sizes.get(request.url)
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+        return True
+
+    def _on_response(self, response) -> None:
+        size = _content_length(response.headers)
+        url = response.url
+        if size is None:
+            if url in self._would_block:
+                self.unknown_size += 1
+            return
+        if url in self._would_block or self.should_block(response.request.resource_type, url):
+            self.sizes[url] = size
+        if url in self._would_block:
+            self.bytes_saved += size
+        else:
+            self.bytes_loaded += size
+
+    def install(self, target) -> None:
+        """Route every request of a sync API ``BrowserContext`` or ``Page``."""
+
+        def _handle(route) -> None:
+            if self._decide(route.request):
+                route.abort()
+            else:
+                route.fallback()
+
+        # 나중에 등록한 핸들러가 먼저 실행되므로 캐시를 먼저 등록한다
+        if self.asset_cache is not None:
+            self.asset_cache.install(target)
+        target.route("**/*", _handle)
+        target.on("response", self._on_response)
+        setattr(target, "_request_policy", self)
+
+    async def install_async(self, target) -> None:
+        """Async API counterpart of :meth:`install`."""
+
+        async def _handle(route) -> None:
+            if self._decide(route.request):
+                await route.abort()
+            else:
+                await route.fallback()
+
+        if self.asset_cache is not None:
+            await self.asset_cache.install_async(target)
+        await target.route("**/*", _handle)
+        target.on("response", self._on_response)
+        setattr(target, "_request_policy", self)
+
+    def report(self, *, reset: bool = False) -> dict:
+        """Log and return the counters; ``reset`` starts a new period."""
+        result = {
+            "mode": self.mode,
+            "requests": self.requests,
+            "blocked": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "bytes_loaded": self.bytes_loaded,
+            "bytes_saved": self.bytes_saved,
+            "unknown_size": self.unknown_size,
+        }
+        if self.asset_cache is not None:
+            result["asset_cache"] = self.asset_cache.stats()
+        verb = "차단 대상" if self.mode == OBSERVE else "차단"
+        by_type = ", ".join(f"{k} {v}" for k, v in sorted(self.blocked_by_type.items()))
+        log(
+            f"🚫 요청 {self.requests}건 중 {self.blocked}건 {verb}"
+            + (f" ({by_type})" if by_type else "")
+            + f", 절감 {self.bytes_saved / 1024:.1f} KB"
+            + (f" (크기 미상 {self.unknown_size}건)" if self.unknown_size else "")
+        )
+        self.save_sizes()
+        if self.asset_cache is not None:
+            cache = result["asset_cache"]
+            log(
+                f"💾 정적 파일 캐시: 적중 {cache['hits']}건, 재검증 {cache['revalidated']}건, "
+                f"다운로드 {cache['misses']}건, 디스크 {cache['bytes_from_disk'] / 1024:.1f} KB"
+            )
+            self.asset_cache.save()
+        if reset:
+            self.reset()
+            if self.asset_cache is not None:
+                self.asset_cache.reset()
+        return result
+
+    def save_sizes(self) -> None:
+        if self.sizes_path is None or not self.sizes:
+            return
+        path = Path(self.sizes_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.sizes, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+
+def request_policy_from_config(cfg: dict) -> RequestPolicy | None:
+    """Build the policy from ``runtime_config["request_policy"]`` and ``["asset_cache"]``.
+
+    Returns ``None`` when both are disabled.
+    """
+    options = cfg.get("request_policy", {})
+    asset_cache = asset_cache_from_config(cfg)
+    if not options.get("enabled", False):
+        if asset_cache is None:
+            return None
+        # 차단 규칙 없이 정적 파일 캐시만 사용
+        return RequestPolicy(block_types=[], asset_cache=asset_cache)
+    return RequestPolicy(
+        mode=options.get("mode", OBSERVE),
+        block_types=options.get("block_types"),
+        block_patterns=options.get("block_patterns"),
+        allow_patterns=options.get("allow_patterns"),
+        asset_cache=asset_cache,
+    )
+
+
+def context_policy(target) -> RequestPolicy | None:
+    """Return the policy installed on ``target`` or its context, if any."""
+    policy = getattr(target, "_request_policy", None)
+    if policy is None and hasattr(target, "context"):
+        policy = getattr(target.context, "_request_policy", None)
+    return policy
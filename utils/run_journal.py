@@ -0,0 +1,157 @@
+"""Structured run journal used to resume a failed extraction.
+
+The journal keeps the current 진행단계 (progress step) and, per task, the
+queried date windows with the categories already completed in each, so a
+rerun after a failure can skip them and append to the same outputs.
+
+Every writer of one journal file must share one instance, because
+:meth:`RunJournal.save` writes the whole document: get it from
+:func:`run_journal` instead of constructing :class:`RunJournal` directly.
+"""
+
+import datetime
+import json
+import threading
+from pathlib import Path
+from typing import Callable
+
+from .common import log
+
+JOURNAL_PATH = Path(__file__).resolve().parent.parent / "instructions" / "run_journal.json"
+
+# 작업 상태 값
+RUNNING = "running"
+FAILED = "failed"
+DONE = "done"
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+class RunJournal:
+    """JSON backed journal of the last run and its tasks.
+
+    Layout::
+
+        {"stage": ..., "failure": ..., "updated": ...,
+         "tasks": {name: {"status": ..., "attempts": n, "error": ...,
+                          "windows": [{"start": ..., "end": ..., "completed": [...]}]}}}
+    """
+
+    def __init__(self, path: Path = JOURNAL_PATH):
+        self.path = Path(path)
+        # 점포 실행은 스레드에서 돌 수 있어 변경과 저장을 한 번에 묶는다
+        self._lock = threading.RLock()
+        self.data: dict = {"stage": None, "failure": None, "tasks": {}}
+        if self.path.exists():
+            try:
+                self.data.update(json.loads(self.path.read_text(encoding="utf-8")))
+            except Exception as e:
+                log(f"⚠️ 실행 저널 로드 실패, 새로 시작합니다: {e}")
+
+    def save(self) -> None:
+        with self._lock:
+            self.data["updated"] = _now()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def set_stage(self, step: str, failure: str | None = None) -> None:
+        """Record the current 진행단계 and, optionally, the last failure."""
+        with self._lock:
+            self.data["stage"] = step
+            if failure is not None:
+                self.data["failure"] = failure
+            self.save()
+
+    def task(self, name: str) -> dict | None:
+        return self.data["tasks"].get(name)
+
+    def is_incomplete(self, name: str) -> bool:
+        """Return ``True`` if ``name`` was started but never finished."""
+        entry = self.task(name)
+        return entry is not None and entry["status"] != DONE
+
+    def begin(self, name: str, windows: list[tuple]) -> None:
+        """Start a fresh task over ``windows`` (``(start, end, ...)`` tuples)."""
+        with self._lock:
+            self.data["tasks"][name] = {
+                "status": RUNNING,
+                "attempts": 1,
+                "started": _now(),
+                "error": None,
+                "windows": [{"start": w[0], "end": w[1], "completed": []} for w in windows],
+            }
+            self.save()
+
+    def resume(self, name: str, windows: list[tuple] | None = None) -> list[tuple]:
+        """Reopen an incomplete task and return the windows still to run.
+
+        Without ``windows`` the windows recorded by :meth:`begin` are reused,
+        so the same outputs are targeted even on a later day. Each window's
+        filter is wrapped to skip the categories already completed in it.
+        """
+        with self._lock:
+            entry = self.data["tasks"][name]
+            entry["status"] = RUNNING
+            entry["attempts"] += 1
+            entry["error"] = None
+            if windows is None:
+                windows = [(w["start"], w["end"], None) for w in entry["windows"]]
+            recorded = {(w["start"], w["end"]): w for w in entry["windows"]}
+            result = []
+            for start, end, accept in windows:
+                window = recorded.setdefault((start, end), {"start": start, "end": end, "completed": []})
+                done = set(window["completed"])
+                result.append((start, end, self._skip(done, accept)))
+            entry["windows"] = list(recorded.values())
+            self.save()
+        skipped = sum(len(w["completed"]) for w in entry["windows"])
+        log(f"♻️ 이전 실행 재개 ({entry['attempts']}회차): 완료된 중분류 {skipped}건 건너뜀")
+        return result
+
+    @staticmethod
+    def _skip(done: set[str], accept: Callable[[str], bool] | None) -> Callable[[str], bool]:
+        if accept is None:
+            return lambda code: code not in done
+        return lambda code: code not in done and accept(code)
+
+    def complete(self, name: str, start: str, end: str, category: str) -> None:
+        """Mark ``category`` as written for the ``start``/``end`` window."""
+        with self._lock:
+            for window in self.data["tasks"][name]["windows"]:
+                if window["start"] == start and window["end"] == end:
+                    if category not in window["completed"]:
+                        window["completed"].append(category)
+                    break
+            self.save()
+
+    def fail(self, name: str, error: str) -> None:
+        with self._lock:
+            entry = self.data["tasks"][name]
+            entry["status"] = FAILED
+            entry["error"] = error
+            self.data["failure"] = f"{name}: {error}"
+            self.save()
+
+    def finish(self, name: str) -> None:
+        with self._lock:
+            entry = self.data["tasks"][name]
+            entry["status"] = DONE
+            entry["finished"] = _now()
+            self.save()
+
+
+_journals: dict[Path, RunJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def run_journal(path: Path = JOURNAL_PATH) -> RunJournal:
+    """Shared :class:`RunJournal` of ``path``, loaded on first use."""
+    key = Path(path).resolve()
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = RunJournal(key)
+        return _journals[key]
@@ -0,0 +1,58 @@
+"""Per-account cache of Playwright ``storage_state`` snapshots.
+
+A snapshot is written after a successful login and reused by later runs
+until it is older than ``max_age_hours`` or a probe finds it expired.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from .common import log
+
+SESSION_DIR = Path(__file__).resolve().parent.parent / "sessions"
+
+_UNSAFE = re.compile(r"[^\w.-]")
+
+
+class SessionCache:
+    """Directory of ``<account>.json`` storage states."""
+
+    def __init__(self, directory: Path = SESSION_DIR, max_age_hours: float = 8):
+        self.directory = Path(directory)
+        self.max_age = max_age_hours * 3600
+
+    def path(self, account: str) -> Path:
+        return self.directory / (_UNSAFE.sub("_", account) + ".json")
+
+    def load(self, account: str) -> dict | None:
+        """Return the saved state of ``account`` unless missing or too old."""
+        path = self.path(account)
+        if not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > self.max_age:
+            log(f"⌛ 저장된 세션이 {self.max_age / 3600:g}시간을 넘어 폐기합니다: {account}")
+            self.clear(account)
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            log(f"⚠️ 세션 파일 로드 실패: {e}")
+            return None
+
+    def save(self, account: str, state: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(account)
+        tmp = path.with_suffix(".tmp")
+        # 쿠키가 담겨 있으므로 처음부터 소유자만 읽을 수 있는 파일로 만든다
+        # (남아 있던 tmp 는 권한이 다를 수 있어 지운다)
+        tmp.unlink(missing_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        tmp.replace(path)
+
+    def clear(self, account: str) -> None:
+        self.path(account).unlink(missing_ok=True)
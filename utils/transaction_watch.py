@@ -0,0 +1,299 @@
+"""Init script that counts the portal's transactions (XHR and fetch).
+
+``wait_for_load_state("networkidle")`` either returns before the search
+dataset has arrived, or waits out its 500 ms idle window plus any keepalive
+traffic. :data:`TRANSACTION_WATCH_JS` wraps ``XMLHttpRequest`` and
+``fetch`` in every frame instead and keeps ``window.__txWatch``:
+
+- ``started`` / ``finished``: transactions since the page loaded
+- ``inflight``: transactions still waiting for their response
+- ``service``: the ``svcID`` of the Nexacro ``transaction()`` call being
+  made, once ``nexacro.Form`` exists (used to label the requests)
+
+Every finished transaction is reported to Python through the
+``__transactionEvent`` binding as ``{"type": "finished", "seq", "service",
+"url", "status", "ms", "inflight"}``. :func:`on_transaction` registers a
+callback for these events.
+
+Waits take a :func:`transaction_mark` before the click and then call
+:func:`wait_for_transactions`, which returns as soon as a transaction started
+after the mark has finished and nothing else is in flight. Requests whose URL
+contains an ``ignore`` pattern (long polling, keepalive) are not counted.
+Pages without the watcher, ``enabled: false`` and the legacy wait mode fall
+back to ``networkidle``.
+"""
+
+import json
+import time
+
+from .common import log
+from .wait_engine import legacy_mode, record_wait, timeout_for
+
+DEFAULT_OPTIONS = {
+    "enabled": True,
+    # 마지막 응답 뒤 콜백이 이어서 보내는 트랜잭션을 기다리는 시간
+    "quiet_ms": 50,
+    # 클릭이 트랜잭션을 일으키지 않았다고 보는 시간
+    "start_ms": 1000,
+    "ignore": [],
+}
+
+TRANSACTION_WATCH_JS = r"""
+(config) => {
+    if (window.__txWatch) return;
+    const state = {
+        id: Math.random().toString(36).slice(2),
+        started: 0, finished: 0, inflight: 0,
+        lastChange: Date.now(), service: null,
+    };
+    window.__txWatch = state;
+
+    const ignored = (url) => config.ignore.some((p) => String(url).includes(p));
+    const report = (event) => {
+        if (window.__transactionEvent) window.__transactionEvent(event).catch(() => {});
+    };
+    const begin = (url) => {
+        state.started += 1;
+        state.inflight += 1;
+        state.lastChange = Date.now();
+        return {seq: state.started, url: String(url), service: state.service, t0: Date.now(), done: false};
+    };
+    const end = (tx, status) => {
+        if (tx.done) return;
+        tx.done = true;
+        state.finished += 1;
+        state.inflight = Math.max(0, state.inflight - 1);
+        state.lastChange = Date.now();
+        report({type: 'finished', seq: tx.seq, service: tx.service, url: tx.url,
+                status, ms: Date.now() - tx.t0, inflight: state.inflight});
+    };
+
+    // loadend 는 onreadystatechange 콜백(데이터셋 반영) 다음에 온다
+    const XHR = window.XMLHttpRequest;
+    if (XHR) {
+        const open = XHR.prototype.open;
+        const send = XHR.prototype.send;
+        XHR.prototype.open = function (method, url, ...rest) {
+            this.__txUrl = url;
+            return open.call(this, method, url, ...rest);
+        };
+        XHR.prototype.send = function (...args) {
+            if (!ignored(this.__txUrl)) {
+                const tx = begin(this.__txUrl);
+                this.addEventListener('loadend', () => end(tx, this.status));
+            }
+            return send.apply(this, args);
+        };
+    }
+
+    // fetch 는 헤더만 받아도 끝나므로 본문까지 받은 뒤에 완료로 센다
+    if (window.fetch) {
+        const fetch_ = window.fetch;
+        window.fetch = function (input, init) {
+            const url = typeof input === 'string' ? input : (input && input.url) || String(input);
+            if (ignored(url)) return fetch_.apply(this, arguments);
+            const tx = begin(url);
+            return fetch_.apply(this, arguments).then(
+                (res) => {
+                    res.clone().arrayBuffer().then(() => end(tx, res.status), () => end(tx, res.status));
+                    return res;
+                },
+                (err) => {
+                    end(tx, 0);
+                    throw err;
+                },
+            );
+        };
+    }
+
+    // Nexacro 가 올라오면 transaction() 의 svcID 로 요청에 이름을 붙인다
+    let tries = 0;
+    const hookNexacro = () => {
+        const form = window.nexacro && window.nexacro.Form;
+        if (!form || !form.prototype.transaction) {
+            if (++tries < 150) setTimeout(hookNexacro, 200);
+            return;
+        }
+        const transaction = form.prototype.transaction;
+        form.prototype.transaction = function (svcID, ...rest) {
+            const prev = state.service;
+            state.service = svcID;
+            try {
+                return transaction.call(this, svcID, ...rest);
+            } finally {
+                state.service = prev;
+            }
+        };
+    };
+    hookNexacro();
+}
+"""
+
+_MARK_JS = "() => window.__txWatch ? {id: window.__txWatch.id, seq: window.__txWatch.started, at: Date.now()} : null"
+
+# 새로 로드된 페이지(id 가 다름)는 표시 이후의 트랜잭션만 있는 것으로 본다
+_DONE_JS = r"""
+(mark) => {
+    const s = window.__txWatch;
+    if (!s) return false;
+    const quiet = s.inflight === 0 && Date.now() - s.lastChange >= mark.quietMs;
+    if (!quiet) return false;
+    const started = s.id === mark.id ? s.started - mark.seq : s.started;
+    if (started > 0) return {started};
+    return Date.now() - mark.at >= mark.startMs ? {started: 0} : false;
+}
+"""
+
+_options = dict(DEFAULT_OPTIONS)
+
+
+def configure_transaction_watch(cfg: dict) -> None:
+    """Apply ``runtime_config["transaction_watch"]``."""
+    _options.clear()
+    _options.update(DEFAULT_OPTIONS, **cfg.get("transaction_watch", {}))
+
+
+def watch_script(ignore: list[str] | None = None) -> str:
+    config = {"ignore": _options["ignore"] if ignore is None else ignore}
+    return f"({TRANSACTION_WATCH_JS})({json.dumps(config, ensure_ascii=False)})"
+
+
+def _on_event(source: dict, event: dict) -> None:
+    page = source.get("page")
+    if event.get("type") != "finished" or page is None:
+        return
+    setattr(page, "_transactions_finished", getattr(page, "_transactions_finished", 0) + 1)
+    if event.get("status", 200) >= 400 or event.get("status") == 0:
+        log(f"⚠️ 트랜잭션 실패: {event.get('service') or event['url']} (status {event.get('status')})")
+    for callback in getattr(page, "_transaction_listeners", []):
+        try:
+            callback(event)
+        except Exception as e:
+            log(f"⚠️ 트랜잭션 콜백 오류: {e}")
+
+
+def on_transaction(page, callback) -> None:
+    """Call ``callback(event)`` for every transaction finished on ``page``."""
+    listeners = getattr(page, "_transaction_listeners", None)
+    if listeners is None:
+        listeners = []
+        setattr(page, "_transaction_listeners", listeners)
+    listeners.append(callback)
+
+
+def watching_transactions(page) -> bool:
+    return bool(getattr(page, "_transaction_watch", False) or getattr(page.context, "_transaction_watch", False))
+
+
+def watch_transactions(target, ignore: list[str] | None = None) -> None:
+    """Install the counter on a sync API ``Page`` or ``BrowserContext``.
+
+    Takes effect from the next navigation. Does nothing when disabled by
+    :func:`configure_transaction_watch` or already installed.
+    """
+    if not _options["enabled"] or getattr(target, "_transaction_watch", False):
+        return
+    target.expose_binding("__transactionEvent", _on_event)
+    target.add_init_script(watch_script(ignore))
+    setattr(target, "_transaction_watch", True)
+
+
+async def watch_transactions_async(target, ignore: list[str] | None = None) -> None:
+    """Async API counterpart of :func:`watch_transactions`."""
+    if not _options["enabled"] or getattr(target, "_transaction_watch", False):
+        return
+    await target.expose_binding("__transactionEvent", _on_event)
+    await target.add_init_script(watch_script(ignore))
+    setattr(target, "_transaction_watch", True)
+
+
+def _usable(page) -> bool:
+    return _options["enabled"] and not legacy_mode() and watching_transactions(page)
+
+
+def _done_arg(mark: dict) -> dict:
+    return {**mark, "quietMs": _options["quiet_ms"], "startMs": _options["start_ms"]}
+
+
+def transaction_mark(page) -> dict | None:
+    """Remember the transaction counter of a sync API ``page`` before a click.
+
+    Returns ``None`` when the page is not watched.
+    """
+    if not _usable(page):
+        return None
+    try:
+        return page.evaluate(_MARK_JS)
+    except Exception:
+        return None
+
+
+async def transaction_mark_async(page) -> dict | None:
+    """Async API counterpart of :func:`transaction_mark`."""
+    if not _usable(page):
+        return None
+    try:
+        return await page.evaluate(_MARK_JS)
+    except Exception:
+        return None
+
+
+def wait_for_transactions(page, mark: dict | None, step: str, timeout: float = 30000) -> int | None:
+    """Wait until the transactions started after ``mark`` have finished.
+
+    Parameters
+    ----------
+    page : Page
+        Sync API page the click happened on.
+    mark : dict | None
+        :func:`transaction_mark` taken before the click; ``None`` waits for
+        ``networkidle`` instead.
+    step : str
+        Wait engine step; the learned timeout and the samples use
+        ``"<step>_tx"``.
+    timeout : float, optional
+        Timeout in ms until the step has enough samples.
+
+    Returns
+    -------
+    int | None
+        Number of transactions that ran, ``None`` after the fallback.
+    """
+    step = f"{step}_tx"
+    start = time.perf_counter()
+    if mark is None:
+        page.wait_for_load_state("networkidle")
+        record_wait(step, (time.perf_counter() - start) * 1000)
+        return None
+    try:
+        handle = page.wait_for_function(_DONE_JS, arg=_done_arg(mark), timeout=timeout_for(step, timeout), polling=20)
+        started = handle.json_value()["started"]
+    except Exception as e:
+        log(f"⚠️ 트랜잭션 완료 대기 실패({step}), networkidle 로 대체: {e}")
+        page.wait_for_load_state("networkidle")
+        record_wait(step, (time.perf_counter() - start) * 1000, timed_out=True)
+        return None
+    record_wait(step, (time.perf_counter() - start) * 1000)
+    return started
+
+
+async def wait_for_transactions_async(page, mark: dict | None, step: str, timeout: float = 30000) -> int | None:
+    """Async API counterpart of :func:`wait_for_transactions`."""
+    step = f"{step}_tx"
+    start = time.perf_counter()
+    if mark is None:
+        await page.wait_for_load_state("networkidle")
+        record_wait(step, (time.perf_counter() - start) * 1000)
+        return None
+    try:
+        handle = await page.wait_for_function(
+            _DONE_JS, arg=_done_arg(mark), timeout=timeout_for(step, timeout), polling=20
+        )
+        started = (await handle.json_value())["started"]
+    except Exception as e:
+        log(f"⚠️ 트랜잭션 완료 대기 실패({step}), networkidle 로 대체: {e}")
+        await page.wait_for_load_state("networkidle")
+        record_wait(step, (time.perf_counter() - start) * 1000, timed_out=True)
+        return None
+    record_wait(step, (time.perf_counter() - start) * 1000)
+    return started
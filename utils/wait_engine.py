@@ -0,0 +1,256 @@
+"""Condition-based waits that learn how long each step really takes.
+
+``wait(page)`` used to sleep ``DEFAULT_WAIT_MS`` before and after almost
+every click and fill, so one category cost seconds of pure sleep. The wait
+engine replaces the sleep with concrete conditions:
+
+- :func:`settle`: returns as soon as the DOM has been free of mutations for
+  ``quiet_ms``. It never waits longer than the old fixed pause.
+- :func:`wait_for_element`: a locator state (``visible``, ``hidden``, ...)
+
+Every wait is timed per *step* (``"date_input"``, ``"menu"``, ...). Once a
+step has ``MIN_SAMPLES`` samples, its timeout becomes the learned
+``percentile`` × ``margin``, clamped to ``min_timeout_ms`` and
+``max_timeout_ms``. The samples are kept in ``WAIT_STATS_PATH`` across runs.
+:func:`wait_report` logs, per run, the time spent waiting against the time
+spent working.
+
+``mode: "legacy"`` in ``runtime_config["waits"]`` (or ``WAIT_MODE=legacy``)
+brings back the fixed ``page.wait_for_timeout`` for debugging.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from .common import log
+
+WAIT_STATS_PATH = Path(__file__).resolve().parent.parent / "instructions" / "wait_stats.json"
+
+ADAPTIVE = "adaptive"
+LEGACY = "legacy"
+
+# 단계별로 보관하는 최근 표본 수와 학습값을 쓰기 시작하는 최소 표본 수
+MAX_SAMPLES = 200
+MIN_SAMPLES = 5
+
+DEFAULT_OPTIONS = {
+    "mode": ADAPTIVE,
+    "quiet_ms": 150,
+    "percentile": 0.95,
+    "margin": 3.0,
+    "min_timeout_ms": 1000,
+    "max_timeout_ms": 15000,
+}
+
+# 첫 호출 때 관찰자를 붙이고 마지막 DOM 변경 이후 경과 시간을 본다
+_QUIET_JS = r"""
+(quietMs) => {
+    let state = window.__waitQuiet;
+    if (!state) {
+        state = window.__waitQuiet = {last: Date.now()};
+        new MutationObserver(() => { state.last = Date.now(); }).observe(document, {
+            childList: true, subtree: true, attributes: true, characterData: true,
+        });
+        return false;
+    }
+    return Date.now() - state.last >= quietMs;
+}
+"""
+
+
+class WaitStats:
+    """Per-step latency samples plus the wait time of the current run."""
+
+    def __init__(self, path: Path | None = WAIT_STATS_PATH):
+        self.path = path
+        self.samples: dict[str, deque] = {}
+        if path is not None and Path(path).exists():
+            try:
+                data = json.loads(Path(path).read_text(encoding="utf-8"))
+                self.samples = {k: deque(v, maxlen=MAX_SAMPLES) for k, v in data.items()}
+            except Exception as e:
+                log(f"⚠️ 대기 시간 기록 로드 실패: {e}")
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.started = time.perf_counter()
+        self.run: dict[str, dict] = {}
+
+    def record(self, step: str, ms: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            self.samples.setdefault(step, deque(maxlen=MAX_SAMPLES)).append(round(ms, 1))
+            entry = self.run.setdefault(step, {"count": 0, "ms": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["ms"] += ms
+            entry["timeouts"] += timed_out
+
+    def percentile(self, step: str, q: float) -> float | None:
+        values = sorted(self.samples.get(step, ()))
+        if len(values) < MIN_SAMPLES:
+            return None
+        return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps({k: list(v) for k, v in self.samples.items()}, ensure_ascii=False)
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(path)
+
+
+_options = dict(DEFAULT_OPTIONS)
+_stats = WaitStats()
+
+
+def configure_waits(cfg: dict) -> None:
+    """Apply ``runtime_config["waits"]``; ``WAIT_MODE`` overrides the mode."""
+    _options.clear()
+    _options.update(DEFAULT_OPTIONS, **cfg.get("waits", {}))
+    if os.getenv("WAIT_MODE"):
+        _options["mode"] = os.environ["WAIT_MODE"]
+    _stats.reset()
+
+
+def reset_waits() -> None:
+    """Start a new report period, e.g. at the start of a daemon job."""
+    _stats.reset()
+
+
+def record_wait(step: str, ms: float, *, timed_out: bool = False) -> None:
+    """Add a wait measured elsewhere (e.g. a transaction wait) to the stats."""
+    _stats.record(step, ms, timed_out=timed_out)
+
+
+def legacy_mode() -> bool:
+    return _options["mode"] == LEGACY
+
+
+def timeout_for(step: str, default_ms: float, floor_ms: float | None = None) -> float:
+    """Learned timeout of ``step`` in ms, or ``default_ms`` without enough samples.
+
+    The learned value is clamped to ``floor_ms`` (``min_timeout_ms`` by
+    default) and ``max_timeout_ms``.
+    """
+    learned = _stats.percentile(step, _options["percentile"])
+    if learned is None:
+        return default_ms
+    floor_ms = _options["min_timeout_ms"] if floor_ms is None else floor_ms
+    return min(max(learned * _options["margin"], floor_ms), _options["max_timeout_ms"])
+
+
+def _quiet_timeout(step: str, ms: float) -> float:
+    # 조용해지는 데 걸린 시간을 학습하되 고정 대기보다 길어지지는 않게 한다
+    return min(timeout_for(step, ms, floor_ms=_options["quiet_ms"] * 2), ms)
+
+
+def settle(page, ms: int, step: str | None = None) -> None:
+    """Wait until the DOM of a sync API ``page`` is quiet, at most ``ms``."""
+    if ms <= 0:
+        return
+    step = step or "wait"
+    start = time.perf_counter()
+    if legacy_mode():
+        page.wait_for_timeout(ms)
+        _stats.record(step, (time.perf_counter() - start) * 1000)
+        return
+    timed_out = False
+    try:
+        page.wait_for_function(
+            _QUIET_JS, arg=_options["quiet_ms"], timeout=_quiet_timeout(step, ms), polling=50
+        )
+    except Exception:
+        # 계속 바뀌는 화면(시계, 애니메이션)은 제한 시간까지만 기다린다
+        timed_out = True
+    _stats.record(step, (time.perf_counter() - start) * 1000, timed_out=timed_out)
+
+
+async def settle_async(page, ms: int, step: str | None = None) -> None:
+    """Async API counterpart of :func:`settle`."""
+    if ms <= 0:
+        return
+    step = step or "wait"
+    start = time.perf_counter()
+    if legacy_mode():
+        await page.wait_for_timeout(ms)
+        _stats.record(step, (time.perf_counter() - start) * 1000)
+        return
+    timed_out = False
+    try:
+        await page.wait_for_function(
+            _QUIET_JS, arg=_options["quiet_ms"], timeout=_quiet_timeout(step, ms), polling=50
+        )
+    except Exception:
+        timed_out = True
+    _stats.record(step, (time.perf_counter() - start) * 1000, timed_out=timed_out)
+
+
+def wait_for_element(locator, step: str, state: str = "visible", timeout: float = 10000) -> None:
+    """``locator.wait_for(state=...)`` with the learned timeout of ``step``.
+
+    Raises the Playwright timeout error like ``wait_for`` does.
+    """
+    start = time.perf_counter()
+    try:
+        locator.wait_for(state=state, timeout=timeout_for(step, timeout))
+    except Exception:
+        _stats.record(step, (time.perf_counter() - start) * 1000, timed_out=True)
+        raise
+    _stats.record(step, (time.perf_counter() - start) * 1000)
+
+
+async def wait_for_element_async(locator, step: str, state: str = "visible", timeout: float = 10000) -> None:
+    """Async API counterpart of :func:`wait_for_element`."""
+    start = time.perf_counter()
+    try:
+        await locator.wait_for(state=state, timeout=timeout_for(step, timeout))
+    except Exception:
+        _stats.record(step, (time.perf_counter() - start) * 1000, timed_out=True)
+        raise
+    _stats.record(step, (time.perf_counter() - start) * 1000)
+
+
+def wait_report(*, reset: bool = True) -> dict:
+    """Log and return the waiting/working split since the last reset.
+
+    The learned samples are saved to ``WAIT_STATS_PATH``.
+    """
+    elapsed = time.perf_counter() - _stats.started
+    waiting = sum(entry["ms"] for entry in _stats.run.values()) / 1000
+    steps = {
+        step: {
+            "count": entry["count"],
+            "seconds": round(entry["ms"] / 1000, 3),
+            "timeouts": entry["timeouts"],
+            "p50_ms": _stats.percentile(step, 0.5),
+            "p95_ms": _stats.percentile(step, 0.95),
+        }
+        for step, entry in sorted(_stats.run.items(), key=lambda item: -item[1]["ms"])
+    }
+    result = {
+        "mode": _options["mode"],
+        "elapsed": round(elapsed, 3),
+        "waiting": round(waiting, 3),
+        "working": round(max(elapsed - waiting, 0.0), 3),
+        "steps": steps,
+    }
+    share = waiting / elapsed * 100 if elapsed else 0.0
+    log(f"⏱️ 대기 {waiting:.1f}s / 작업 {result['working']:.1f}s (대기 비율 {share:.0f}%, {_options['mode']})")
+    for step, entry in list(steps.items())[:5]:
+        log(
+            f"   {step}: {entry['count']}회 {entry['seconds']:.1f}s"
+            + (f", p95 {entry['p95_ms']:.0f}ms" if entry["p95_ms"] is not None else "")
+            + (f", 시간 초과 {entry['timeouts']}회" if entry["timeouts"] else "")
+        )
+    _stats.save()
+    if reset:
+        _stats.reset()
+    return result